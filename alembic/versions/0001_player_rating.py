@@ -0,0 +1,34 @@
+"""players.rating
+
+Revision ID: 0001_player_rating
+Revises:
+Create Date: 2026-10-18
+
+Depois do upgrade de um banco com partidas, recalcular os ratings:
+    python -m app.cli rebuild-ratings
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.constants import INITIAL_RATING
+
+# revision identifiers, used by Alembic.
+revision = "0001_player_rating"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Jogadores existentes começam no rating inicial; create_all não altera tabelas existentes
+    if "rating" not in {column["name"] for column in sa.inspect(op.get_bind()).get_columns("players")}:
+        op.add_column(
+            "players",
+            sa.Column("rating", sa.Float(), nullable=False, server_default=str(INITIAL_RATING)),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("players") as batch:
+        batch.drop_column("rating")
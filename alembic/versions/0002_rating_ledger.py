@@ -0,0 +1,55 @@
+"""rating_ledger and rating_checkpoints
+
+Revision ID: 0002_rating_ledger
+Revises: 0001_player_rating
+Create Date: 2026-10-18
+
+Depois do upgrade de um banco com partidas, preencher o ledger:
+    python -m app.cli rebuild-ratings
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0002_rating_ledger"
+down_revision = "0001_player_rating"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Importar o pacote app já cria as tabelas (init_db), possivelmente vazias
+    tables = sa.inspect(op.get_bind()).get_table_names()
+    if "rating_ledger" not in tables:
+        op.create_table(
+            "rating_ledger",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("match_id", sa.Integer(), sa.ForeignKey("matches.id"), nullable=False),
+            sa.Column("player_id", sa.Integer(), sa.ForeignKey("players.id"), nullable=False),
+            sa.Column("match_created_at", sa.DateTime(), nullable=False),
+            sa.Column("rating_before", sa.Float(), nullable=False),
+            sa.Column("rating_after", sa.Float(), nullable=False),
+        )
+        op.create_index("ix_rating_ledger_id", "rating_ledger", ["id"])
+        op.create_index("ix_rating_ledger_match_id", "rating_ledger", ["match_id"])
+        op.create_index(
+            "ix_rating_ledger_player_time", "rating_ledger", ["player_id", "match_created_at", "match_id"]
+        )
+        op.create_index("ix_rating_ledger_time", "rating_ledger", ["match_created_at", "match_id"])
+    if "rating_checkpoints" not in tables:
+        op.create_table(
+            "rating_checkpoints",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("match_id", sa.Integer(), nullable=False),
+            sa.Column("match_created_at", sa.DateTime(), nullable=False),
+            sa.Column("ratings", sa.JSON(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_rating_checkpoints_id", "rating_checkpoints", ["id"])
+        op.create_index("ix_rating_checkpoints_time", "rating_checkpoints", ["match_created_at", "match_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("rating_checkpoints")
+    op.drop_table("rating_ledger")
@@ -0,0 +1,47 @@
+"""leagues and matches.league_id
+
+Revision ID: 0003_leagues
+Revises: 0002_rating_ledger
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.constants import DEFAULT_RATING_SYSTEM
+
+# revision identifiers, used by Alembic.
+revision = "0003_leagues"
+down_revision = "0002_rating_ledger"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Importar o pacote app já cria a tabela nova (init_db), mas não altera matches
+    inspector = sa.inspect(op.get_bind())
+    if "leagues" not in inspector.get_table_names():
+        op.create_table(
+            "leagues",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(100), nullable=False, unique=True),
+            sa.Column(
+                "rating_system", sa.String(20), nullable=False, server_default=DEFAULT_RATING_SYSTEM
+            ),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_leagues_id", "leagues", ["id"])
+
+    if "league_id" not in {column["name"] for column in inspector.get_columns("matches")}:
+        with op.batch_alter_table("matches") as batch:
+            batch.add_column(sa.Column("league_id", sa.Integer(), nullable=True))
+            batch.create_foreign_key("fk_matches_league_id", "leagues", ["league_id"], ["id"])
+    op.create_index("ix_matches_league_id", "matches", ["league_id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_matches_league_id", table_name="matches", if_exists=True)
+    # DROP COLUMN também remove a chave estrangeira
+    with op.batch_alter_table("matches") as batch:
+        batch.drop_column("league_id")
+    op.drop_table("leagues")
@@ -0,0 +1,38 @@
+"""player_stats
+
+Revision ID: 0004_player_stats
+Revises: 0003_leagues
+Create Date: 2026-10-18
+
+Depois do upgrade de um banco com partidas, preencher as estatísticas:
+    python -m app.cli rebuild-stats
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0004_player_stats"
+down_revision = "0003_leagues"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Importar o pacote app já cria a tabela (init_db), possivelmente vazia
+    if "player_stats" not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            "player_stats",
+            sa.Column("player_id", sa.Integer(), sa.ForeignKey("players.id"), primary_key=True),
+            *[
+                sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+                for name in (
+                    "matches_played", "wins", "losses", "sets_won", "sets_lost", "points_won", "points_lost"
+                )
+            ],
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("player_stats")
@@ -0,0 +1,38 @@
+"""head_to_head
+
+Revision ID: 0005_head_to_head
+Revises: 0004_player_stats
+Create Date: 2026-10-18
+
+Depois do upgrade de um banco com partidas, preencher os confrontos diretos:
+    python -m app.cli rebuild-stats
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0005_head_to_head"
+down_revision = "0004_player_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Importar o pacote app já cria a tabela (init_db), possivelmente vazia
+    if "head_to_head" not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            "head_to_head",
+            sa.Column("player_low_id", sa.Integer(), sa.ForeignKey("players.id"), primary_key=True),
+            sa.Column("player_high_id", sa.Integer(), sa.ForeignKey("players.id"), primary_key=True),
+            *[
+                sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+                for name in ("matches_played", "low_wins", "high_wins", "low_sets", "high_sets")
+            ],
+            sa.Column("last_match_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("head_to_head")
@@ -0,0 +1,52 @@
+"""achievement_progress and player_achievements
+
+Revision ID: 0006_achievements
+Revises: 0005_head_to_head
+Create Date: 2026-10-18
+
+Depois do upgrade de um banco com partidas, preencher as conquistas:
+    python -m app.cli backfill-achievements
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0006_achievements"
+down_revision = "0005_head_to_head"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Importar o pacote app já cria as tabelas (init_db), possivelmente vazias
+    tables = sa.inspect(op.get_bind()).get_table_names()
+    if "achievement_progress" not in tables:
+        op.create_table(
+            "achievement_progress",
+            sa.Column("player_id", sa.Integer(), sa.ForeignKey("players.id"), primary_key=True),
+            *[
+                sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+                for name in ("matches_played", "current_streak", "best_streak", "tournaments_won")
+            ],
+            sa.Column("last_match_at", sa.DateTime(), nullable=True),
+            sa.Column("last_match_id", sa.Integer(), nullable=True),
+        )
+    if "player_achievements" not in tables:
+        op.create_table(
+            "player_achievements",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("player_id", sa.Integer(), sa.ForeignKey("players.id"), nullable=False),
+            sa.Column("achievement", sa.String(30), nullable=False),
+            sa.Column("level", sa.String(10), nullable=False),
+            sa.Column("match_id", sa.Integer(), nullable=True),
+            sa.Column("awarded_at", sa.DateTime(), nullable=False),
+            sa.UniqueConstraint("player_id", "achievement", "level", name="unique_player_achievement"),
+        )
+        op.create_index("ix_player_achievements_id", "player_achievements", ["id"])
+        op.create_index("ix_player_achievements_player_id", "player_achievements", ["player_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("player_achievements")
+    op.drop_table("achievement_progress")
@@ -0,0 +1,32 @@
+"""import_checkpoints
+
+Revision ID: 0007_import_checkpoints
+Revises: 0006_achievements
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0007_import_checkpoints"
+down_revision = "0006_achievements"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Importar o pacote app já cria a tabela (init_db), possivelmente vazia
+    if "import_checkpoints" not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            "import_checkpoints",
+            sa.Column("source", sa.String(512), primary_key=True),
+            sa.Column("line", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("imported", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("rejected", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("import_checkpoints")
@@ -0,0 +1,34 @@
+"""keyset pagination indexes on (created_at, id)
+
+Revision ID: 0008_keyset_pagination
+Revises: 0007_import_checkpoints
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0008_keyset_pagination"
+down_revision = "0007_import_checkpoints"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_matches_created_at_id", "matches", ["created_at", "id"]),
+    ("ix_matches_player1_created_at_id", "matches", ["player1_id", "created_at", "id"]),
+    ("ix_matches_player2_created_at_id", "matches", ["player2_id", "created_at", "id"]),
+    ("ix_matches_tournament_created_at_id", "matches", ["tournament_id", "created_at", "id"]),
+    ("ix_players_created_at_id", "players", ["created_at", "id"]),
+    ("ix_players_active_created_at_id", "players", ["is_active", "created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    # Bancos criados por init_db() já podem ter os índices
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
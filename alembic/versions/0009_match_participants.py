@@ -0,0 +1,63 @@
+"""match_participants: one row per player of each match
+
+Revision ID: 0009_match_participants
+Revises: 0008_keyset_pagination
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0009_match_participants"
+down_revision = "0008_keyset_pagination"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Importar o pacote app já cria a tabela (init_db), possivelmente vazia
+    if "match_participants" not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            "match_participants",
+            sa.Column("player_id", sa.Integer(), sa.ForeignKey("players.id"), primary_key=True),
+            sa.Column("match_id", sa.Integer(), sa.ForeignKey("matches.id"), primary_key=True),
+            sa.Column("opponent_id", sa.Integer(), sa.ForeignKey("players.id"), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("won", sa.Boolean(), nullable=False),
+        )
+        op.create_index(
+            "ix_match_participants_player_time", "match_participants",
+            ["player_id", "created_at", "match_id"]
+        )
+        op.create_index(
+            "ix_match_participants_opponent_time", "match_participants",
+            ["player_id", "opponent_id", "created_at", "match_id"]
+        )
+        op.create_index("ix_match_participants_match", "match_participants", ["match_id"])
+
+    # Substituídos pelos índices de match_participants
+    op.drop_index("ix_matches_player1_created_at_id", table_name="matches", if_exists=True)
+    op.drop_index("ix_matches_player2_created_at_id", table_name="matches", if_exists=True)
+
+    # Indexa as partidas que ainda não têm linhas
+    op.execute(
+        """
+        INSERT INTO match_participants (player_id, match_id, opponent_id, created_at, won)
+        SELECT player1_id, id, player2_id, created_at, winner_id = player1_id FROM matches m
+        WHERE NOT EXISTS (SELECT 1 FROM match_participants p WHERE p.match_id = m.id)
+        UNION ALL
+        SELECT player2_id, id, player1_id, created_at, winner_id = player2_id FROM matches m
+        WHERE NOT EXISTS (SELECT 1 FROM match_participants p WHERE p.match_id = m.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("match_participants")
+    op.create_index(
+        "ix_matches_player1_created_at_id", "matches", ["player1_id", "created_at", "id"], if_not_exists=True
+    )
+    op.create_index(
+        "ix_matches_player2_created_at_id", "matches", ["player2_id", "created_at", "id"], if_not_exists=True
+    )
@@ -0,0 +1,66 @@
+"""tournaments, tournament_rounds and bracket_slots
+
+Revision ID: 0010_tournament_brackets
+Revises: 0009_match_participants
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0010_tournament_brackets"
+down_revision = "0009_match_participants"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Importar o pacote app já cria as tabelas (init_db)
+    tables = sa.inspect(op.get_bind()).get_table_names()
+    if "tournaments" not in tables:
+        op.create_table(
+            "tournaments",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(100), nullable=False),
+            # leagues vem de 0003_leagues, antes desta revisão
+            sa.Column("league_id", sa.Integer(), sa.ForeignKey("leagues.id"), nullable=True),
+            sa.Column("status", sa.String(20), nullable=False),
+            sa.Column("bracket_size", sa.Integer(), nullable=False),
+            sa.Column("winner_id", sa.Integer(), sa.ForeignKey("players.id"), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_tournaments_id", "tournaments", ["id"])
+    if "tournament_rounds" not in tables:
+        op.create_table(
+            "tournament_rounds",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("tournament_id", sa.Integer(), sa.ForeignKey("tournaments.id"), nullable=False),
+            sa.Column("number", sa.Integer(), nullable=False),
+            sa.Column("completed_at", sa.DateTime(), nullable=True),
+            sa.UniqueConstraint("tournament_id", "number", name="uq_tournament_rounds_number"),
+        )
+        op.create_index("ix_tournament_rounds_id", "tournament_rounds", ["id"])
+    if "bracket_slots" not in tables:
+        op.create_table(
+            "bracket_slots",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("tournament_id", sa.Integer(), sa.ForeignKey("tournaments.id"), nullable=False),
+            sa.Column("round_id", sa.Integer(), sa.ForeignKey("tournament_rounds.id"), nullable=False),
+            sa.Column("round_number", sa.Integer(), nullable=False),
+            sa.Column("position", sa.Integer(), nullable=False),
+            sa.Column("player1_id", sa.Integer(), sa.ForeignKey("players.id"), nullable=True),
+            sa.Column("player2_id", sa.Integer(), sa.ForeignKey("players.id"), nullable=True),
+            sa.Column("winner_id", sa.Integer(), sa.ForeignKey("players.id"), nullable=True),
+            sa.Column("match_id", sa.Integer(), sa.ForeignKey("matches.id"), nullable=True),
+            sa.UniqueConstraint("tournament_id", "round_number", "position", name="uq_bracket_slots_position"),
+        )
+        op.create_index("ix_bracket_slots_id", "bracket_slots", ["id"])
+        op.create_index("ix_bracket_slots_match", "bracket_slots", ["match_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("bracket_slots")
+    op.drop_table("tournament_rounds")
+    op.drop_table("tournaments")
@@ -0,0 +1,149 @@
+import zlib
+from typing import Callable, Dict, Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.constants import BROTLI_QUALITY, COMPRESSIBLE_TYPES, COMPRESSION_MIN_SIZE, GZIP_LEVEL
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional: sem ele só gzip é oferecido
+    brotli = None
+
+
+class GzipCompressor:
+    """zlib in gzip framing with the process/finish interface of brotli.Compressor"""
+
+    def __init__(self, level: int = GZIP_LEVEL):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+# Em ordem de preferência do servidor, usada para desempatar os q-values
+COMPRESSORS: Dict[str, Callable[[], object]] = {}
+if brotli is not None:
+    COMPRESSORS["br"] = lambda: brotli.Compressor(quality=BROTLI_QUALITY)
+COMPRESSORS["gzip"] = GzipCompressor
+
+
+def negotiate_encoding(accept_encoding: str, available: Iterable[str]) -> Optional[str]:
+    """
+    Picks the content coding to use from an Accept-Encoding header: the
+    available one with the highest q-value, the first available on ties,
+    None when the client accepts none of them.
+    """
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compresses JSON, NDJSON and text responses of at least minimum_size
+    bytes with the coding negotiated from Accept-Encoding (br when the
+    brotli package is installed, otherwise gzip). Smaller bodies, such as
+    single resources and 304s, are sent as they are; streamed bodies are
+    compressed chunk by chunk.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            coding = negotiate_encoding(Headers(scope=scope).get("Accept-Encoding", ""), COMPRESSORS)
+            if coding is not None:
+                responder = CompressionResponder(self.app, coding, self.minimum_size)
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class CompressionResponder:
+    def __init__(self, app: ASGIApp, coding: str, minimum_size: int):
+        self.app = app
+        self.coding = coding
+        self.minimum_size = minimum_size
+        self.send: Optional[Send] = None
+        self.initial_message: Message = {}
+        self.passthrough = False
+        self.started = False
+        self.compressor = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Os cabeçalhos esperam o primeiro pedaço do corpo, que decide a compressão
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            )
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+        if self.passthrough:
+            await self._start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.started:
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if len(body) < self.minimum_size and not more_body:
+                await self._start()
+                await self.send(message)
+                return
+            self.compressor = COMPRESSORS[self.coding]()
+            headers["Content-Encoding"] = self.coding
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self.compressor.process(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._start()
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            await self._start()
+
+        body = self.compressor.process(body)
+        if not more_body:
+            body += self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _start(self) -> None:
+        if not self.started:
+            self.started = True
+            await self.send(self.initial_message)
@@ -0,0 +1,52 @@
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from app.core.cache import get_versions, run_cache_io
+
+
+async def not_modified(request: Request, response: Response, key: str) -> Optional[Response]:
+    """
+    Sets ETag/Last-Modified from the version counter of key and, when the
+    client's If-None-Match (or, without it, If-Modified-Since) still
+    matches, returns the 304 to send instead of querying the database.
+
+    Call before any service call: the counter is bumped after every commit,
+    so a version read before the query can only be older than the data.
+    """
+    version, modified_at = await run_cache_io(get_versions().get, key)
+    # Fraca: o mesmo recurso pode ir comprimido ou não
+    etag = f'W/"{version}-{int(modified_at * 1000):x}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(modified_at, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        matched = _etag_matches(if_none_match, etag)
+    else:
+        matched = _not_modified_since(request.headers.get("If-Modified-Since"), modified_at)
+    if matched:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Comparação fraca (RFC 9110 13.1.2): ignora o prefixo W/
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def _not_modified_since(if_modified_since: Optional[str], modified_at: float) -> bool:
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    # Last-Modified tem precisão de segundos
+    return int(modified_at) <= since
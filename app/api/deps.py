@@ -1,9 +1,10 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, get_async_sessionmaker
 
 def get_db() -> Generator:
     """
@@ -18,6 +19,16 @@ def get_db() -> Generator:
     finally:
         db.close()
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function that yields async db sessions to async endpoints.
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
 # Optional: Add authentication dependency if needed
 async def get_current_user(db: Session = Depends(get_db)):
     """
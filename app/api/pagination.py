@@ -0,0 +1,28 @@
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.db.pagination import KeysetPage
+
+
+def set_page_headers(
+    request: Request,
+    response: Response,
+    page: KeysetPage,
+    total: Optional[int] = None
+) -> None:
+    """
+    Exposes the cursors of a keyset page as X-Next-Cursor/X-Prev-Cursor and
+    an RFC 8288 Link header, keeping the response body a plain list.
+    """
+    links = []
+    for rel, cursor in (("next", page.next_cursor), ("prev", page.prev_cursor)):
+        if cursor is None:
+            continue
+        response.headers[f"X-{rel.title()}-Cursor"] = cursor
+        url = request.url.remove_query_params("skip").include_query_params(cursor=cursor)
+        links.append(f'<{url}>; rel="{rel}"')
+    if links:
+        response.headers["Link"] = ", ".join(links)
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
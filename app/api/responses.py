@@ -0,0 +1,30 @@
+from typing import Any, Dict, List, Type, Union
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+
+def list_response(
+    response: Response,
+    items: List[Dict[str, Any]],
+    schema: Type[BaseModel]
+) -> Union[List[Dict[str, Any]], Response]:
+    """
+    Sends dicts already shaped like schema (from column-projected queries)
+    encoded by orjson, skipping the per-item validation and re-serialization
+    of the route's response_model, which stays declared so the OpenAPI
+    schema is unchanged. Headers already set on response are kept.
+
+    With FAST_JSON_RESPONSES disabled the items are returned for FastAPI to
+    validate and serialize as usual.
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return items
+    # Só os campos do schema, como o response_model filtraria (ex.: created_at do cursor)
+    fields = list(schema.model_fields)
+    fast = ORJSONResponse([{field: item[field] for field in fields} for item in items])
+    fast.headers.raw.extend(response.headers.raw)
+    return fast
@@ -0,0 +1,33 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.schemas.stats import HeadToHead, HeadToHeadMatrix
+from app.services.head_to_head_service import HeadToHeadService
+
+router = APIRouter()
+
+@router.get("/", response_model=HeadToHeadMatrix)
+def get_head_to_head_matrix(
+    player_ids: List[int] = Query(..., min_length=2),
+    db: Session = Depends(get_db)
+):
+    """
+    Matriz de confrontos diretos entre os jogadores informados
+    """
+    head_to_head_service = HeadToHeadService(db)
+    return head_to_head_service.get_matrix(player_ids)
+
+@router.get("/{player_id}/{opponent_id}", response_model=HeadToHead)
+def get_head_to_head(
+    player_id: int,
+    opponent_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Confronto direto entre dois jogadores, do ponto de vista do primeiro
+    """
+    head_to_head_service = HeadToHeadService(db)
+    return head_to_head_service.get_pair(player_id, opponent_id)
@@ -0,0 +1,76 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from app.api import deps
+from app.services.league_service import LeagueService
+from app.schemas.league import League, LeagueCreate, LeagueRating, LeagueUpdate
+
+router = APIRouter()
+
+def get_league_or_404(league_service: LeagueService, league_id: int):
+    league = league_service.get_by_id(league_id)
+    if not league:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="League not found"
+        )
+    return league
+
+@router.post("/", response_model=League, status_code=status.HTTP_201_CREATED)
+def create_league(
+    league_in: LeagueCreate,
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Criar nova liga com o sistema de rating escolhido
+    """
+    league_service = LeagueService(db)
+    return league_service.create(league_in)
+
+@router.get("/", response_model=List[League])
+def list_leagues(
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Listar ligas
+    """
+    league_service = LeagueService(db)
+    return league_service.get_all(skip=skip, limit=limit)
+
+@router.get("/{league_id}", response_model=League)
+def get_league(
+    league_id: int,
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Obter liga por ID
+    """
+    league_service = LeagueService(db)
+    return get_league_or_404(league_service, league_id)
+
+@router.patch("/{league_id}", response_model=League)
+def update_league(
+    league_id: int,
+    league_in: LeagueUpdate,
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Atualizar liga (nome ou sistema de rating)
+    """
+    league_service = LeagueService(db)
+    league = get_league_or_404(league_service, league_id)
+    return league_service.update(league, league_in)
+
+@router.get("/{league_id}/ratings", response_model=List[LeagueRating])
+def get_league_ratings(
+    league_id: int,
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Ranking da liga calculado com o sistema de rating da liga
+    """
+    league_service = LeagueService(db)
+    league = get_league_or_404(league_service, league_id)
+    return league_service.get_ratings(league)
@@ -1,13 +1,32 @@
+import io
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
-from app.schemas.match import Match, MatchCreate, MatchUpdate
-from app.services.match_service import MatchService
+from app.api.conditional import not_modified
+from app.api.deps import get_async_db, get_db
+from app.api.pagination import set_page_headers
+from app.api.responses import list_response
+from app.schemas.match import (
+    Match,
+    MatchBulkCreate,
+    MatchBulkResult,
+    MatchCreate,
+    MatchImportResult,
+    MatchUpdate,
+)
+from app.services.export_service import EXPORT_FORMATS, ExportService
+from app.services.import_service import MatchImportService
+from app.services.match_service import AsyncMatchService, MatchService
+from app.utils.match_import import content_digest, detect_format
 
 router = APIRouter()
 
+# Leituras são async (AsyncSession); escritas seguem em def, no threadpool:
+# o replay de ratings, conquistas e chaves ocuparia o event loop
+
 @router.post("/", response_model=Match)
 def create_match(
     match_data: MatchCreate,
@@ -19,35 +38,115 @@ def create_match(
     match_service = MatchService(db)
     return match_service.create_match(match_data)
 
-@router.get("/{match_id}", response_model=Match)
-def get_match(
-    match_id: int,
+@router.post("/bulk", response_model=MatchBulkResult)
+def create_matches_bulk(
+    bulk_data: MatchBulkCreate,
     db: Session = Depends(get_db)
 ):
     """
-    Retorna uma partida específica
+    Importa um lote de partidas em uma única transação.
+    Itens inválidos são reportados por posição sem interromper o restante.
     """
     match_service = MatchService(db)
-    return match_service.get_match(match_id)
+    return match_service.create_matches_bulk(bulk_data.matches)
+
+@router.post("/import", response_model=MatchImportResult)
+def import_matches(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    resume: bool = Query(False, description="Continua a partir do último lote confirmado deste mesmo conteúdo"),
+    db: Session = Depends(get_db)
+):
+    """
+    Importa partidas históricas de um arquivo CSV ou NDJSON, lido em
+    streaming e inserido em lotes com checkpoint pelo SHA-256 do conteúdo.
+    """
+    try:
+        fmt = format or detect_format(file.filename or "")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Outro arquivo com o mesmo nome não pode retomar este checkpoint
+    source = f"upload:{content_digest(file.file)}"
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    import_service = MatchImportService(db)
+    return import_service.import_lines(lines, fmt, source=source, resume=resume)
+
+@router.get("/export", response_class=StreamingResponse)
+def export_matches(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    player_id: Optional[int] = None,
+    tournament_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Exporta todas as partidas com seus sets em NDJSON ou CSV, em streaming
+    """
+    export_service = ExportService(db)
+    return StreamingResponse(
+        export_service.export_matches(format, player_id=player_id, tournament_id=tournament_id),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="matches.{format}"'}
+    )
+
+@router.get("/{match_id}", response_model=Match)
+async def get_match(
+    match_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Retorna uma partida específica; responde 304 pelo contador de versão
+    quando o If-None-Match/If-Modified-Since do cliente ainda vale
+    """
+    unchanged = await not_modified(request, response, f"match:{match_id}")
+    if unchanged is not None:
+        return unchanged
+    match_service = AsyncMatchService(db)
+    return await match_service.get_match(match_id)
 
 @router.get("/", response_model=List[Match])
-def get_matches(
-    db: Session = Depends(get_db),
+async def get_matches(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     player_id: Optional[int] = None,
-    tournament_id: Optional[int] = None
+    tournament_id: Optional[int] = None,
+    cursor: Optional[str] = Query(None, description="Cursor de X-Next-Cursor/X-Prev-Cursor"),
+    include_total: bool = Query(False, description="Inclui X-Total-Count (contagem em cache)")
 ):
     """
-    Lista partidas com opção de filtros
+    Lista partidas em ordem cronológica com opção de filtros.
+    A paginação é por cursor (cabeçalhos Link e X-Next-Cursor); skip é mantido
+    por compatibilidade e fica mais lento quanto mais fundo na lista.
     """
-    match_service = MatchService(db)
-    return match_service.get_matches(
-        skip=skip,
+    unchanged = await not_modified(request, response, "matches")
+    if unchanged is not None:
+        return unchanged
+    match_service = AsyncMatchService(db)
+    total = await match_service.count_matches(player_id, tournament_id) if include_total else None
+    if skip and cursor is None:
+        if total is not None:
+            response.headers["X-Total-Count"] = str(total)
+        matches = await match_service.get_matches(
+            skip=skip,
+            limit=limit,
+            player_id=player_id,
+            tournament_id=tournament_id,
+            lean=True
+        )
+        return list_response(response, matches, Match)
+    page = await match_service.get_matches_page(
+        cursor=cursor,
         limit=limit,
         player_id=player_id,
-        tournament_id=tournament_id
+        tournament_id=tournament_id,
+        lean=True
     )
+    set_page_headers(request, response, page, total)
+    return list_response(response, page.items, Match)
 
 @router.patch("/{match_id}", response_model=Match)
 def update_match(
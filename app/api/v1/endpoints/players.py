@@ -1,12 +1,34 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.api import deps
-from app.services.player_service import PlayerService
+from app.api.conditional import not_modified
+from app.api.pagination import set_page_headers
+from app.api.responses import list_response
+from app.services.export_service import EXPORT_FORMATS, ExportService
+from app.services.match_service import AsyncMatchService
+from app.services.player_service import AsyncPlayerService, PlayerService
+from app.services.rating_service import RatingService
+from app.schemas.match import Match
 from app.schemas.player import Player, PlayerCreate, PlayerUpdate
+from app.schemas.stats import PlayerStats
+from app.schemas.achievement import PlayerAchievements
+from app.schemas.rating import RatingHistory
+from app.utils.constants import (
+    CACHE_TTL,
+    DEFAULT_RATING_HISTORY_POINTS,
+    MAX_PAGE_SIZE,
+    MAX_RATING_HISTORY_POINTS,
+)
 
 router = APIRouter()
 
+# Leituras são async (AsyncSession); escritas e o rating-history (LTTB) seguem
+# em def, no threadpool, para não ocupar o event loop com replays e CPU
+
 @router.post("/", response_model=Player, status_code=status.HTTP_201_CREATED)
 def create_player(
     player_in: PlayerCreate,
@@ -18,16 +40,38 @@ def create_player(
     player_service = PlayerService(db)
     return player_service.create(player_in)
 
+@router.get("/export", response_class=StreamingResponse)
+def export_players(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    active_only: bool = False,
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Exporta todos os jogadores em NDJSON ou CSV, em streaming
+    """
+    export_service = ExportService(db)
+    return StreamingResponse(
+        export_service.export_players(format, active_only=active_only),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="players.{format}"'}
+    )
+
 @router.get("/{player_id}", response_model=Player)
-def get_player(
+async def get_player(
     player_id: int,
-    db: Session = Depends(deps.get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db)
 ):
     """
-    Obter jogador por ID
+    Obter jogador por ID; responde 304 pelo contador de versão quando o
+    If-None-Match/If-Modified-Since do cliente ainda vale
     """
-    player_service = PlayerService(db)
-    player = player_service.get_by_id(player_id)
+    unchanged = await not_modified(request, response, f"player:{player_id}")
+    if unchanged is not None:
+        return unchanged
+    player_service = AsyncPlayerService(db)
+    player = await player_service.get_by_id(player_id)
     if not player:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -35,18 +79,118 @@ def get_player(
         )
     return player
 
+@router.get("/{player_id}/stats", response_model=PlayerStats)
+async def get_player_stats(
+    player_id: int,
+    db: AsyncSession = Depends(deps.get_async_db)
+):
+    """
+    Obter estatísticas agregadas do jogador (vitórias, derrotas, sets e pontos)
+    """
+    player_service = AsyncPlayerService(db)
+    return await player_service.get_stats(player_id)
+
+@router.get("/{player_id}/achievements", response_model=PlayerAchievements)
+async def get_player_achievements(
+    player_id: int,
+    db: AsyncSession = Depends(deps.get_async_db)
+):
+    """
+    Obter conquistas do jogador e os contadores de sequência de vitórias
+    """
+    player_service = AsyncPlayerService(db)
+    return await player_service.get_achievements(player_id)
+
+@router.get("/{player_id}/matches", response_model=List[Match])
+async def get_player_matches(
+    player_id: int,
+    request: Request,
+    response: Response,
+    opponent_id: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    cursor: Optional[str] = Query(None, description="Cursor de X-Next-Cursor/X-Prev-Cursor"),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(deps.get_async_db)
+):
+    """
+    Histórico de partidas do jogador em ordem cronológica, com filtros de
+    adversário e período e paginação por cursor
+    """
+    unchanged = await not_modified(request, response, "matches")
+    if unchanged is not None:
+        return unchanged
+    if await AsyncPlayerService(db).get_by_id(player_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Player not found"
+        )
+    match_service = AsyncMatchService(db)
+    page = await match_service.get_matches_page(
+        cursor=cursor,
+        limit=limit,
+        player_id=player_id,
+        opponent_id=opponent_id,
+        start=start,
+        end=end,
+        lean=True
+    )
+    set_page_headers(request, response, page)
+    return list_response(response, page.items, Match)
+
+@router.get("/{player_id}/rating-history", response_model=RatingHistory)
+def get_rating_history(
+    player_id: int,
+    response: Response,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    points: int = Query(DEFAULT_RATING_HISTORY_POINTS, ge=3, le=MAX_RATING_HISTORY_POINTS),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Obter o rating do jogador após cada partida, reduzido para no máximo
+    `points` pontos (LTTB) para gráficos
+    """
+    if start is not None and end is not None and start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end"
+        )
+    rating_service = RatingService(db)
+    history = rating_service.get_history(player_id, start=start, end=end, points=points)
+    # Intervalo fechado: a resposta pode ser reaproveitada por clientes e proxies
+    if end is not None:
+        response.headers["Cache-Control"] = f"public, max-age={CACHE_TTL['rating_history']}"
+    return history
+
 @router.get("/", response_model=List[Player])
-def list_players(
+async def list_players(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     active_only: bool = True,
-    db: Session = Depends(deps.get_db)
+    cursor: Optional[str] = Query(None, description="Cursor de X-Next-Cursor/X-Prev-Cursor"),
+    include_total: bool = Query(False, description="Inclui X-Total-Count (contagem em cache)"),
+    db: AsyncSession = Depends(deps.get_async_db)
 ):
     """
-    Listar jogadores com paginação
+    Listar jogadores com paginação por cursor (cabeçalhos Link e X-Next-Cursor);
+    skip é mantido por compatibilidade
     """
-    player_service = PlayerService(db)
-    return player_service.get_all(skip=skip, limit=limit, active_only=active_only)
+    unchanged = await not_modified(request, response, "players")
+    if unchanged is not None:
+        return unchanged
+    player_service = AsyncPlayerService(db)
+    total = await player_service.count(active_only=active_only) if include_total else None
+    if skip and cursor is None:
+        if total is not None:
+            response.headers["X-Total-Count"] = str(total)
+        players = await player_service.get_all(skip=skip, limit=limit, active_only=active_only, lean=True)
+        return list_response(response, players, Player)
+    page = await player_service.get_page(cursor=cursor, limit=limit, active_only=active_only, lean=True)
+    set_page_headers(request, response, page, total)
+    return list_response(response, page.items, Player)
 
 @router.patch("/{player_id}", response_model=Player)
 def update_player(
@@ -0,0 +1,68 @@
+from typing import List
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.schemas.ranking import CategorySummary, PlayerRanking, RankingEntry, RankingPage
+from app.services.ranking_service import RankingService
+from app.utils.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+router = APIRouter()
+
+@router.get("/", response_model=RankingPage)
+def get_ranking(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
+    """
+    Ranking geral paginado
+    """
+    ranking_service = RankingService(db)
+    return ranking_service.get_page(page, page_size)
+
+@router.get("/categories", response_model=List[CategorySummary])
+def get_categories(
+    db: Session = Depends(get_db)
+):
+    """
+    Quantidade e percentual de jogadores por categoria
+    """
+    ranking_service = RankingService(db)
+    return ranking_service.get_categories()
+
+@router.get("/category/{category}", response_model=RankingPage)
+def get_category_ranking(
+    category: str,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
+    """
+    Ranking paginado de uma categoria
+    """
+    ranking_service = RankingService(db)
+    return ranking_service.get_category_page(category, page, page_size)
+
+@router.get("/players/{player_id}", response_model=PlayerRanking)
+def get_player_rank(
+    player_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Posição e percentil de um jogador no ranking geral e na sua categoria
+    """
+    ranking_service = RankingService(db)
+    return ranking_service.get_player_rank(player_id)
+
+@router.get("/players/{player_id}/around", response_model=List[RankingEntry])
+def get_players_around(
+    player_id: int,
+    size: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
+    """
+    Jogadores ao redor de um jogador no ranking geral
+    """
+    ranking_service = RankingService(db)
+    return ranking_service.get_around(player_id, size)
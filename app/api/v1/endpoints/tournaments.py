@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.schemas.schedule import Schedule, ScheduleRequest, SwissRound, SwissRoundRequest
+from app.schemas.tournament import (
+    TournamentBracket,
+    TournamentCreate,
+    TournamentSimulation,
+    TournamentSimulationRequest
+)
+from app.services.schedule_service import ScheduleService
+from app.services.tournament_service import TournamentService
+
+router = APIRouter()
+
+@router.post("/", response_model=TournamentBracket, status_code=status.HTTP_201_CREATED)
+def create_tournament(
+    tournament_in: TournamentCreate,
+    db: Session = Depends(get_db)
+):
+    """
+    Criar torneio de eliminação simples com a chave completa. Os seeds
+    enfrentam os piores colocados e recebem os byes; os resultados das
+    partidas com o tournament_id avançam a chave automaticamente
+    """
+    tournament_service = TournamentService(db)
+    return tournament_service.create(tournament_in)
+
+@router.get("/{tournament_id}/bracket", response_model=TournamentBracket)
+def get_tournament_bracket(
+    tournament_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Obter a chave do torneio com todas as rodadas
+    """
+    tournament_service = TournamentService(db)
+    return tournament_service.get_bracket(tournament_id)
+
+@router.post("/simulate", response_model=TournamentSimulation)
+def simulate_tournament(
+    request: TournamentSimulationRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Simula o torneio (Monte Carlo) e retorna as chances de cada jogador
+    chegar a cada rodada e de vencer
+    """
+    tournament_service = TournamentService(db)
+    return tournament_service.simulate(request)
+
+@router.post("/schedule/round-robin", response_model=Schedule)
+def schedule_round_robin(
+    request: ScheduleRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Gera todas as rodadas de um grupo todos-contra-todos (método do
+    círculo) distribuídas nas mesas e horários disponíveis
+    """
+    schedule_service = ScheduleService(db)
+    return schedule_service.round_robin(request)
+
+@router.post("/schedule/swiss", response_model=SwissRound)
+def schedule_swiss_round(
+    request: SwissRoundRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Emparelha a próxima rodada suíça por pontuação e proximidade de
+    rating, evitando revanches, distribuída nas mesas disponíveis
+    """
+    schedule_service = ScheduleService(db)
+    return schedule_service.swiss_round(request)
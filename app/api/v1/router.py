@@ -2,11 +2,19 @@ from fastapi import APIRouter
 
 from app.api.v1.endpoints import (
     players,
-    matches
+    matches,
+    leagues,
+    tournaments,
+    rankings,
+    head_to_head
 )
 
 api_router = APIRouter()
 
 # Include all endpoint routers with their prefixes
 api_router.include_router(players.router, prefix="/players", tags=["players"])
-api_router.include_router(matches.router, prefix="/matches", tags=["matches"])
\ No newline at end of file
+api_router.include_router(matches.router, prefix="/matches", tags=["matches"])
+api_router.include_router(leagues.router, prefix="/leagues", tags=["leagues"])
+api_router.include_router(tournaments.router, prefix="/tournaments", tags=["tournaments"])
+api_router.include_router(rankings.router, prefix="/rankings", tags=["rankings"])
+api_router.include_router(head_to_head.router, prefix="/head-to-head", tags=["head-to-head"])
\ No newline at end of file
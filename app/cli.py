@@ -0,0 +1,174 @@
+"""
+Comandos administrativos da SpinMaster API.
+
+Uso:
+    python -m app.cli rebuild-ratings [--workers N]
+    python -m app.cli rebuild-stats
+    python -m app.cli backfill-achievements [--batch-size N]
+    python -m app.cli import-matches ARQUIVO [--format csv|ndjson] [--chunk-size N] [--resume]
+"""
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+from sqlalchemy import select
+
+from app.core.cache import get_versions
+from app.db.session import SessionLocal
+from app.models.player import Player
+from app.services.achievement_service import AchievementService
+from app.services.head_to_head_service import HeadToHeadService
+from app.services.import_service import MatchImportService
+from app.services.participant_service import ParticipantService
+from app.services.player_service import profile_cache
+from app.services.ranking_service import RankingService
+from app.services.rating_service import RatingService
+from app.services.stats_service import StatsService
+from app.utils.constants import ACHIEVEMENT_BATCH_SIZE, IMPORT_CHUNK_SIZE
+from app.utils.match_import import IMPORT_FORMATS, detect_format
+
+
+def rebuild_ratings(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        matches = RatingService(db).rebuild(workers=args.workers)
+        # Perfis em cache, ETags já entregues e o ranking trazem o rating antigo
+        profile_cache.clear()
+        RankingService(db).invalidate()
+        player_ids = db.scalars(select(Player.id))
+        get_versions().bump("players", *(f"player:{player_id}" for player_id in player_ids))
+        elapsed = time.perf_counter() - started
+        print(f"Replayed {matches} matches in {elapsed:.2f}s")
+    finally:
+        db.close()
+
+
+def rebuild_stats(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        players = StatsService(db).rebuild()
+        pairs = HeadToHeadService(db).rebuild()
+        matches = ParticipantService(db).rebuild()
+        # Reescrita em lote fora da API: o ranking também é relido do banco
+        RankingService(db).invalidate()
+        elapsed = time.perf_counter() - started
+        print(
+            f"Rebuilt statistics of {players} players, {pairs} head-to-head pairs "
+            f"and the participant index of {matches} matches in {elapsed:.2f}s"
+        )
+    finally:
+        db.close()
+
+
+def backfill_achievements(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        matches = AchievementService(db).backfill(batch_size=args.batch_size)
+        # Reescrita em lote fora da API: o ranking também é relido do banco
+        RankingService(db).invalidate()
+        elapsed = time.perf_counter() - started
+        print(f"Consumed {matches} matches in {elapsed:.2f}s")
+    finally:
+        db.close()
+
+
+def import_matches(args: argparse.Namespace) -> None:
+    fmt = args.format or detect_format(args.path)
+    started = time.perf_counter()
+
+    def report(result) -> None:
+        elapsed = time.perf_counter() - started
+        print(
+            f"line {result.lines}: {result.imported} imported, {result.rejected} rejected "
+            f"({elapsed:.1f}s)",
+            file=sys.stderr
+        )
+
+    db = SessionLocal()
+    try:
+        with open(args.path, encoding="utf-8-sig", newline="") as lines:
+            result = MatchImportService(db, chunk_size=args.chunk_size).import_lines(
+                lines, fmt, source=os.path.abspath(args.path), resume=args.resume, progress=report
+            )
+        # Os lotes só atualizam o ranking deste processo; os workers da API o releem do banco
+        RankingService(db).invalidate()
+        for error in result.errors:
+            print(f"line {error.line}: {error.detail}", file=sys.stderr)
+        elapsed = time.perf_counter() - started
+        print(f"Imported {result.imported} matches, rejected {result.rejected} in {elapsed:.2f}s")
+    finally:
+        db.close()
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = subparsers.add_parser(
+        "rebuild-ratings",
+        help="Recalcula os ratings de todos os jogadores a partir do histórico de partidas"
+    )
+    rebuild.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Processos usados para recalcular componentes independentes em paralelo"
+    )
+    rebuild.set_defaults(func=rebuild_ratings)
+
+    stats = subparsers.add_parser(
+        "rebuild-stats",
+        help="Recalcula as estatísticas, os confrontos diretos e o índice de participantes com SQL em lote"
+    )
+    stats.set_defaults(func=rebuild_stats)
+
+    achievements = subparsers.add_parser(
+        "backfill-achievements",
+        help="Recalcula sequências e conquistas percorrendo o histórico com um cursor no servidor"
+    )
+    achievements.add_argument(
+        "--batch-size",
+        type=int,
+        default=ACHIEVEMENT_BATCH_SIZE,
+        help="Partidas lidas e conquistas gravadas por lote"
+    )
+    achievements.set_defaults(func=backfill_achievements)
+
+    importer = subparsers.add_parser(
+        "import-matches",
+        help="Importa partidas históricas de um arquivo CSV ou NDJSON em lotes, com memória constante"
+    )
+    importer.add_argument("path", help="Arquivo a importar")
+    importer.add_argument(
+        "--format",
+        choices=IMPORT_FORMATS,
+        help="Formato do arquivo (padrão: deduzido da extensão)"
+    )
+    importer.add_argument(
+        "--chunk-size",
+        type=int,
+        default=IMPORT_CHUNK_SIZE,
+        help="Partidas inseridas por transação"
+    )
+    importer.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continua após o último lote confirmado de uma importação interrompida"
+    )
+    importer.set_defaults(func=import_matches)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = get_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
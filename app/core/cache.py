@@ -0,0 +1,124 @@
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.utils.cache import CacheBackend, RedisCache, TieredCache, TTLCache
+from app.utils.leaderboard import (
+    LeaderboardBackend,
+    MemoryLeaderboardBackend,
+    RedisLeaderboardBackend
+)
+from app.utils.versions import MemoryVersionStore, RedisVersionStore, VersionStore
+
+T = TypeVar("T")
+
+CACHE_BACKENDS = {"memory", "redis"}
+# Caches de dois níveis por namespace, para os contadores de monitoramento
+tiered_caches: Dict[str, TieredCache] = {}
+
+
+@lru_cache()
+def get_redis():
+    # Importado aqui para que o backend "memory" não dependa do pacote redis
+    import redis
+
+    return redis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+        password=settings.REDIS_PASSWORD
+    )
+
+
+def _backend() -> str:
+    if settings.CACHE_BACKEND not in CACHE_BACKENDS:
+        raise ValueError(f"Unknown cache backend: {settings.CACHE_BACKEND}")
+    return settings.CACHE_BACKEND
+
+
+async def run_cache_io(func: Callable[..., T], *args) -> T:
+    """
+    Calls a cache or version store method from async code: in the
+    threadpool with the Redis backend, whose client blocks on the network,
+    directly on the event loop with the in-process one.
+    """
+    if _backend() == "redis":
+        return await run_in_threadpool(func, *args)
+    return func(*args)
+
+
+def get_cache(namespace: str, ttl: Optional[float] = None, maxsize: int = 1024) -> CacheBackend:
+    """
+    Creates the cache configured by CACHE_BACKEND.
+
+    Args:
+        namespace (str): Key prefix in Redis
+        ttl (Optional[float]): Entry lifetime in seconds, defaults to CACHE_EXPIRE_MINUTES
+        maxsize (int): Entry limit of the in-process cache
+
+    Returns:
+        CacheBackend: TTLCache or RedisCache
+    """
+    ttl = settings.CACHE_EXPIRE_MINUTES * 60 if ttl is None else ttl
+    if _backend() == "redis":
+        return RedisCache(get_redis(), namespace, ttl)
+    return TTLCache(ttl=ttl, maxsize=maxsize)
+
+
+def get_tiered_cache(
+    namespace: str,
+    ttl: float,
+    local_ttl: float,
+    maxsize: int = 1024
+) -> TieredCache:
+    """
+    Creates an in-process LRU in front of the shared cache when
+    CACHE_BACKEND is "redis"; with "memory" the local tier is the only one
+    and keeps the full ttl.
+
+    Args:
+        namespace (str): Key prefix in Redis and name in cache_stats
+        ttl (float): Entry lifetime in seconds
+        local_ttl (float): Lifetime in the local tier when a shared tier exists
+        maxsize (int): Entry limit of the local tier
+
+    Returns:
+        TieredCache: Registered under namespace
+    """
+    if _backend() == "redis":
+        cache = TieredCache(
+            TTLCache(ttl=min(ttl, local_ttl), maxsize=maxsize),
+            RedisCache(get_redis(), namespace, ttl)
+        )
+    else:
+        cache = TieredCache(TTLCache(ttl=ttl, maxsize=maxsize))
+    tiered_caches[namespace] = cache
+    return cache
+
+
+def cache_stats() -> Dict[str, dict]:
+    """Hit/miss counters of every two-tier cache"""
+    return {namespace: cache.stats() for namespace, cache in tiered_caches.items()}
+
+
+def get_leaderboard(
+    categories: Iterable[str],
+    categorize: Callable[[float], str],
+    ttl: float
+) -> LeaderboardBackend:
+    """Creates the leaderboard backend configured by CACHE_BACKEND"""
+    if _backend() == "redis":
+        return RedisLeaderboardBackend(
+            get_redis(), categories, categorize, ttl, prefix=settings.RANKING_CACHE_KEY
+        )
+    return MemoryLeaderboardBackend(categories, categorize, ttl)
+
+
+@lru_cache()
+def get_versions() -> VersionStore:
+    """Version counters (ETag/Last-Modified) of the backend configured by CACHE_BACKEND"""
+    if _backend() == "redis":
+        return RedisVersionStore(get_redis(), prefix=settings.VERSIONS_KEY)
+    return MemoryVersionStore()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -18,5 +18,18 @@ class Settings(BaseSettings):
     API_VERSION: str = "v1"
     API_V1_STR: str = f"/api/{API_VERSION}"
     BACKEND_CORS_ORIGINS: List[str] = ["*"]
+    # Listagens codificadas direto com orjson, sem validar cada item no response_model
+    FAST_JSON_RESPONSES: bool = True
+
+    # Cache: "memory" mantém rankings, caches e versões (ETag) em cada processo;
+    # "redis" compartilha entre todos os workers do uvicorn
+    CACHE_BACKEND: str = "memory"
+    CACHE_EXPIRE_MINUTES: int = 15
+    RANKING_CACHE_KEY: str = "rankings"
+    VERSIONS_KEY: str = "versions"
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_PASSWORD: Optional[str] = None
 
 settings = Settings()
\ No newline at end of file
@@ -14,8 +14,15 @@ Base = declarative_base(cls=CustomBase)
 
 # Importar os modelos em ordem de dependência
 from app.models.player import Player
+from app.models.league import League
 from app.models.match import Match 
 from app.models.set import Set 
+from app.models.match_participant import MatchParticipant
+from app.models.rating import RatingLedger, RatingCheckpoint
+from app.models.stats import PlayerStats, HeadToHead
+from app.models.achievement import AchievementProgress, PlayerAchievement
+from app.models.match_import import ImportCheckpoint
+from app.models.tournament import Tournament, Round, BracketSlot
 
 # Create tables if they don't exist
 def init_db():
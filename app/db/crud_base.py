@@ -3,6 +3,7 @@ from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from app.db.base import Base
+from app.db.pagination import KeysetPage, paginate_keyset
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -26,6 +27,17 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> List[ModelType]:
         return db.query(self.model).offset(skip).limit(limit).all()
 
+    def get_page(
+        self, db: Session, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> KeysetPage:
+        """
+        Keyset page in (created_at, id) order; the model needs both columns.
+        Raises ValueError on a malformed cursor.
+        """
+        return paginate_keyset(
+            db.query(self.model), self.model.created_at, self.model.id, limit, cursor
+        )
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)
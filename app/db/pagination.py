@@ -0,0 +1,123 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from app.utils.cache import CacheBackend
+
+# (created_at, id) de uma linha
+Key = Tuple[datetime, int]
+DIRECTIONS = ("next", "prev")
+
+
+def keyset_after(created_at_column, id_column, key: Key):
+    created_at, row_id = key
+    return or_(
+        created_at_column > created_at,
+        and_(created_at_column == created_at, id_column > row_id)
+    )
+
+
+def keyset_before(created_at_column, id_column, key: Key):
+    created_at, row_id = key
+    return or_(
+        created_at_column < created_at,
+        and_(created_at_column == created_at, id_column < row_id)
+    )
+
+
+def encode_cursor(key: Key, direction: str = "next") -> str:
+    """Opaque, URL-safe cursor pointing just after (next) or before (prev) key"""
+    payload = json.dumps([key[0].isoformat(), key[1], direction], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Key, str]:
+    """Inverse of encode_cursor; raises ValueError on a malformed cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id, direction = json.loads(base64.urlsafe_b64decode(padded))
+        key = (datetime.fromisoformat(created_at), int(row_id))
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    if direction not in DIRECTIONS:
+        raise ValueError("Invalid cursor")
+    return key, direction
+
+
+class KeysetPage(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+
+
+def paginate_keyset(
+    query: Query,
+    created_at_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    key_of: Optional[Callable[[Any], Key]] = None
+) -> KeysetPage:
+    """
+    One page of query in (created_at, id) order, located by a cursor
+    instead of an offset: the database seeks straight to the cursor key
+    through a composite index, so every page costs the same however deep
+    it is. One extra row is fetched to know whether a further page exists.
+
+    Args:
+        query (Query): Filtered query, without ordering or limit
+        created_at_column: Column of the first sort key
+        id_column: Unique column breaking ties
+        limit (int): Page size
+        cursor (Optional[str]): Cursor from a previous page; None for the first page
+        key_of (Optional[Callable]): Reads (created_at, id) from a result item;
+            defaults to the attributes named after the two columns
+
+    Returns:
+        KeysetPage: Items and the cursors of the neighbouring pages
+    """
+    if key_of is None:
+        key_of = lambda item: (getattr(item, created_at_column.key), getattr(item, id_column.key))
+
+    direction = "next"
+    if cursor is not None:
+        key, direction = decode_cursor(cursor)
+        if direction == "next":
+            query = query.filter(keyset_after(created_at_column, id_column, key))
+        else:
+            query = query.filter(keyset_before(created_at_column, id_column, key))
+
+    if direction == "next":
+        query = query.order_by(created_at_column, id_column)
+    else:
+        # Página anterior: percorre o índice ao contrário e reverte o resultado
+        query = query.order_by(created_at_column.desc(), id_column.desc())
+    items = query.limit(limit + 1).all()
+    more = len(items) > limit
+    items = items[:limit]
+    if direction == "prev":
+        items.reverse()
+
+    if not items:
+        return KeysetPage(items, None, None)
+    has_next = more if direction == "next" else True
+    has_prev = cursor is not None if direction == "next" else more
+    return KeysetPage(
+        items,
+        encode_cursor(key_of(items[-1]), "next") if has_next else None,
+        encode_cursor(key_of(items[0]), "prev") if has_prev else None
+    )
+
+
+def cached_count(cache: CacheBackend, key: str, query: Query) -> int:
+    """COUNT(*) of query, served from cache until the writers invalidate key"""
+    total = cache.get(key)
+    if total is None:
+        total = query.order_by(None).count()
+        cache.set(key, total)
+    return total
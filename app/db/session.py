@@ -1,6 +1,9 @@
-from sqlalchemy import create_engine
+from functools import lru_cache
+
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import settings
 
@@ -21,6 +24,37 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Driver assíncrono de cada banco
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def async_database_url(url: str) -> str:
+    """DATABASE_URL with the async driver of its backend (asyncpg, aiosqlite)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    # Criado sob demanda: só o caminho async exige asyncpg/aiosqlite instalados
+    return create_async_engine(
+        async_database_url(settings.DATABASE_URL),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=5,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_pre_ping=True
+    )
+
+@lru_cache()
+def get_async_sessionmaker() -> async_sessionmaker:
+    # Sem expirar no commit: fora do run_sync não há lazy load para recarregar
+    return async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+
 # Database dependency
 def get_db():
     """
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+
+def _insert(db: Session):
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Upsert not supported for dialect: {dialect}")
+    return insert
+
+
+def upsert_increment(
+    db: Session,
+    model,
+    index_elements: List[str],
+    rows: List[Dict[str, Any]],
+    counters: Iterable[str],
+    updates: Optional[Callable[[Any], Dict[str, Any]]] = None
+) -> None:
+    """
+    Inserts rows or, when the key already exists, adds their counters to
+    the stored ones, in a single INSERT ... ON CONFLICT DO UPDATE.
+
+    Args:
+        db (Session): Database session
+        model: Mapped class with a unique constraint on index_elements
+        index_elements (List[str]): Key columns
+        rows (List[Dict[str, Any]]): Values to insert, including every counter
+        counters (Iterable[str]): Columns incremented on conflict
+        updates (Optional[Callable]): Receives the EXCLUDED pseudo-table and returns
+            further column expressions to set on conflict
+    """
+    if not rows:
+        return
+    statement = _insert(db)(model).values(rows)
+    values = {
+        name: getattr(model, name) + getattr(statement.excluded, name)
+        for name in counters
+    }
+    if updates is not None:
+        values.update(updates(statement.excluded))
+    if hasattr(model, "updated_at"):
+        values["updated_at"] = datetime.now()
+    db.execute(statement.on_conflict_do_update(index_elements=index_elements, set_=values))
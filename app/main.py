@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.api.compression import CompressionMiddleware
 from app.api.v1.router import api_router
+from app.core.cache import cache_stats
 from app.core.config import settings
 
 app = FastAPI(
@@ -19,10 +21,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compressão gzip/brotli negociada das respostas maiores (listagens e exportações)
+app.add_middleware(CompressionMiddleware)
+
 # Incluir rotas da API
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
-    
\ No newline at end of file
+    
+
+@app.get("/health/cache")
+async def cache_health():
+    """Contadores de acerto/falha dos caches de dois níveis, por namespace"""
+    return cache_stats()
@@ -1,11 +1,30 @@
 from .base import Base
 from .player import Player
+from .league import League
 from .match import Match
 from .set import Set
+from .match_participant import MatchParticipant
+from .rating import RatingLedger, RatingCheckpoint
+from .stats import PlayerStats, HeadToHead
+from .achievement import AchievementProgress, PlayerAchievement
+from .match_import import ImportCheckpoint
+from .tournament import Tournament, Round, BracketSlot
 
 __all__ = [
     'Base',
     'Player',
+    'League',
     'Set',
     'Match',
+    'MatchParticipant',
+    'RatingLedger',
+    'RatingCheckpoint',
+    'PlayerStats',
+    'HeadToHead',
+    'AchievementProgress',
+    'PlayerAchievement',
+    'ImportCheckpoint',
+    'Tournament',
+    'Round',
+    'BracketSlot',
 ]
@@ -0,0 +1,33 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+
+from app.db.base import Base
+
+class AchievementProgress(Base):
+    """Counters of the achievements engine for one player."""
+    __tablename__ = "achievement_progress"
+
+    player_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
+    matches_played = Column(Integer, default=0, nullable=False)
+    current_streak = Column(Integer, default=0, nullable=False)
+    best_streak = Column(Integer, default=0, nullable=False)
+    tournaments_won = Column(Integer, default=0, nullable=False)
+    # Última partida consumida: (last_match_at, last_match_id)
+    last_match_at = Column(DateTime, nullable=True)
+    last_match_id = Column(Integer, nullable=True)
+
+class PlayerAchievement(Base):
+    """Badge awarded to a player (see ACHIEVEMENTS)."""
+    __tablename__ = "player_achievements"
+
+    id = Column(Integer, primary_key=True, index=True)
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False, index=True)
+    achievement = Column(String(30), nullable=False)
+    level = Column(String(10), nullable=False)
+    # Partida que completou a conquista
+    match_id = Column(Integer, nullable=True)
+    awarded_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('player_id', 'achievement', 'level', name='unique_player_achievement'),
+    )
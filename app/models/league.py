@@ -0,0 +1,14 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.db.base import Base
+from app.utils.constants import DEFAULT_RATING_SYSTEM
+
+class League(Base):
+    __tablename__ = "leagues"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), unique=True, nullable=False)
+    # Sistema de rating usado no ranking da liga (ver RATING_SYSTEMS)
+    rating_system = Column(String(20), default=DEFAULT_RATING_SYSTEM, nullable=False)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
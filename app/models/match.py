@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -11,6 +11,7 @@ class Match(Base):
     player1_id = Column(Integer, ForeignKey("players.id"), nullable=False)
     player2_id = Column(Integer, ForeignKey("players.id"), nullable=False)
     tournament_id = Column(Integer, nullable=True)
+    league_id = Column(Integer, ForeignKey("leagues.id"), nullable=True, index=True)
     winner_id = Column(Integer, ForeignKey("players.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
@@ -18,4 +19,10 @@ class Match(Base):
     sets = relationship("Set", back_populates="match", order_by="Set.set_number")
     player1 = relationship("Player", foreign_keys=[player1_id])
     player2 = relationship("Player", foreign_keys=[player2_id])
-    winner = relationship("Player", foreign_keys=[winner_id])
\ No newline at end of file
+    winner = relationship("Player", foreign_keys=[winner_id])
+
+    # Paginação por cursor em (created_at, id); o filtro por jogador usa match_participants
+    __table_args__ = (
+        Index('ix_matches_created_at_id', 'created_at', 'id'),
+        Index('ix_matches_tournament_created_at_id', 'tournament_id', 'created_at', 'id'),
+    )
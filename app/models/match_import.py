@@ -0,0 +1,16 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.db.base import Base
+
+class ImportCheckpoint(Base):
+    """Progress of a match import, committed together with each chunk."""
+    __tablename__ = "import_checkpoints"
+
+    # Caminho do arquivo (CLI) ou nome do upload
+    source = Column(String(512), primary_key=True)
+    # Última linha do arquivo já processada
+    line = Column(Integer, default=0, nullable=False)
+    imported = Column(Integer, default=0, nullable=False)
+    rejected = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
@@ -0,0 +1,20 @@
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer
+
+from app.db.base import Base
+
+class MatchParticipant(Base):
+    """One row per player of each match, so a player's history is one index range."""
+    __tablename__ = "match_participants"
+
+    player_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
+    match_id = Column(Integer, ForeignKey("matches.id"), primary_key=True)
+    opponent_id = Column(Integer, ForeignKey("players.id"), nullable=False)
+    # Cópia de Match.created_at para ordenar e filtrar sem join
+    created_at = Column(DateTime, nullable=False)
+    won = Column(Boolean, nullable=False)
+
+    __table_args__ = (
+        Index('ix_match_participants_player_time', 'player_id', 'created_at', 'match_id'),
+        Index('ix_match_participants_opponent_time', 'player_id', 'opponent_id', 'created_at', 'match_id'),
+        Index('ix_match_participants_match', 'match_id'),
+    )
@@ -1,6 +1,7 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Float, Index
 from app.db.base import Base
+from app.utils.constants import INITIAL_RATING
 
 class Player(Base):
     __tablename__ = "players"
@@ -17,7 +18,16 @@ class Player(Base):
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
     last_login = Column(DateTime, nullable=True)
+
+    # Campos de ranking
+    rating = Column(Float, default=INITIAL_RATING, nullable=False)
     
     # Campos de perfil
     avatar_url = Column(String(255), nullable=True)
-    bio = Column(Text, nullable=True)
\ No newline at end of file
+    bio = Column(Text, nullable=True)
+
+    # Paginação por cursor em (created_at, id), com e sem filtro de ativos
+    __table_args__ = (
+        Index('ix_players_created_at_id', 'created_at', 'id'),
+        Index('ix_players_active_created_at_id', 'is_active', 'created_at', 'id'),
+    )
@@ -0,0 +1,35 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, JSON, Index
+
+from app.db.base import Base
+
+class RatingLedger(Base):
+    """Rating of one player before and after one match."""
+    __tablename__ = "rating_ledger"
+
+    id = Column(Integer, primary_key=True, index=True)
+    match_id = Column(Integer, ForeignKey("matches.id"), nullable=False, index=True)
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
+    # Cópia de Match.created_at para ordenar o ledger sem join
+    match_created_at = Column(DateTime, nullable=False)
+    rating_before = Column(Float, nullable=False)
+    rating_after = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index('ix_rating_ledger_player_time', 'player_id', 'match_created_at', 'match_id'),
+        Index('ix_rating_ledger_time', 'match_created_at', 'match_id'),
+    )
+
+class RatingCheckpoint(Base):
+    """Snapshot of every non-initial rating right after a given match."""
+    __tablename__ = "rating_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    match_id = Column(Integer, nullable=False)
+    match_created_at = Column(DateTime, nullable=False)
+    ratings = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    __table_args__ = (
+        Index('ix_rating_checkpoints_time', 'match_created_at', 'match_id'),
+    )
@@ -0,0 +1,35 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+
+from app.db.base import Base
+
+class PlayerStats(Base):
+    """Career totals of one player, kept in sync with every match write."""
+    __tablename__ = "player_stats"
+
+    player_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
+    matches_played = Column(Integer, default=0, nullable=False)
+    wins = Column(Integer, default=0, nullable=False)
+    losses = Column(Integer, default=0, nullable=False)
+    sets_won = Column(Integer, default=0, nullable=False)
+    sets_lost = Column(Integer, default=0, nullable=False)
+    points_won = Column(Integer, default=0, nullable=False)
+    points_lost = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+class HeadToHead(Base):
+    """
+    Record between two players, stored once per pair under (lower id,
+    higher id); "low" columns belong to the player with the lower id.
+    """
+    __tablename__ = "head_to_head"
+
+    player_low_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
+    player_high_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
+    matches_played = Column(Integer, default=0, nullable=False)
+    low_wins = Column(Integer, default=0, nullable=False)
+    high_wins = Column(Integer, default=0, nullable=False)
+    low_sets = Column(Integer, default=0, nullable=False)
+    high_sets = Column(Integer, default=0, nullable=False)
+    last_match_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
@@ -0,0 +1,60 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import relationship
+
+from app.db.base import Base
+
+class Tournament(Base):
+    """Single-elimination tournament; its matches carry Match.tournament_id."""
+    __tablename__ = "tournaments"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    league_id = Column(Integer, ForeignKey("leagues.id"), nullable=True)
+    status = Column(String(20), default="Pending", nullable=False)
+    # Potência de dois >= número de jogadores; as posições que sobram são byes
+    bracket_size = Column(Integer, nullable=False)
+    winner_id = Column(Integer, ForeignKey("players.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+    rounds = relationship("Round", back_populates="tournament", order_by="Round.number")
+
+
+class Round(Base):
+    __tablename__ = "tournament_rounds"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=False)
+    number = Column(Integer, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+
+    tournament = relationship("Tournament", back_populates="rounds")
+
+    __table_args__ = (
+        UniqueConstraint('tournament_id', 'number', name='uq_tournament_rounds_number'),
+    )
+
+
+class BracketSlot(Base):
+    """
+    One match of the bracket. The winner of (round, position) fills
+    (round + 1, position // 2), as player1 from an even position.
+    """
+    __tablename__ = "bracket_slots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=False)
+    round_id = Column(Integer, ForeignKey("tournament_rounds.id"), nullable=False)
+    # Cópia de Round.number para localizar a próxima posição sem join
+    round_number = Column(Integer, nullable=False)
+    position = Column(Integer, nullable=False)
+    player1_id = Column(Integer, ForeignKey("players.id"), nullable=True)
+    player2_id = Column(Integer, ForeignKey("players.id"), nullable=True)
+    winner_id = Column(Integer, ForeignKey("players.id"), nullable=True)
+    match_id = Column(Integer, ForeignKey("matches.id"), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint('tournament_id', 'round_number', 'position', name='uq_bracket_slots_position'),
+        Index('ix_bracket_slots_match', 'match_id'),
+    )
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel
+
+class Achievement(BaseModel):
+    achievement: str
+    level: str
+    match_id: Optional[int] = None
+    awarded_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class PlayerAchievements(BaseModel):
+    player_id: int
+    matches_played: int = 0
+    current_streak: int = 0
+    best_streak: int = 0
+    tournaments_won: int = 0
+    achievements: List[Achievement] = []
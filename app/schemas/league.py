@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field, validator
+
+from app.utils.constants import DEFAULT_RATING_SYSTEM, RATING_SYSTEMS
+
+def _check_rating_system(v):
+    if v is not None and v not in RATING_SYSTEMS:
+        raise ValueError(f"rating_system must be one of: {', '.join(sorted(RATING_SYSTEMS))}")
+    return v
+
+class LeagueBase(BaseModel):
+    name: str = Field(..., min_length=3, max_length=100)
+    rating_system: str = Field(DEFAULT_RATING_SYSTEM, description="Rating system used by the league")
+
+    @validator('rating_system')
+    def rating_system_known(cls, v):
+        return _check_rating_system(v)
+
+class LeagueCreate(LeagueBase):
+    pass
+
+class LeagueUpdate(BaseModel):
+    name: Optional[str] = Field(None, min_length=3, max_length=100)
+    rating_system: Optional[str] = None
+
+    @validator('rating_system')
+    def rating_system_known(cls, v):
+        return _check_rating_system(v)
+
+class League(LeagueBase):
+    id: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class LeagueRating(BaseModel):
+    player_id: int
+    rating: float
+    deviation: Optional[float] = None
+    volatility: Optional[float] = None
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
+from app.utils.constants import MAX_BULK_MATCHES
+
 class SetCreate(BaseModel):
     set_number: int 
     score_p1: int 
@@ -15,15 +17,40 @@ class MatchBase(BaseModel):
     player2_id: int = Field(..., description="ID of the second player")
     sets: List[SetCreate]
     tournament_id: Optional[int] = Field(None, description="ID of the tournament if part of one")
+    league_id: Optional[int] = Field(None, description="ID of the league if part of one")
 
 class MatchUpdate(MatchBase):
     pass
     
 class MatchCreate(MatchBase):
-    pass
+    created_at: Optional[datetime] = Field(None, description="When the match was played; defaults to now")
 
 class Match(MatchBase):
     id : int
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class MatchBulkCreate(BaseModel):
+    matches: List[MatchCreate] = Field(..., min_length=1, max_length=MAX_BULK_MATCHES)
+
+class MatchBulkError(BaseModel):
+    index: int = Field(..., description="Position of the rejected match in the request")
+    detail: str
+
+class MatchBulkResult(BaseModel):
+    created: int
+    match_ids: List[Optional[int]] = Field(..., description="ID of each match in request order, null if rejected")
+    errors: List[MatchBulkError]
+
+class MatchImportError(BaseModel):
+    line: int = Field(..., description="Line of the rejected record in the file")
+    detail: str
+
+class MatchImportResult(BaseModel):
+    source: Optional[str] = None
+    resumed_from: int = Field(0, description="Last line already imported before this run")
+    lines: int = Field(0, description="Last line processed")
+    imported: int = 0
+    rejected: int = 0
+    errors: List[MatchImportError] = Field(default_factory=list, description="First rejected lines")
@@ -41,6 +41,7 @@ class Player(PlayerBase):
     last_login: Optional[datetime] = None
     avatar_url: Optional[HttpUrl] = None
     bio: Optional[str] = None
+    rating: Optional[float] = None
 
     class Config:
         from_attributes = True
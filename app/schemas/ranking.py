@@ -0,0 +1,33 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+class RankingEntry(BaseModel):
+    rank: int
+    player_id: int
+    username: Optional[str] = None
+    rating: float
+    category: str
+
+class RankingPage(BaseModel):
+    page: int
+    page_size: int
+    total: int
+    category: Optional[str] = None
+    entries: List[RankingEntry]
+
+class PlayerRanking(BaseModel):
+    player_id: int
+    username: Optional[str] = None
+    rating: float
+    rank: int
+    percentile: float
+    category: str
+    category_rank: int
+    category_percentile: float
+
+class CategorySummary(BaseModel):
+    category: str
+    min_rating: int
+    max_rating: int
+    players: int
+    percentage: float
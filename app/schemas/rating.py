@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel
+
+class RatingPoint(BaseModel):
+    match_id: int
+    played_at: datetime
+    rating: float
+    change: float
+
+class RatingHistory(BaseModel):
+    player_id: int
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    # Partidas no intervalo, antes da redução de pontos
+    total_points: int
+    downsampled: bool
+    points: List[RatingPoint]
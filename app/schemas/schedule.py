@@ -0,0 +1,42 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field, validator
+
+from app.utils.constants import MAX_PLAYERS_SCHEDULE, MAX_SCHEDULE_TABLES
+
+class ScheduleRequest(BaseModel):
+    player_ids: List[int] = Field(..., min_length=2, max_length=MAX_PLAYERS_SCHEDULE)
+    tables: int = Field(..., ge=1, le=MAX_SCHEDULE_TABLES, description="Tables available in each time slot")
+
+    @validator('player_ids')
+    def players_unique(cls, v):
+        if len(set(v)) != len(v):
+            raise ValueError('player_ids must be unique')
+        return v
+
+class SwissRoundRequest(ScheduleRequest):
+    tournament_id: Optional[int] = Field(
+        None,
+        description="Event whose matches give the scores and the pairs already played; "
+                    "without it every past meeting counts as played"
+    )
+
+class ScheduledMatch(BaseModel):
+    round: int
+    slot: int
+    table: int
+    player1_id: int
+    player2_id: int
+
+class ScheduledBye(BaseModel):
+    round: int
+    player_id: int
+
+class Schedule(BaseModel):
+    rounds: int
+    slots: int
+    matches: List[ScheduledMatch]
+    byes: List[ScheduledBye]
+
+class SwissRound(Schedule):
+    round_number: int = Field(..., description="Round of the event being paired")
+    rematches: int = Field(0, description="Pairs that had already played; 0 unless unavoidable")
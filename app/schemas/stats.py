@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel
+
+class PlayerStats(BaseModel):
+    player_id: int
+    matches_played: int = 0
+    wins: int = 0
+    losses: int = 0
+    win_percentage: float = 0.0
+    sets_won: int = 0
+    sets_lost: int = 0
+    points_won: int = 0
+    points_lost: int = 0
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class HeadToHead(BaseModel):
+    """Record of player_id against opponent_id, from player_id's side"""
+    player_id: int
+    opponent_id: int
+    matches_played: int = 0
+    wins: int = 0
+    losses: int = 0
+    sets_won: int = 0
+    sets_lost: int = 0
+    set_differential: int = 0
+    last_match_at: Optional[datetime] = None
+
+class HeadToHeadMatrix(BaseModel):
+    player_ids: List[int]
+    # wins[i][j]: vitórias de player_ids[i] sobre player_ids[j]
+    wins: List[List[int]]
+    # Um registro por par que já se enfrentou, do lado do primeiro da lista
+    records: List[HeadToHead]
@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field, validator
+
+from app.utils.constants import (
+    DEFAULT_TOURNAMENT_SIMULATIONS,
+    MAX_PLAYERS_TOURNAMENT,
+    MAX_TOURNAMENT_SIMULATIONS,
+    MIN_PLAYERS_TOURNAMENT
+)
+
+class TournamentPlayers(BaseModel):
+    player_ids: List[int] = Field(
+        ..., min_length=MIN_PLAYERS_TOURNAMENT, max_length=MAX_PLAYERS_TOURNAMENT
+    )
+    seeded_player_ids: List[int] = Field(default_factory=list, description="Seeds, best first")
+
+    @validator('player_ids')
+    def players_unique(cls, v):
+        if len(set(v)) != len(v):
+            raise ValueError('player_ids must be unique')
+        return v
+
+    @validator('seeded_player_ids')
+    def seeds_are_players(cls, v, values):
+        if len(set(v)) != len(v):
+            raise ValueError('seeded_player_ids must be unique')
+        if 'player_ids' in values and not set(v) <= set(values['player_ids']):
+            raise ValueError('seeded_player_ids must be a subset of player_ids')
+        return v
+
+class TournamentSimulationRequest(TournamentPlayers):
+    tournament_id: Optional[int] = Field(None, description="ID of the tournament being simulated")
+    simulations: int = Field(DEFAULT_TOURNAMENT_SIMULATIONS, ge=1, le=MAX_TOURNAMENT_SIMULATIONS)
+    seed: Optional[int] = Field(None, description="Random seed, for reproducible results")
+
+class TournamentCreate(TournamentPlayers):
+    name: str = Field(..., min_length=3, max_length=100)
+    league_id: Optional[int] = None
+
+class BracketSlot(BaseModel):
+    position: int
+    player1_id: Optional[int] = None
+    player2_id: Optional[int] = None
+    winner_id: Optional[int] = None
+    match_id: Optional[int] = Field(None, description="Match that decided the slot; None for a bye")
+
+class BracketRound(BaseModel):
+    number: int
+    name: str
+    completed_at: Optional[datetime] = None
+    slots: List[BracketSlot]
+
+class TournamentBracket(BaseModel):
+    id: int
+    name: str
+    league_id: Optional[int] = None
+    status: str
+    bracket_size: int
+    winner_id: Optional[int] = None
+    created_at: datetime
+    rounds: List[BracketRound]
+
+class PlayerOutcome(BaseModel):
+    player_id: int
+    rating: float
+    round_probabilities: List[float] = Field(
+        ..., description="Probability of reaching each round, first round first"
+    )
+    win_probability: float
+
+class TournamentSimulation(BaseModel):
+    tournament_id: Optional[int] = None
+    simulations: int
+    rounds: int
+    players: List[PlayerOutcome]
@@ -0,0 +1,183 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.achievement import AchievementProgress, PlayerAchievement
+from app.models.match import Match
+from app.models.match_participant import MatchParticipant
+from app.models.player import Player
+from app.schemas.achievement import Achievement, PlayerAchievements
+from app.utils.achievements import AchievementEngine, Award, PlayerProgress
+from app.utils.constants import ACHIEVEMENT_BATCH_SIZE, ACHIEVEMENTS
+
+# Conquistas derivadas só do histórico de partidas (recalculáveis por replay)
+MATCH_ACHIEVEMENTS = ('winning_streak', 'matches_played')
+PROGRESS_COLUMNS = PlayerProgress.__slots__
+
+
+class AchievementService:
+    def __init__(self, db: Session, thresholds: Dict[str, Dict[str, int]] = ACHIEVEMENTS):
+        self.db = db
+        self.thresholds = thresholds
+        self.engine = AchievementEngine(thresholds)
+
+    def record_match(self, match: Match) -> None:
+        """Consome uma partida nova; retroativa, refaz o histórico dos jogadores afetados; não faz commit"""
+        self.record_matches([
+            (match.id, match.player1_id, match.player2_id, match.winner_id, match.created_at)
+        ])
+
+    def record_matches(self, matches: Iterable[Tuple[int, int, int, int, datetime]]) -> None:
+        """Consome partidas novas em ordem cronológica; quem tem partida retroativa é refeito uma vez; não faz commit"""
+        matches = sorted(matches, key=lambda m: (m[4], m[0]))
+        players = {player_id for m in matches for player_id in m[1:3]}
+        self._load(players)
+        # Jogadores com alguma partida nova anterior à última já consumida
+        stale = {
+            player_id
+            for match_id, player1_id, player2_id, _, played_at in matches
+            for player_id in (player1_id, player2_id)
+            if not self.engine.get(player_id).is_after_last(played_at, match_id)
+        }
+        current = players - stale
+
+        awards: List[Award] = []
+        for match_id, player1_id, player2_id, winner_id, played_at in matches:
+            for player_id in (player1_id, player2_id):
+                if player_id in current:
+                    awards += self.engine.record_result(player_id, winner_id == player_id, match_id, played_at)
+        self._save(sorted(current), awards)
+
+        if stale:
+            self.replay_players(stale)
+
+    def record_tournament_win(self, player_id: int, won_at: datetime) -> None:
+        """Conta um título de torneio para o jogador; não faz commit"""
+        self._load([player_id])
+        self._save([player_id], self.engine.record_tournament_win(player_id, won_at))
+
+    def remove_tournament_win(self, player_id: int) -> None:
+        """Desconta um título do jogador, revogando a conquista que ele rendeu; não faz commit"""
+        self._load([player_id])
+        level = self.engine.remove_tournament_win(player_id)
+        if level is not None:
+            self.db.execute(
+                delete(PlayerAchievement).where(
+                    PlayerAchievement.player_id == player_id,
+                    PlayerAchievement.achievement == 'tournaments_won',
+                    PlayerAchievement.level == level
+                )
+            )
+        self._save([player_id], [])
+
+    def replay_players(self, player_ids: Iterable[int]) -> None:
+        """Recalcula contadores e conquistas de partidas dos jogadores a partir do histórico; não faz commit"""
+        self.db.flush()
+        player_ids = sorted(set(player_ids))
+        self._load(player_ids)
+        self.db.execute(
+            delete(PlayerAchievement).where(
+                PlayerAchievement.player_id.in_(player_ids),
+                PlayerAchievement.achievement.in_(MATCH_ACHIEVEMENTS)
+            )
+        )
+
+        awards: List[Award] = []
+        for player_id in player_ids:
+            previous = self.engine.get(player_id)
+            self.engine.progress[player_id] = PlayerProgress(tournaments_won=previous.tournaments_won)
+            history = self.db.execute(
+                select(MatchParticipant.match_id, MatchParticipant.won, MatchParticipant.created_at)
+                .where(MatchParticipant.player_id == player_id)
+                .order_by(MatchParticipant.created_at, MatchParticipant.match_id)
+                .execution_options(yield_per=ACHIEVEMENT_BATCH_SIZE)
+            )
+            for match_id, won, played_at in history:
+                awards += self.engine.record_result(player_id, won, match_id, played_at)
+        self._save(player_ids, awards)
+
+    def backfill(self, batch_size: int = ACHIEVEMENT_BATCH_SIZE) -> int:
+        """Recalcula contadores e conquistas de todos percorrendo o histórico com um cursor no servidor"""
+        try:
+            titles = dict(self.db.execute(
+                select(AchievementProgress.player_id, AchievementProgress.tournaments_won)
+                .where(AchievementProgress.tournaments_won > 0)
+            ).all())
+            self.db.execute(delete(PlayerAchievement).where(PlayerAchievement.achievement.in_(MATCH_ACHIEVEMENTS)))
+            self.db.execute(delete(AchievementProgress))
+
+            self.engine = AchievementEngine(self.thresholds)
+            for player_id, tournaments_won in titles.items():
+                self.engine.get(player_id).tournaments_won = tournaments_won
+
+            history = self.db.execute(
+                select(Match.id, Match.player1_id, Match.player2_id, Match.winner_id, Match.created_at)
+                .order_by(Match.created_at, Match.id)
+                .execution_options(yield_per=batch_size)
+            )
+            pending = []
+            for award in self.engine.consume(history):
+                pending.append(award._asdict())
+                if len(pending) >= batch_size:
+                    self.db.execute(insert(PlayerAchievement), pending)
+                    pending = []
+            if pending:
+                self.db.execute(insert(PlayerAchievement), pending)
+
+            rows = [self._progress_row(player_id) for player_id in self.engine.progress]
+            for offset in range(0, len(rows), batch_size):
+                self.db.execute(insert(AchievementProgress), rows[offset:offset + batch_size])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return sum(progress.matches_played for progress in self.engine.progress.values()) // 2
+
+    def get_player_achievements(self, player_id: int) -> PlayerAchievements:
+        progress = self.db.get(AchievementProgress, player_id)
+        if progress is None and self.db.get(Player, player_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Player not found"
+            )
+        achievements = (
+            self.db.query(PlayerAchievement)
+            .filter(PlayerAchievement.player_id == player_id)
+            .order_by(PlayerAchievement.awarded_at, PlayerAchievement.id)
+            .all()
+        )
+        counters = {} if progress is None else {
+            name: getattr(progress, name)
+            for name in ("matches_played", "current_streak", "best_streak", "tournaments_won")
+        }
+        return PlayerAchievements(
+            player_id=player_id,
+            achievements=[Achievement.model_validate(a) for a in achievements],
+            **counters
+        )
+
+    def _load(self, player_ids: Iterable[int]) -> None:
+        player_ids = list(player_ids)
+        for player_id in player_ids:
+            self.engine.progress[player_id] = PlayerProgress()
+        rows = self.db.query(AchievementProgress).filter(AchievementProgress.player_id.in_(player_ids))
+        for row in rows:
+            self.engine.progress[row.player_id] = PlayerProgress(
+                **{name: getattr(row, name) for name in PROGRESS_COLUMNS}
+            )
+
+    def _save(self, player_ids: Iterable[int], awards: List[Award]) -> None:
+        for player_id in player_ids:
+            self.db.merge(AchievementProgress(**self._progress_row(player_id)))
+        if awards:
+            self.db.execute(insert(PlayerAchievement), [award._asdict() for award in awards])
+        self.db.flush()
+
+    def _progress_row(self, player_id: int) -> dict:
+        progress = self.engine.progress[player_id]
+        row = {name: getattr(progress, name) for name in PROGRESS_COLUMNS}
+        row["player_id"] = player_id
+        return row
@@ -0,0 +1,27 @@
+from typing import Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+
+from app.core.cache import run_cache_io
+from app.utils.cache import CacheBackend
+
+T = TypeVar("T")
+
+
+class AsyncService:
+    """Base dos serviços de leitura assíncronos; só consultas em run(), nada de CPU ou cache no event loop"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def run(self, work: Callable[[Session], T]) -> T:
+        return await self.db.run_sync(work)
+
+    async def cached_count(self, cache: CacheBackend, key: str, query: Callable[[Session], Query]) -> int:
+        """cached_count com o cache fora do event loop e o COUNT em run()"""
+        total = await run_cache_io(cache.get, key)
+        if total is None:
+            total = await self.run(lambda db: query(db).order_by(None).count())
+            await run_cache_io(cache.set, key, total)
+        return total
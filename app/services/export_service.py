@@ -0,0 +1,132 @@
+import csv
+import io
+import json
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.models.match import Match
+from app.models.match_participant import MatchParticipant
+from app.models.player import Player
+from app.models.set import Set
+from app.utils.constants import EXPORT_BATCH_SIZE
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+# Mesmos campos do schema Player, sem a senha
+PLAYER_EXPORT_COLUMNS = (
+    "id", "username", "email", "full_name", "is_active", "is_admin", "rating",
+    "created_at", "updated_at", "last_login", "avatar_url", "bio",
+)
+MATCH_EXPORT_COLUMNS = (
+    "id", "player1_id", "player2_id", "winner_id", "tournament_id", "league_id",
+    "created_at", "updated_at",
+)
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ExportService:
+    """Exporta tabelas inteiras como NDJSON ou CSV em blocos de texto, com memória constante"""
+
+    def __init__(self, db: Session, batch_size: int = EXPORT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+
+    def export_players(self, fmt: str, active_only: bool = False) -> Iterator[str]:
+        statement = select(*(getattr(Player, name) for name in PLAYER_EXPORT_COLUMNS)).order_by(Player.id)
+        if active_only:
+            statement = statement.where(Player.is_active == True)
+        records = (dict(zip(PLAYER_EXPORT_COLUMNS, row)) for row in self._stream(statement))
+        return self._write(records, fmt, PLAYER_EXPORT_COLUMNS)
+
+    def export_matches(
+        self,
+        fmt: str,
+        player_id: Optional[int] = None,
+        tournament_id: Optional[int] = None
+    ) -> Iterator[str]:
+        """Exporta as partidas com os sets, lidos de um único outer join ordenado"""
+        statement = (
+            select(
+                *(getattr(Match, name) for name in MATCH_EXPORT_COLUMNS),
+                Set.set_number, Set.score_p1, Set.score_p2
+            )
+            .outerjoin(Set, Set.match_id == Match.id)
+            .order_by(Match.id, Set.set_number)
+        )
+        if player_id:
+            statement = statement.where(Match.id.in_(
+                select(MatchParticipant.match_id).where(MatchParticipant.player_id == player_id)
+            ))
+        if tournament_id:
+            statement = statement.where(Match.tournament_id == tournament_id)
+
+        width = len(MATCH_EXPORT_COLUMNS)
+
+        def records() -> Iterator[dict]:
+            for _, rows in groupby(self._stream(statement), key=itemgetter(0)):
+                rows = list(rows)
+                record = dict(zip(MATCH_EXPORT_COLUMNS, rows[0][:width]))
+                record["sets"] = [
+                    {"set_number": number, "score_p1": score_p1, "score_p2": score_p2}
+                    for number, score_p1, score_p2 in (row[width:] for row in rows)
+                    if number is not None
+                ]
+                yield record
+
+        return self._write(records(), fmt, MATCH_EXPORT_COLUMNS + ("sets",))
+
+    def _stream(self, statement: Select) -> Iterator[Sequence]:
+        # A sessão de get_db já foi fechada quando a resposta começa a ser
+        # enviada; o gerador reabre a conexão e a devolve ao terminar
+        try:
+            yield from self.db.execute(statement.execution_options(yield_per=self.batch_size))
+        finally:
+            self.db.close()
+
+    def _write(self, records: Iterable[dict], fmt: str, columns: Sequence[str]) -> Iterator[str]:
+        buffer = io.StringIO()
+        if fmt == "ndjson":
+            encode = json.JSONEncoder(default=_json_default, ensure_ascii=False).encode
+
+            def write(record: dict) -> None:
+                buffer.write(encode(record))
+                buffer.write("\n")
+        elif fmt == "csv":
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+
+            def write(record: dict) -> None:
+                writer.writerow([self._csv_value(record[name]) for name in columns])
+        else:
+            raise ValueError(f"Unknown export format {fmt!r}; use one of {tuple(EXPORT_FORMATS)}")
+
+        # Um pedaço da resposta a cada batch_size registros
+        for count, record in enumerate(records, start=1):
+            write(record)
+            if count % self.batch_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @staticmethod
+    def _csv_value(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, list):
+            # Mesmo formato aceito por import-matches: "11-5 9-11 11-7"
+            return " ".join(f"{s['score_p1']}-{s['score_p2']}" for s in value)
+        return value
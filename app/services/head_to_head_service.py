@@ -0,0 +1,237 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, and_, case, delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.db.upsert import upsert_increment
+from app.models.match import Match
+from app.models.match_participant import MatchParticipant
+from app.models.player import Player
+from app.models.set import Set
+from app.models.stats import HeadToHead
+from app.schemas.stats import HeadToHead as HeadToHeadSchema, HeadToHeadMatrix
+from app.services.stats_service import SetScores
+from app.utils.constants import MAX_PLAYERS_TOURNAMENT
+
+H2H_COUNTERS = ("matches_played", "low_wins", "high_wins", "low_sets", "high_sets")
+
+
+def pair_key(player_a: int, player_b: int) -> Tuple[int, int]:
+    """Chave canônica (menor id, maior id) de um par de jogadores"""
+    return (player_a, player_b) if player_a < player_b else (player_b, player_a)
+
+
+def _pair_counters(player1_id: int, player2_id: int, winner_id: int, sets: SetScores) -> Dict[str, int]:
+    """Chave e contadores que uma partida soma à linha do seu par"""
+    low, high = pair_key(player1_id, player2_id)
+    sets = list(sets)
+    sets_p1 = sum(1 for score_p1, score_p2 in sets if score_p1 > score_p2)
+    sets_p2 = sum(1 for score_p1, score_p2 in sets if score_p2 > score_p1)
+    return {
+        "player_low_id": low,
+        "player_high_id": high,
+        "matches_played": 1,
+        "low_wins": int(winner_id == low),
+        "high_wins": int(winner_id == high),
+        "low_sets": sets_p1 if low == player1_id else sets_p2,
+        "high_sets": sets_p2 if low == player1_id else sets_p1,
+    }
+
+
+def _latest(excluded):
+    # Partidas retroativas não podem recuar a data do último confronto
+    return {
+        "last_match_at": case(
+            (excluded.last_match_at > HeadToHead.last_match_at, excluded.last_match_at),
+            else_=HeadToHead.last_match_at
+        )
+    }
+
+
+class HeadToHeadService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply_result(
+        self,
+        player1_id: int,
+        player2_id: int,
+        winner_id: int,
+        sets: SetScores,
+        played_at: datetime
+    ) -> None:
+        """Soma uma partida ao confronto do par com um único upsert; não faz commit"""
+        self.apply_results([(player1_id, player2_id, winner_id, sets, played_at)])
+
+    def apply_results(self, results: Iterable[Tuple[int, int, int, SetScores, datetime]]) -> None:
+        """Soma várias partidas (player1, player2, vencedor, sets, data) com um único upsert por par; não faz commit"""
+        pairs: Dict[Tuple[int, int], Dict] = {}
+        for player1_id, player2_id, winner_id, sets, played_at in results:
+            row = _pair_counters(player1_id, player2_id, winner_id, sets)
+            key = (row["player_low_id"], row["player_high_id"])
+            total = pairs.get(key)
+            if total is None:
+                row["last_match_at"] = played_at
+                pairs[key] = row
+                continue
+            for name in H2H_COUNTERS:
+                total[name] += row[name]
+            total["last_match_at"] = max(total["last_match_at"], played_at)
+        upsert_increment(
+            self.db, HeadToHead, ["player_low_id", "player_high_id"], list(pairs.values()),
+            H2H_COUNTERS, updates=_latest
+        )
+
+    def remove_result(
+        self,
+        match_id: int,
+        player1_id: int,
+        player2_id: int,
+        winner_id: int,
+        sets: SetScores
+    ) -> None:
+        """Subtrai uma partida do confronto, removendo a linha sem encontros restantes; não faz commit"""
+        row = _pair_counters(player1_id, player2_id, winner_id, sets)
+        low, high = row["player_low_id"], row["player_high_id"]
+        pair = and_(HeadToHead.player_low_id == low, HeadToHead.player_high_id == high)
+
+        remaining = (
+            select(func.max(MatchParticipant.created_at))
+            .where(
+                MatchParticipant.player_id == low,
+                MatchParticipant.opponent_id == high,
+                MatchParticipant.match_id != match_id
+            )
+            .scalar_subquery()
+        )
+        self.db.execute(
+            HeadToHead.__table__.update()
+            .where(pair)
+            .values(
+                **{name: getattr(HeadToHead, name) - row[name] for name in H2H_COUNTERS},
+                last_match_at=func.coalesce(remaining, HeadToHead.last_match_at),
+                updated_at=datetime.now()
+            )
+        )
+        self.db.execute(delete(HeadToHead).where(pair, HeadToHead.matches_played <= 0))
+
+    def remove_match(self, match: Match) -> None:
+        """Subtrai uma partida que será excluída; não faz commit"""
+        self.remove_result(
+            match.id,
+            match.player1_id,
+            match.player2_id,
+            match.winner_id,
+            [(s.score_p1, s.score_p2) for s in match.sets]
+        )
+
+    def get_pair(self, player_id: int, opponent_id: int) -> HeadToHeadSchema:
+        self._check_players([player_id, opponent_id])
+        record = self.db.get(HeadToHead, pair_key(player_id, opponent_id))
+        if record is None:
+            return HeadToHeadSchema(player_id=player_id, opponent_id=opponent_id)
+        return self._to_schema(record, player_id)
+
+    def get_matrix(self, player_ids: List[int]) -> HeadToHeadMatrix:
+        """Confrontos entre todos os pares de player_ids, lidos com uma única consulta"""
+        player_ids = list(dict.fromkeys(player_ids))
+        if len(player_ids) > MAX_PLAYERS_TOURNAMENT:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_PLAYERS_TOURNAMENT} players per matrix"
+            )
+
+        position = {player_id: index for index, player_id in enumerate(player_ids)}
+        wins = [[0] * len(player_ids) for _ in player_ids]
+        records = []
+        rows = self.db.query(HeadToHead).filter(
+            HeadToHead.player_low_id.in_(player_ids),
+            HeadToHead.player_high_id.in_(player_ids)
+        ).all()
+        for row in sorted(rows, key=lambda r: sorted((position[r.player_low_id], position[r.player_high_id]))):
+            low, high = position[row.player_low_id], position[row.player_high_id]
+            wins[low][high] = row.low_wins
+            wins[high][low] = row.high_wins
+            first = row.player_low_id if low < high else row.player_high_id
+            records.append(self._to_schema(row, first))
+
+        return HeadToHeadMatrix(player_ids=player_ids, wins=wins, records=records)
+
+    def rebuild(self) -> int:
+        """Recalcula todos os confrontos com um INSERT ... SELECT; retorna o número de pares"""
+        set_totals = (
+            select(
+                Set.match_id,
+                func.sum(case((Set.score_p1 > Set.score_p2, 1), else_=0)).label("sets_p1"),
+                func.sum(case((Set.score_p2 > Set.score_p1, 1), else_=0)).label("sets_p2"),
+            )
+            .group_by(Set.match_id)
+            .subquery()
+        )
+        p1_is_low = Match.player1_id < Match.player2_id
+        low = case((p1_is_low, Match.player1_id), else_=Match.player2_id)
+        high = case((p1_is_low, Match.player2_id), else_=Match.player1_id)
+        sets_p1 = func.coalesce(set_totals.c.sets_p1, 0)
+        sets_p2 = func.coalesce(set_totals.c.sets_p2, 0)
+        totals = (
+            select(
+                low,
+                high,
+                func.count(),
+                func.sum(case((Match.winner_id == low, 1), else_=0)),
+                func.sum(case((Match.winner_id == high, 1), else_=0)),
+                func.sum(case((p1_is_low, sets_p1), else_=sets_p2)),
+                func.sum(case((p1_is_low, sets_p2), else_=sets_p1)),
+                func.max(Match.created_at),
+                literal(datetime.now(), DateTime),
+            )
+            .select_from(Match)
+            .outerjoin(set_totals, set_totals.c.match_id == Match.id)
+            .group_by(low, high)
+        )
+
+        try:
+            self.db.execute(delete(HeadToHead))
+            self.db.execute(
+                insert(HeadToHead).from_select(
+                    ["player_low_id", "player_high_id", *H2H_COUNTERS, "last_match_at", "updated_at"],
+                    totals
+                )
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self.db.scalar(select(func.count()).select_from(HeadToHead))
+
+    def _check_players(self, player_ids: List[int]) -> None:
+        found = set(self.db.scalars(select(Player.id).where(Player.id.in_(player_ids))))
+        missing = [player_id for player_id in player_ids if player_id not in found]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Players not found: {', '.join(map(str, missing))}"
+            )
+
+    def _to_schema(self, record: HeadToHead, player_id: int) -> HeadToHeadSchema:
+        if player_id == record.player_low_id:
+            opponent_id = record.player_high_id
+            wins, losses = record.low_wins, record.high_wins
+            sets_won, sets_lost = record.low_sets, record.high_sets
+        else:
+            opponent_id = record.player_low_id
+            wins, losses = record.high_wins, record.low_wins
+            sets_won, sets_lost = record.high_sets, record.low_sets
+        return HeadToHeadSchema(
+            player_id=player_id,
+            opponent_id=opponent_id,
+            matches_played=record.matches_played,
+            wins=wins,
+            losses=losses,
+            sets_won=sets_won,
+            sets_lost=sets_lost,
+            set_differential=sets_won - sets_lost,
+            last_match_at=record.last_match_at
+        )
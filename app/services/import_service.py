@@ -0,0 +1,133 @@
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.match_import import ImportCheckpoint
+from app.models.player import Player
+from app.schemas.match import MatchCreate, MatchImportError, MatchImportResult
+from app.services.match_service import MatchService
+from app.utils.cache import TTLCache
+from app.utils.constants import IMPORT_CHUNK_SIZE, IMPORT_USERNAME_CACHE_SIZE, MAX_IMPORT_ERRORS
+from app.utils.match_import import ParsedLine, chunked, read_records
+
+# Cache só dura a importação; o TTL apenas limita o uso de memória
+USERNAME_CACHE_TTL = 3600
+
+
+class MatchImportService:
+    def __init__(self, db: Session, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.match_service = MatchService(db)
+        self.usernames = TTLCache(USERNAME_CACHE_TTL, maxsize=IMPORT_USERNAME_CACHE_SIZE)
+
+    def import_lines(
+        self,
+        lines: Iterable[str],
+        fmt: str,
+        source: Optional[str] = None,
+        resume: bool = False,
+        progress: Optional[Callable[[MatchImportResult], None]] = None
+    ) -> MatchImportResult:
+        """Importa um CSV ou NDJSON em lotes de chunk_size; o checkpoint de source permite retomar após o último lote"""
+        result = MatchImportResult(source=source)
+        checkpoint = None
+        if source is not None:
+            checkpoint = self.db.get(ImportCheckpoint, source)
+            if checkpoint is None:
+                checkpoint = ImportCheckpoint(source=source, line=0, imported=0, rejected=0)
+                self.db.add(checkpoint)
+            elif resume:
+                result.resumed_from = result.lines = checkpoint.line
+                result.imported, result.rejected = checkpoint.imported, checkpoint.rejected
+            else:
+                checkpoint.line = checkpoint.imported = checkpoint.rejected = 0
+
+        try:
+            records = read_records(lines, fmt)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        pending = (parsed for parsed in records if parsed[0] > result.resumed_from)
+
+        for chunk in chunked(pending, self.chunk_size):
+            self._import_chunk(chunk, result, checkpoint)
+            if progress is not None:
+                progress(result)
+        self.db.commit()
+        return result
+
+    def resolve_usernames(self, usernames: Set[str]) -> Dict[str, int]:
+        """Ids dos usernames, consultando só os ausentes do cache com um único IN"""
+        found = {}
+        missing = []
+        for username in usernames:
+            player_id = self.usernames.get(username)
+            if player_id is None:
+                missing.append(username)
+            else:
+                found[username] = player_id
+        if missing:
+            rows = self.db.execute(select(Player.username, Player.id).where(Player.username.in_(missing)))
+            for username, player_id in rows:
+                self.usernames.set(username, player_id)
+                found[username] = player_id
+        return found
+
+    def _import_chunk(
+        self,
+        chunk: List[ParsedLine],
+        result: MatchImportResult,
+        checkpoint: Optional[ImportCheckpoint]
+    ) -> None:
+        usernames = {
+            record[name] for _, record, _ in chunk if record is not None
+            for name in ("player1", "player2")
+        }
+        ids = self.resolve_usernames(usernames)
+
+        lines: List[int] = []
+        matches: List[MatchCreate] = []
+        for line, record, error in chunk:
+            if error is None:
+                unknown = [record[name] for name in ("player1", "player2") if record[name] not in ids]
+                if unknown:
+                    error = f"Player not found: {', '.join(unknown)}"
+            if error is None:
+                try:
+                    matches.append(MatchCreate(
+                        player1_id=ids[record["player1"]],
+                        player2_id=ids[record["player2"]],
+                        sets=[
+                            {"set_number": number, "score_p1": score_p1, "score_p2": score_p2}
+                            for number, (score_p1, score_p2) in enumerate(record["sets"], start=1)
+                        ],
+                        created_at=record["played_at"],
+                        tournament_id=record["tournament_id"],
+                        league_id=record["league_id"],
+                    ))
+                    lines.append(line)
+                    continue
+                except ValidationError as e:
+                    error = str(e)
+            self._reject(result, line, error)
+
+        result.lines = chunk[-1][0]
+        if checkpoint is not None:
+            # Gravado na mesma transação das partidas do lote
+            checkpoint.line = result.lines
+        if matches:
+            bulk = self.match_service.create_matches_bulk(matches)
+            result.imported += bulk.created
+            for error in bulk.errors:
+                self._reject(result, lines[error.index], error.detail)
+        if checkpoint is not None:
+            checkpoint.imported, checkpoint.rejected = result.imported, result.rejected
+        self.db.commit()
+
+    def _reject(self, result: MatchImportResult, line: int, detail: str) -> None:
+        result.rejected += 1
+        if len(result.errors) < MAX_IMPORT_ERRORS:
+            result.errors.append(MatchImportError(line=line, detail=detail))
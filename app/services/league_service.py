@@ -0,0 +1,95 @@
+from typing import List, Optional
+
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache, get_versions
+from app.models.league import League
+from app.schemas.league import LeagueCreate, LeagueRating, LeagueUpdate
+from app.services.rating_service import RatingService
+from app.utils.constants import CACHE_TTL, RATING_PERIOD_DAYS
+from app.utils.rating_systems import get_rating_system
+
+# Ratings por liga, sistema e versão da liga (avançada a cada escrita nas suas partidas)
+ratings_cache = get_cache("league_ratings", CACHE_TTL['league_ratings'])
+
+class LeagueService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_id(self, league_id: int) -> Optional[League]:
+        return self.db.query(League).filter(League.id == league_id).first()
+
+    def get_by_name(self, name: str) -> Optional[League]:
+        return self.db.query(League).filter(League.name == name).first()
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[League]:
+        return self.db.query(League).order_by(League.id).offset(skip).limit(limit).all()
+
+    def create(self, league_create: LeagueCreate) -> League:
+        if self.get_by_name(league_create.name):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="League name already registered"
+            )
+
+        league = League(name=league_create.name, rating_system=league_create.rating_system)
+        self.db.add(league)
+        self.db.commit()
+        self.db.refresh(league)
+        return league
+
+    def update(self, league: League, league_update: LeagueUpdate) -> League:
+        update_data = league_update.model_dump(exclude_unset=True)
+
+        if "name" in update_data and update_data["name"] != league.name:
+            if self.get_by_name(update_data["name"]):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="League name already registered"
+                )
+
+        for field, value in update_data.items():
+            if value is not None:
+                setattr(league, field, value)
+
+        self.db.add(league)
+        self.db.commit()
+        self.db.refresh(league)
+        return league
+
+    def get_ratings(self, league: League) -> List[LeagueRating]:
+        """Ratings da liga pelo seu sistema, um período de RATING_PERIOD_DAYS por vez, do maior para o menor"""
+        version, modified_at = get_versions().get(f"league:{league.id}")
+        cache_key = f"{league.id}:{league.rating_system}:{version}:{modified_at}"
+        cached = ratings_cache.get(cache_key)
+        if cached is not None:
+            return [LeagueRating(**row) for row in cached]
+
+        ratings = self._compute_ratings(league)
+        ratings_cache.set(cache_key, [rating.model_dump() for rating in ratings])
+        return ratings
+
+    def _compute_ratings(self, league: League) -> List[LeagueRating]:
+        """Recalcula os ratings da liga a partir de todas as suas partidas"""
+        history = RatingService(self.db).load_history(league_id=league.id)
+        if not len(history.match_ids):
+            return []
+
+        days = np.asarray(history.created_at.tolist(), dtype="datetime64[D]").astype(np.int64)
+        system = get_rating_system(league.rating_system)
+        state = system.replay(
+            history.player1_ids,
+            history.player2_ids,
+            history.player1_won,
+            days // RATING_PERIOD_DAYS
+        )
+
+        players = np.unique(np.concatenate((history.player1_ids, history.player2_ids)))
+        rows = state[players]
+        order = np.argsort(-rows[:, 0], kind="stable")
+        return [
+            LeagueRating(player_id=player_id, **dict(zip(system.columns, values)))
+            for player_id, values in zip(players[order].tolist(), rows[order].tolist())
+        ]
@@ -1,16 +1,99 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import Integer, column, insert, select, true, values
+from sqlalchemy.orm import Query, Session, selectinload
 from datetime import datetime
 
+from app.core.cache import get_cache, get_versions
+from app.db.pagination import KeysetPage, cached_count, paginate_keyset
+from app.models.league import League
 from app.models.match import Match
+from app.models.match_participant import MatchParticipant
+from app.models.player import Player
 from app.models.set import Set
-from app.schemas.match import MatchCreate, MatchUpdate
+from app.schemas.match import (
+    MatchBulkError,
+    MatchBulkResult,
+    MatchCreate,
+    MatchUpdate,
+    SetCreate,
+)
+from app.services.achievement_service import AchievementService
+from app.services.async_service import AsyncService
+from app.services.head_to_head_service import HeadToHeadService
+from app.services.participant_service import ParticipantService
+from app.services.player_service import invalidate_players
+from app.services.ranking_service import RankingService
+from app.services.rating_service import RatingService
+from app.services.stats_service import StatsService
+from app.services.tournament_service import BracketResult, TournamentService
+from app.utils.constants import CACHE_TTL
+from app.utils.helpers import validate_match_sets
+
+# Totais da listagem de partidas por filtro (jogador, torneio)
+count_cache = get_cache("match_counts", CACHE_TTL['counts'])
+
+# Colunas do schema Match (mais created_at, chave do cursor) lidas pelo caminho enxuto
+MATCH_ROW_COLUMNS = (
+    Match.id,
+    Match.player1_id,
+    Match.player2_id,
+    Match.tournament_id,
+    Match.league_id,
+    Match.created_at,
+)
+MatchRow = Dict[str, Any]
+
+
+def _count_key(player_id: Optional[int] = None, tournament_id: Optional[int] = None) -> str:
+    return f"{player_id or ''}:{tournament_id or ''}"
 
 class MatchService:
     def __init__(self, db: Session):
         self.db = db
+        self.rating_service = RatingService(db)
+        self.ranking_service = RankingService(db)
+        self.stats_service = StatsService(db)
+        self.head_to_head_service = HeadToHeadService(db)
+        self.achievement_service = AchievementService(db)
+        self.participant_service = ParticipantService(db)
+        self.tournament_service = TournamentService(db)
     
+    def _invalidate_counts(self, *matches: Tuple[int, int, Optional[int]]) -> None:
+        """Remove os totais em cache afetados por partidas (player1, player2, torneio)"""
+        keys = set()
+        for player1_id, player2_id, tournament_id in matches:
+            for player_id in (None, player1_id, player2_id):
+                keys.add(_count_key(player_id))
+                keys.add(_count_key(player_id, tournament_id))
+        for key in keys:
+            count_cache.delete(key)
+
+    def _bump_versions(self, match_ids: Iterable[int], league_ids: Iterable[Optional[int]] = ()) -> None:
+        """Avança as versões (ETag) das partidas, da listagem e das ligas afetadas; chamar após o commit"""
+        get_versions().bump(
+            "matches",
+            *(f"match:{match_id}" for match_id in match_ids),
+            *(f"league:{league_id}" for league_id in set(league_ids) if league_id is not None)
+        )
+
+    def _publish_ratings(self) -> None:
+        """Envia ao ranking os ratings alterados pela última escrita confirmada"""
+        self.ranking_service.update_ratings(self.rating_service.updated)
+        invalidate_players(self.rating_service.updated)
+        self.rating_service.updated.clear()
+
+    def _record_brackets(self, results: Iterable[BracketResult]) -> None:
+        """Avança as chaves dos torneios e conta os títulos decididos"""
+        for champion_id, won_at in self.tournament_service.record_results(results):
+            self.achievement_service.record_tournament_win(champion_id, won_at)
+
+    def _reset_bracket(self, match_id: int) -> None:
+        """Tira a partida da chave do torneio; numa final, desconta o título do campeão"""
+        champion_id = self.tournament_service.reset_result(match_id)
+        if champion_id is not None:
+            self.achievement_service.remove_tournament_win(champion_id)
+
     def determine_winner(self, sets: List[Set], player1_id: int, player2_id: int) -> int:
         """Determina o vencedor baseado nos sets"""
         sets_won_p1 = sum(1 for set_data in sets if set_data.score_p1 > set_data.score_p2)
@@ -18,65 +101,315 @@ class MatchService:
         
         return player1_id if sets_won_p1 > sets_won_p2 else player2_id
 
+    def _insert_match(self, row: Dict[str, Any], sets: List[SetCreate]) -> int:
+        """Insere a partida e os sets e retorna o id; no PostgreSQL em um só comando (CTE)"""
+        new_match = insert(Match).values(**row).returning(Match.id)
+        set_rows = [
+            {"set_number": s.set_number, "score_p1": s.score_p1, "score_p2": s.score_p2}
+            for s in sets
+        ]
+        if set_rows and self.db.get_bind().dialect.name == "postgresql":
+            new_match = new_match.cte("new_match")
+            scores = values(
+                column("set_number", Integer),
+                column("score_p1", Integer),
+                column("score_p2", Integer),
+                name="scores"
+            ).data([(r["set_number"], r["score_p1"], r["score_p2"]) for r in set_rows])
+            return self.db.scalars(
+                insert(Set)
+                .from_select(
+                    ["match_id", "set_number", "score_p1", "score_p2"],
+                    select(new_match.c.id, scores.c.set_number, scores.c.score_p1, scores.c.score_p2)
+                    .select_from(new_match)
+                    .join(scores, true())
+                )
+                .returning(Set.match_id)
+            ).first()
+
+        match_id = self.db.scalar(new_match)
+        if set_rows:
+            self.db.execute(insert(Set), [{"match_id": match_id, **r} for r in set_rows])
+        return match_id
+
     def create_match(self, match_data: MatchCreate) -> Match:
         try:
             winner_id = self.determine_winner(match_data.sets, match_data.player1_id, match_data.player2_id)
-            
-            match = Match(
-                player1_id=match_data.player1_id,
-                player2_id=match_data.player2_id,
-                tournament_id=match_data.tournament_id,
-                winner_id=winner_id
+            now = datetime.now()
+            row = {
+                "player1_id": match_data.player1_id,
+                "player2_id": match_data.player2_id,
+                "tournament_id": match_data.tournament_id,
+                "league_id": match_data.league_id,
+                "winner_id": winner_id,
+                "created_at": match_data.created_at or now,
+                "updated_at": now,
+            }
+            match_id = self._insert_match(row, match_data.sets)
+            # Instância transitória com os valores gravados: alimenta os serviços
+            # derivados e a resposta sem SELECT após o commit; nunca entra na sessão
+            match = Match(id=match_id, **row, sets=[
+                Set(match_id=match_id, set_number=s.set_number, score_p1=s.score_p1, score_p2=s.score_p2)
+                for s in match_data.sets
+            ])
+
+            self.participant_service.add_match(match)
+            scores = [(s.score_p1, s.score_p2) for s in match_data.sets]
+            self.stats_service.apply_result(match.player1_id, match.player2_id, winner_id, scores)
+            self.head_to_head_service.apply_result(
+                match.player1_id, match.player2_id, winner_id, scores, match.created_at
             )
-            
-            self.db.add(match)
-            self.db.flush()
-            
-            # Create sets
-            sets = [
-                Set(
-                    match_id=match.id,
-                    set_number=set_data.set_number,
-                    score_p1=set_data.score_p1,
-                    score_p2=set_data.score_p2
-                )
-                for set_data in match_data.sets
+            self.rating_service.apply_match(match)
+            self.achievement_service.record_match(match)
+            self._record_brackets([(
+                match.id, match.tournament_id, match.player1_id,
+                match.player2_id, winner_id, match.created_at
+            )])
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+        self._publish_ratings()
+        self.tournament_service.invalidate_brackets()
+        self._invalidate_counts((match.player1_id, match.player2_id, match.tournament_id))
+        self._bump_versions([match.id], [match.league_id])
+        return match
+
+    def create_matches_bulk(self, matches: List[MatchCreate]) -> MatchBulkResult:
+        """Insere os itens válidos do lote em uma transação; os inválidos viram erros por posição"""
+        player_ids = {pid for m in matches for pid in (m.player1_id, m.player2_id)}
+        league_ids = {m.league_id for m in matches if m.league_id is not None}
+        known_players = set(self.db.scalars(select(Player.id).where(Player.id.in_(player_ids))))
+        known_leagues = set(self.db.scalars(select(League.id).where(League.id.in_(league_ids))))
+
+        errors: List[MatchBulkError] = []
+        valid: List[int] = []
+        for index, match_data in enumerate(matches):
+            error = self._validate_bulk_item(match_data, known_players, known_leagues)
+            if error is None:
+                valid.append(index)
+            else:
+                errors.append(MatchBulkError(index=index, detail=error))
+
+        # Partidas de torneio precisam de uma posição aberta na chave, contando as do próprio lote
+        now = datetime.now()
+        unplaced = self.tournament_service.find_unplaced(
+            (index, matches[index].tournament_id, matches[index].player1_id, matches[index].player2_id,
+             self.determine_winner(matches[index].sets, matches[index].player1_id, matches[index].player2_id),
+             matches[index].created_at or now)
+            for index in valid
+        )
+        if unplaced:
+            valid = [index for index in valid if index not in unplaced]
+            errors += [MatchBulkError(index=index, detail=detail) for index, detail in unplaced.items()]
+            errors.sort(key=lambda error: error.index)
+
+        match_ids: List[Optional[int]] = [None] * len(matches)
+        if not valid:
+            return MatchBulkResult(created=0, match_ids=match_ids, errors=errors)
+
+        try:
+            rows = []
+            for index in valid:
+                match_data = matches[index]
+                rows.append({
+                    "player1_id": match_data.player1_id,
+                    "player2_id": match_data.player2_id,
+                    "tournament_id": match_data.tournament_id,
+                    "league_id": match_data.league_id,
+                    "winner_id": self.determine_winner(
+                        match_data.sets, match_data.player1_id, match_data.player2_id
+                    ),
+                    "created_at": match_data.created_at or now,
+                    "updated_at": now,
+                })
+            ids = self.db.scalars(
+                insert(Match).returning(Match.id, sort_by_parameter_order=True), rows
+            ).all()
+            self.db.execute(insert(Set), [
+                {
+                    "match_id": match_id,
+                    "set_number": set_data.set_number,
+                    "score_p1": set_data.score_p1,
+                    "score_p2": set_data.score_p2,
+                }
+                for index, match_id in zip(valid, ids)
+                for set_data in matches[index].sets
+            ])
+
+            self.participant_service.add_matches(
+                (match_id, row["player1_id"], row["player2_id"], row["winner_id"], row["created_at"])
+                for row, match_id in zip(rows, ids)
+            )
+            results = [
+                (row["player1_id"], row["player2_id"], row["winner_id"],
+                 [(s.score_p1, s.score_p2) for s in matches[index].sets], row["created_at"])
+                for index, row in zip(valid, rows)
             ]
-            
-            self.db.add_all(sets)
+            self.stats_service.apply_results(result[:4] for result in results)
+            self.head_to_head_service.apply_results(results)
+            # Um único replay cobre todas as partidas novas, retroativas ou não
+            self.rating_service.recompute_from(min(
+                (row["created_at"], match_id) for row, match_id in zip(rows, ids)
+            ))
+            self.achievement_service.record_matches(
+                (match_id, row["player1_id"], row["player2_id"], row["winner_id"], row["created_at"])
+                for row, match_id in zip(rows, ids)
+            )
+            self._record_brackets(
+                (match_id, row["tournament_id"], row["player1_id"], row["player2_id"],
+                 row["winner_id"], row["created_at"])
+                for row, match_id in zip(rows, ids)
+            )
             self.db.commit()
-            self.db.refresh(match)
-            
-            return match
-            
         except Exception as e:
             self.db.rollback()
             raise HTTPException(status_code=400, detail=str(e))
 
+        self._publish_ratings()
+        self.tournament_service.invalidate_brackets()
+        count_cache.clear()
+        self._bump_versions(ids, (row["league_id"] for row in rows))
+
+        for index, match_id in zip(valid, ids):
+            match_ids[index] = match_id
+        return MatchBulkResult(created=len(ids), match_ids=match_ids, errors=errors)
+
+    def _validate_bulk_item(
+        self,
+        match_data: Union[MatchCreate, MatchUpdate],
+        known_players: set,
+        known_leagues: set
+    ) -> Optional[str]:
+        """Primeiro problema de um item do lote, ou None se for válido"""
+        if match_data.player1_id == match_data.player2_id:
+            return "A player cannot play against themselves"
+        for player_id in (match_data.player1_id, match_data.player2_id):
+            if player_id not in known_players:
+                return f"Player {player_id} not found"
+        if match_data.league_id is not None and match_data.league_id not in known_leagues:
+            return f"League {match_data.league_id} not found"
+        return validate_match_sets([
+            (s.set_number, s.score_p1, s.score_p2) for s in match_data.sets
+        ])
+
     def get_match(self, match_id: int) -> Optional[Match]:
-        match = self.db.query(Match).filter(Match.id == match_id).first()
+        match = (
+            self.db.query(Match)
+            .options(selectinload(Match.sets))
+            .filter(Match.id == match_id)
+            .first()
+        )
         if not match:
             raise HTTPException(status_code=404, detail="Match not found")
         return match
 
+    def _filtered(
+        self,
+        player_id: Optional[int] = None,
+        tournament_id: Optional[int] = None,
+        lean: bool = False,
+        opponent_id: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Query:
+        if lean:
+            query = self.db.query(*MATCH_ROW_COLUMNS)
+        else:
+            # Sets em uma segunda consulta com IN, em vez de uma por partida
+            query = self.db.query(Match).options(selectinload(Match.sets))
+
+        created_at = self._sort_keys(player_id)[0]
+        if player_id:
+            # Uma faixa do índice (player_id, [opponent_id,] created_at, match_id)
+            query = query.join(MatchParticipant, MatchParticipant.match_id == Match.id).filter(
+                MatchParticipant.player_id == player_id
+            )
+            if opponent_id:
+                query = query.filter(MatchParticipant.opponent_id == opponent_id)
+
+        if tournament_id:
+            query = query.filter(Match.tournament_id == tournament_id)
+        if start is not None:
+            query = query.filter(created_at >= start)
+        if end is not None:
+            query = query.filter(created_at <= end)
+
+        return query
+
+    @staticmethod
+    def _sort_keys(player_id: Optional[int] = None) -> tuple:
+        """Colunas (created_at, id) da ordem, lidas do índice usado pelo filtro"""
+        if player_id:
+            return MatchParticipant.created_at, MatchParticipant.match_id
+        return Match.created_at, Match.id
+
+    def _with_sets(self, rows: Sequence) -> List[MatchRow]:
+        """Linhas de colunas como dicts no formato do schema Match, com os sets lidos em um só IN"""
+        matches = [row._asdict() for row in rows]
+        by_id = {}
+        for match in matches:
+            match["sets"] = []
+            by_id[match["id"]] = match
+        if by_id:
+            sets = self.db.execute(
+                select(Set.match_id, Set.set_number, Set.score_p1, Set.score_p2)
+                .where(Set.match_id.in_(by_id))
+                .order_by(Set.match_id, Set.set_number)
+            )
+            for match_id, set_number, score_p1, score_p2 in sets:
+                by_id[match_id]["sets"].append(
+                    {"set_number": set_number, "score_p1": score_p1, "score_p2": score_p2}
+                )
+        return matches
+
     def get_matches(
         self, 
         skip: int = 0, 
         limit: int = 100,
         player_id: Optional[int] = None,
-        tournament_id: Optional[int] = None
-    ) -> List[Match]:
-        query = self.db.query(Match)
-        
-        if player_id:
-            query = query.filter(
-                (Match.player1_id == player_id) | (Match.player2_id == player_id)
+        tournament_id: Optional[int] = None,
+        lean: bool = False
+    ) -> List[Union[Match, MatchRow]]:
+        query = self._filtered(player_id, tournament_id, lean)
+        rows = query.order_by(*self._sort_keys(player_id)).offset(skip).limit(limit).all()
+        return self._with_sets(rows) if lean else rows
+
+    def get_matches_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        player_id: Optional[int] = None,
+        tournament_id: Optional[int] = None,
+        lean: bool = False,
+        opponent_id: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> KeysetPage:
+        """
+        Uma página em ordem (created_at, id) localizada por cursor, sem OFFSET.
+        Com lean=True os itens são dicts no formato do schema Match.
+        opponent_id, start e end exigem player_id.
+        """
+        query = self._filtered(player_id, tournament_id, lean, opponent_id, start, end)
+        try:
+            page = paginate_keyset(
+                query, *self._sort_keys(player_id), limit, cursor,
+                key_of=lambda item: (item.created_at, item.id)
             )
-            
-        if tournament_id:
-            query = query.filter(Match.tournament_id == tournament_id)
-            
-        return query.offset(skip).limit(limit).all()
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return page._replace(items=self._with_sets(page.items)) if lean else page
+
+    def count_matches(
+        self,
+        player_id: Optional[int] = None,
+        tournament_id: Optional[int] = None
+    ) -> int:
+        return cached_count(
+            count_cache, _count_key(player_id, tournament_id), self._filtered(player_id, tournament_id)
+        )
 
     def update_match(
         self,
@@ -84,27 +417,145 @@ class MatchService:
         match_update: MatchUpdate
     ) -> Match:
         match = self.get_match(match_id)
-        
+        old_tournament_id = match.tournament_id
+        old_league_id = match.league_id
+
+        # Mesmas regras da criação, antes de mexer nas tabelas derivadas
+        player_ids = {match_update.player1_id, match_update.player2_id}
+        known_players = set(self.db.scalars(select(Player.id).where(Player.id.in_(player_ids))))
+        known_leagues = set(self.db.scalars(select(League.id).where(League.id == match_update.league_id)))
+        error = self._validate_bulk_item(match_update, known_players, known_leagues)
+        if error is not None:
+            raise HTTPException(status_code=400, detail=error)
+
         if match_update.tournament_id is not None:
             match.tournament_id = match_update.tournament_id
             match.updated_at = datetime.now()
+
+        if match_update.league_id is not None:
+            match.league_id = match_update.league_id
+            match.updated_at = datetime.now()
             
         try:
+            old_sets = [(s.set_number, s.score_p1, s.score_p2) for s in match.sets]
+            new_sets = [(s.set_number, s.score_p1, s.score_p2) for s in match_update.sets]
+            old_result = (match.player1_id, match.player2_id, match.winner_id)
+
+            if new_sets != old_sets:
+                self.db.query(Set).filter(Set.match_id == match_id).delete()
+                self.db.add_all([
+                    Set(match_id=match_id, set_number=number, score_p1=score_p1, score_p2=score_p2)
+                    for number, score_p1, score_p2 in new_sets
+                ])
+            match.player1_id = match_update.player1_id
+            match.player2_id = match_update.player2_id
+            match.winner_id = self.determine_winner(
+                match_update.sets, match_update.player1_id, match_update.player2_id
+            )
+
+            if new_sets != old_sets or (match.player1_id, match.player2_id, match.winner_id) != old_result:
+                old_scores = [s[1:] for s in old_sets]
+                new_scores = [s[1:] for s in new_sets]
+                new_result = (match.player1_id, match.player2_id, match.winner_id)
+                self.stats_service.apply_result(*old_result, old_scores, sign=-1)
+                self.stats_service.apply_result(*new_result, new_scores)
+                self.head_to_head_service.remove_result(match.id, *old_result, old_scores)
+                self.head_to_head_service.apply_result(*new_result, new_scores, match.created_at)
+                if new_result != old_result:
+                    self.participant_service.replace_match(match)
+
+            # Resultado alterado: recalcula os ratings a partir desta partida
+            if (match.player1_id, match.player2_id, match.winner_id) != old_result:
+                match.updated_at = datetime.now()
+                self.rating_service.recompute_from(
+                    (match.created_at, match.id),
+                    player_ids=old_result[:2]
+                )
+                self.achievement_service.replay_players(old_result[:2] + (match.player1_id, match.player2_id))
+            elif new_sets != old_sets:
+                match.updated_at = datetime.now()
+
+            # A chave do torneio troca o resultado antigo pelo novo
+            new_result = (match.player1_id, match.player2_id, match.winner_id)
+            if new_result != old_result or match.tournament_id != old_tournament_id:
+                self._reset_bracket(match.id)
+                self._record_brackets([
+                    (match.id, match.tournament_id, *new_result, match.created_at)
+                ])
+
             self.db.commit()
-            self.db.refresh(match)
-            return match
         except Exception as e:
             self.db.rollback()
             raise HTTPException(status_code=400, detail=str(e))
+
+        self._publish_ratings()
+        self.tournament_service.invalidate_brackets()
+        self._invalidate_counts(
+            old_result[:2] + (old_tournament_id,),
+            (match.player1_id, match.player2_id, match.tournament_id)
+        )
+        self._bump_versions([match.id], [old_league_id, match.league_id])
+        self.db.refresh(match)
+        return match
     
     def delete_match(self, match_id: int) -> None:
         match = self.get_match(match_id)
         
         try:
-            # Deleta os sets primeiro devido à chave estrangeira
+            key = (match.created_at, match.id)
+            players = (match.player1_id, match.player2_id)
+            tournament_id = match.tournament_id
+            league_id = match.league_id
+
+            self.stats_service.remove_match(match)
+            self.head_to_head_service.remove_match(match)
+            # Deleta o ledger e os sets primeiro devido à chave estrangeira
+            self.rating_service.discard_match(match)
+            self.participant_service.remove_match(match.id)
+            self._reset_bracket(match.id)
             self.db.query(Set).filter(Set.match_id == match_id).delete()
             self.db.delete(match)
+            self.rating_service.recompute_from(key, player_ids=players)
+            self.achievement_service.replay_players(players)
             self.db.commit()
         except Exception as e:
             self.db.rollback()
             raise HTTPException(status_code=400, detail=str(e))
+
+        self._publish_ratings()
+        self.tournament_service.invalidate_brackets()
+        self._invalidate_counts(players + (tournament_id,))
+        self._bump_versions([match_id], [league_id])
+
+
+class AsyncMatchService(AsyncService):
+    """Leituras do MatchService sobre uma AsyncSession"""
+
+    async def get_match(self, match_id: int) -> Match:
+        return await self.run(lambda db: MatchService(db).get_match(match_id))
+
+    async def get_matches(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        player_id: Optional[int] = None,
+        tournament_id: Optional[int] = None,
+        lean: bool = False
+    ) -> List[Union[Match, MatchRow]]:
+        return await self.run(
+            lambda db: MatchService(db).get_matches(skip, limit, player_id, tournament_id, lean)
+        )
+
+    async def get_matches_page(self, cursor: Optional[str] = None, limit: int = 100, **filters) -> KeysetPage:
+        """Ver MatchService.get_matches_page"""
+        return await self.run(lambda db: MatchService(db).get_matches_page(cursor, limit, **filters))
+
+    async def count_matches(
+        self,
+        player_id: Optional[int] = None,
+        tournament_id: Optional[int] = None
+    ) -> int:
+        return await self.cached_count(
+            count_cache, _count_key(player_id, tournament_id),
+            lambda db: MatchService(db)._filtered(player_id, tournament_id)
+        )
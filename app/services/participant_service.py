@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import Iterable, List, Tuple
+
+from sqlalchemy import delete, func, insert, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.match import Match
+from app.models.match_participant import MatchParticipant
+
+PARTICIPANT_COLUMNS = ("player_id", "match_id", "opponent_id", "created_at", "won")
+
+# (match_id, player1_id, player2_id, winner_id, created_at) de uma partida
+MatchEvent = Tuple[int, int, int, int, datetime]
+
+
+def participant_rows(matches: Iterable[MatchEvent]) -> List[dict]:
+    """As duas linhas de match_participants de cada partida"""
+    rows = []
+    for match_id, player1_id, player2_id, winner_id, created_at in matches:
+        for player_id, opponent_id in ((player1_id, player2_id), (player2_id, player1_id)):
+            rows.append({
+                "player_id": player_id,
+                "match_id": match_id,
+                "opponent_id": opponent_id,
+                "created_at": created_at,
+                "won": winner_id == player_id,
+            })
+    return rows
+
+
+class ParticipantService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def add_matches(self, matches: Iterable[MatchEvent]) -> None:
+        """Indexa partidas novas com um único INSERT de várias linhas; não faz commit"""
+        rows = participant_rows(matches)
+        if rows:
+            self.db.execute(insert(MatchParticipant), rows)
+
+    def add_match(self, match: Match) -> None:
+        self.add_matches([
+            (match.id, match.player1_id, match.player2_id, match.winner_id, match.created_at)
+        ])
+
+    def remove_match(self, match_id: int) -> None:
+        """Remove as linhas de uma partida que será excluída; não faz commit"""
+        self.db.execute(delete(MatchParticipant).where(MatchParticipant.match_id == match_id))
+
+    def replace_match(self, match: Match) -> None:
+        """Reindexa uma partida cujos jogadores ou vencedor mudaram; não faz commit"""
+        self.remove_match(match.id)
+        self.add_match(match)
+
+    def rebuild(self) -> int:
+        """Recalcula a tabela inteira com um INSERT ... SELECT; retorna o número de partidas"""
+        def side(player, opponent):
+            return select(
+                player.label("player_id"),
+                Match.id.label("match_id"),
+                opponent.label("opponent_id"),
+                Match.created_at,
+                (Match.winner_id == player).label("won"),
+            )
+
+        sides = union_all(
+            side(Match.player1_id, Match.player2_id),
+            side(Match.player2_id, Match.player1_id)
+        )
+        try:
+            self.db.execute(delete(MatchParticipant))
+            self.db.execute(insert(MatchParticipant).from_select(list(PARTICIPANT_COLUMNS), sides))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self.db.scalar(select(func.count()).select_from(MatchParticipant)) // 2
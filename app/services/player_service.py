@@ -1,75 +1,217 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from pydantic import HttpUrl, TypeAdapter
+from sqlalchemy import DateTime
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session, make_transient_to_detached
 from fastapi import HTTPException, status
 from datetime import datetime
+from app.core.cache import get_cache, get_tiered_cache, get_versions, run_cache_io
 from app.core.security import get_password_hash
+from app.db.pagination import KeysetPage, cached_count, paginate_keyset
 from app.models.player import Player
-from app.schemas.player import PlayerCreate, PlayerUpdate
+from app.models.stats import PlayerStats
+from app.schemas.achievement import PlayerAchievements
+from app.schemas.player import Player as PlayerSchema, PlayerCreate, PlayerUpdate
+from app.schemas.stats import PlayerStats as PlayerStatsSchema
+from app.services.achievement_service import AchievementService
+from app.services.async_service import AsyncService
+from app.services.ranking_service import RankingService
+from app.services.stats_service import StatsService
+from app.utils.constants import (
+    CACHE_TTL,
+    LOCAL_CACHE_TTL,
+    PLAYER_CACHE_SIZE,
+)
+
+# Totais da listagem de jogadores, com e sem filtro de ativos
+count_cache = get_cache("player_counts", CACHE_TTL['counts'])
+COUNT_KEYS = ("active", "all")
+# Perfis por "id:<id>" e o id por "email:<email>"/"username:<username>";
+# local + Redis, invalidados após o commit de toda escrita no jogador
+profile_cache = get_tiered_cache(
+    "player_profile", CACHE_TTL['player_profile'], LOCAL_CACHE_TTL, PLAYER_CACHE_SIZE
+)
+DATETIME_COLUMNS = {c.key for c in Player.__table__.columns if isinstance(c.type, DateTime)}
+# Colunas do schema Player, na mesma ordem, lidas pelo caminho enxuto das listagens
+PLAYER_ROW_COLUMNS = tuple(getattr(Player, name) for name in PlayerSchema.model_fields)
+PlayerRow = Dict[str, Any]
+# O schema expõe avatar_url normalizado pelo HttpUrl
+HTTP_URL = TypeAdapter(HttpUrl)
+# Índice único violado -> erro da API
+UNIQUE_INDEX_ERRORS = {
+    "ix_players_email": "Email already registered",
+    "ix_players_username": "Username already taken",
+}
+# Prefixo da mensagem do SQLite, que cita as colunas em vez do índice
+SQLITE_UNIQUE_PREFIX = "UNIQUE constraint failed: "
+
+def _player_row(player: Player) -> Dict[str, Any]:
+    """Colunas do jogador em formato JSON para o cache"""
+    row = {c.key: getattr(player, c.key) for c in Player.__table__.columns}
+    for key in DATETIME_COLUMNS:
+        if row[key] is not None:
+            row[key] = row[key].isoformat()
+    return row
+
+def _lean_rows(rows: Sequence) -> List[PlayerRow]:
+    """Linhas de PLAYER_ROW_COLUMNS como dicts no formato do schema Player"""
+    players = [row._asdict() for row in rows]
+    for player in players:
+        if player["avatar_url"] is not None:
+            player["avatar_url"] = str(HTTP_URL.validate_python(player["avatar_url"]))
+    return players
+
+def invalidate_players(player_ids: Iterable[int]) -> None:
+    """
+    Remove perfis do cache e avança as versões (ETag) dos jogadores e da
+    listagem; chamar depois do commit que os alterou
+    """
+    player_ids = list(player_ids)
+    for player_id in player_ids:
+        profile_cache.delete(f"id:{player_id}")
+    if player_ids:
+        get_versions().bump("players", *(f"player:{player_id}" for player_id in player_ids))
 
 class PlayerService:
     def __init__(self, db: Session):
         self.db = db
+        self.ranking_service = RankingService(db)
 
     def get_by_id(self, player_id: int) -> Optional[Player]:
-        return self.db.query(Player).filter(Player.id == player_id).first()
+        row = profile_cache.get(f"id:{player_id}")
+        if row is not None:
+            return self._attach(row)
+        player = self.db.query(Player).filter(Player.id == player_id).first()
+        if player is not None:
+            profile_cache.set(f"id:{player.id}", _player_row(player))
+        return player
 
     def get_by_email(self, email: str) -> Optional[Player]:
-        return self.db.query(Player).filter(Player.email == email).first()
+        return self._get_by("email", email)
 
     def get_by_username(self, username: str) -> Optional[Player]:
-        return self.db.query(Player).filter(Player.username == username).first()
+        return self._get_by("username", username)
+
+    def _get_by(self, field: str, value: str) -> Optional[Player]:
+        player_id = profile_cache.get(f"{field}:{value}")
+        if player_id is not None:
+            player = self.get_by_id(player_id)
+            # O mapeamento pode ter sobrado de um email alterado
+            if player is not None and getattr(player, field) == value:
+                return player
+        player = self.db.query(Player).filter(getattr(Player, field) == value).first()
+        if player is not None:
+            profile_cache.set(f"{field}:{value}", player.id)
+            profile_cache.set(f"id:{player.id}", _player_row(player))
+        return player
+
+    def _attach(self, row: Dict[str, Any]) -> Player:
+        """Linha do cache como Player persistente desta sessão, sem SELECT; a da sessão tem prioridade"""
+        identity = self.db.identity_key(Player, row["id"])
+        if identity in self.db.identity_map:
+            return self.db.identity_map[identity]
+        player = Player(**{
+            key: datetime.fromisoformat(value) if key in DATETIME_COLUMNS and value is not None else value
+            for key, value in row.items()
+        })
+        make_transient_to_detached(player)
+        return self.db.merge(player, load=False)
+
+    def _filtered(self, active_only: bool = True, lean: bool = False) -> Query:
+        query = self.db.query(*PLAYER_ROW_COLUMNS) if lean else self.db.query(Player)
+        if active_only:
+            query = query.filter(Player.is_active == True)
+        return query
 
     def get_all(
         self, 
         skip: int = 0, 
         limit: int = 100,
-        active_only: bool = True
-    ) -> List[Player]:
-        query = self.db.query(Player)
-        if active_only:
-            query = query.filter(Player.is_active == True)
-        return query.offset(skip).limit(limit).all()
+        active_only: bool = True,
+        lean: bool = False
+    ) -> List[Union[Player, PlayerRow]]:
+        query = self._filtered(active_only, lean).order_by(Player.created_at, Player.id)
+        rows = query.offset(skip).limit(limit).all()
+        return _lean_rows(rows) if lean else rows
 
-    def create(self, player_create: PlayerCreate) -> Player:
-        # Verificar se já existe usuário com mesmo email
-        if self.get_by_email(email=player_create.email):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
-        # Verificar se já existe usuário com mesmo username
-        if self.get_by_username(username=player_create.username):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken"
+    def get_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        active_only: bool = True,
+        lean: bool = False
+    ) -> KeysetPage:
+        """
+        Uma página em ordem (created_at, id) localizada por cursor, sem OFFSET.
+        Com lean=True os itens são dicts no formato do schema Player.
+        """
+        try:
+            page = paginate_keyset(
+                self._filtered(active_only, lean), Player.created_at, Player.id, limit, cursor
             )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return page._replace(items=_lean_rows(page.items)) if lean else page
+
+    def count(self, active_only: bool = True) -> int:
+        return cached_count(count_cache, COUNT_KEYS[not active_only], self._filtered(active_only))
+
+    def _invalidate_counts(self) -> None:
+        for key in COUNT_KEYS:
+            count_cache.delete(key)
 
-        # Criar o player
+    def _unique_violation(self, error: IntegrityError) -> HTTPException:
+        """Traduz a violação de unicidade do banco para as mensagens da API"""
+        detail = UNIQUE_INDEX_ERRORS.get(self._violated_index(error), "Player already exists")
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+    def _violated_index(self, error: IntegrityError) -> Optional[str]:
+        """Nome da constraint ou índice único violado, quando o driver o informa"""
+        diag = getattr(error.orig, "diag", None)
+        if diag is not None:
+            # PostgreSQL (psycopg2)
+            return diag.constraint_name
+        message = str(error.orig)
+        if not message.startswith(SQLITE_UNIQUE_PREFIX):
+            return None
+        # SQLite: "UNIQUE constraint failed: players.username"
+        columns = {name.strip().split(".")[-1] for name in message[len(SQLITE_UNIQUE_PREFIX):].split(",")}
+        for index in Player.__table__.indexes:
+            if index.unique and {column.name for column in index.columns} == columns:
+                return index.name
+        return None
+
+    def create(self, player_create: PlayerCreate) -> Player:
+        # Criar o player; email e username únicos são garantidos pelo banco
         player = Player(
             username=player_create.username,
             email=player_create.email,
             full_name=player_create.full_name,
-            hashed_password=get_password_hash(player_create.password)
+            hashed_password=get_password_hash(player_create.password),
+            last_login=None,
+            avatar_url=None,
+            bio=None
         )
         
         self.db.add(player)
+        try:
+            self.db.flush()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise self._unique_violation(e)
+        # Desanexado antes do commit para não expirar: todos os campos já são
+        # conhecidos após o INSERT ... RETURNING, então não há SELECT depois
+        self.db.expunge(player)
         self.db.commit()
-        self.db.refresh(player)
+        invalidate_players([player.id])
+        self.ranking_service.add_player(player)
+        self._invalidate_counts()
         
         return player
 
     def update(self, player: Player, player_update: PlayerUpdate) -> Player:
         update_data = player_update.model_dump(exclude_unset=True)
         
-        # Verificar email único se estiver sendo atualizado
-        if "email" in update_data and update_data["email"] != player.email:
-            if self.get_by_email(email=update_data["email"]):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
-            
         if "avatar_url" in update_data:
             update_data["avatar_url"] = str(update_data["avatar_url"]) if update_data["avatar_url"] else None
 
@@ -79,14 +221,30 @@ class PlayerService:
             setattr(player, field, value)
 
         self.db.add(player)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise self._unique_violation(e)
         self.db.refresh(player)
+        invalidate_players([player.id])
+
+        if "is_active" in update_data:
+            self._invalidate_counts()
+            if player.is_active:
+                self.ranking_service.add_player(player)
+            else:
+                self.ranking_service.remove_player(player.id)
         
         return player
 
     def delete(self, player: Player) -> Player:
+        self.db.query(PlayerStats).filter(PlayerStats.player_id == player.id).delete()
         self.db.delete(player)
         self.db.commit()
+        invalidate_players([player.id])
+        self.ranking_service.remove_player(player.id)
+        self._invalidate_counts()
         return player
 
     def soft_delete(self, player: Player) -> Player:
@@ -94,6 +252,9 @@ class PlayerService:
         self.db.add(player)
         self.db.commit()
         self.db.refresh(player)
+        invalidate_players([player.id])
+        self.ranking_service.remove_player(player.id)
+        self._invalidate_counts()
         return player
 
     def reactivate(self, player: Player) -> Player:
@@ -101,6 +262,9 @@ class PlayerService:
         self.db.add(player)
         self.db.commit()
         self.db.refresh(player)
+        invalidate_players([player.id])
+        self.ranking_service.add_player(player)
+        self._invalidate_counts()
         return player
 
     def update_last_login(self, player: Player) -> Player:
@@ -108,4 +272,48 @@ class PlayerService:
         self.db.add(player)
         self.db.commit()
         self.db.refresh(player)
-        return player
\ No newline at end of file
+        invalidate_players([player.id])
+        return player
+
+
+class AsyncPlayerService(AsyncService):
+    """Leituras do PlayerService e dos sub-recursos do jogador sobre uma AsyncSession"""
+
+    async def get_by_id(self, player_id: int) -> Optional[Player]:
+        # Mesmo fluxo de PlayerService.get_by_id, com o cache fora do event loop
+        row = await run_cache_io(profile_cache.get, f"id:{player_id}")
+        if row is not None:
+            return await self.run(lambda db: PlayerService(db)._attach(row))
+        player = await self.run(lambda db: db.query(Player).filter(Player.id == player_id).first())
+        if player is not None:
+            await run_cache_io(profile_cache.set, f"id:{player.id}", _player_row(player))
+        return player
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True,
+        lean: bool = False
+    ) -> List[Union[Player, PlayerRow]]:
+        return await self.run(lambda db: PlayerService(db).get_all(skip, limit, active_only, lean))
+
+    async def get_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        active_only: bool = True,
+        lean: bool = False
+    ) -> KeysetPage:
+        return await self.run(lambda db: PlayerService(db).get_page(cursor, limit, active_only, lean))
+
+    async def count(self, active_only: bool = True) -> int:
+        return await self.cached_count(
+            count_cache, COUNT_KEYS[not active_only], lambda db: PlayerService(db)._filtered(active_only)
+        )
+
+    async def get_stats(self, player_id: int) -> PlayerStatsSchema:
+        return await self.run(lambda db: StatsService(db).get_player_stats(player_id))
+
+    async def get_achievements(self, player_id: int) -> PlayerAchievements:
+        return await self.run(lambda db: AchievementService(db).get_player_achievements(player_id))
@@ -0,0 +1,141 @@
+from threading import Lock
+from typing import Dict, List
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_leaderboard
+from app.models.player import Player
+from app.schemas.ranking import CategorySummary, PlayerRanking, RankingEntry, RankingPage
+from app.utils.constants import CACHE_TTL, PLAYER_CATEGORIES
+from app.utils.helpers import (
+    CATEGORY_NAMES,
+    calculate_percentile,
+    get_player_category
+)
+from app.utils.leaderboard import LeaderboardBackend, LeaderboardEntry
+
+# Ranking materializado (no processo ou no Redis, conforme CACHE_BACKEND);
+# atualizado a cada escrita e recarregado do banco depois de
+# CACHE_TTL['rankings'] como proteção contra divergência
+leaderboard = get_leaderboard(CATEGORY_NAMES, get_player_category, CACHE_TTL['rankings'])
+_load_lock = Lock()
+
+class RankingService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def ensure_loaded(self) -> LeaderboardBackend:
+        if leaderboard.is_stale():
+            with _load_lock:
+                if leaderboard.is_stale():
+                    leaderboard.load(
+                        self.db.query(Player.id, Player.rating).filter(Player.is_active == True).all()
+                    )
+        return leaderboard
+
+    def update_ratings(self, ratings: Dict[int, float]) -> None:
+        """Aplica ao ranking os ratings já confirmados no banco, só de jogadores ativos"""
+        if ratings:
+            leaderboard.update_many(ratings, existing_only=True)
+
+    def add_player(self, player: Player) -> None:
+        if player.is_active:
+            leaderboard.update_many({player.id: player.rating})
+
+    def remove_player(self, player_id: int) -> None:
+        leaderboard.remove(player_id)
+
+    def invalidate(self) -> None:
+        """Força a recarga do ranking a partir do banco na próxima leitura"""
+        leaderboard.invalidate()
+
+    def get_page(self, page: int, page_size: int) -> RankingPage:
+        board = self.ensure_loaded()
+        return RankingPage(
+            page=page,
+            page_size=page_size,
+            total=board.size(),
+            entries=self._to_schema(board.page(page, page_size))
+        )
+
+    def get_category_page(self, category: str, page: int, page_size: int) -> RankingPage:
+        board = self._category_board(category)
+        return RankingPage(
+            page=page,
+            page_size=page_size,
+            total=board.size(category),
+            category=category,
+            entries=self._to_schema(board.page(page, page_size, category))
+        )
+
+    def get_categories(self) -> List[CategorySummary]:
+        board = self.ensure_loaded()
+        counts = board.category_counts()
+        total = board.size()
+        return [
+            CategorySummary(
+                category=category,
+                min_rating=PLAYER_CATEGORIES[category][0],
+                max_rating=PLAYER_CATEGORIES[category][1],
+                players=counts[category],
+                percentage=round(counts[category] / total * 100, 2) if total else 0.0
+            )
+            for category in CATEGORY_NAMES
+        ]
+
+    def get_player_rank(self, player_id: int) -> PlayerRanking:
+        board = self.ensure_loaded()
+        rank = board.rank(player_id)
+        if rank is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Player not ranked"
+            )
+        category = board.category(player_id)
+        category_rank = board.rank(player_id, category)
+        return PlayerRanking(
+            player_id=player_id,
+            username=self.db.query(Player.username).filter(Player.id == player_id).scalar(),
+            rating=board.rating(player_id),
+            rank=rank,
+            percentile=calculate_percentile(rank, board.size()),
+            category=category,
+            category_rank=category_rank,
+            category_percentile=calculate_percentile(category_rank, board.size(category))
+        )
+
+    def get_around(self, player_id: int, size: int) -> List[RankingEntry]:
+        board = self.ensure_loaded()
+        entries = board.around(player_id, size)
+        if not entries:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Player not ranked"
+            )
+        return self._to_schema(entries)
+
+    def _category_board(self, category: str) -> LeaderboardBackend:
+        board = self.ensure_loaded()
+        if category not in board.categories:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found"
+            )
+        return board
+
+    def _to_schema(self, entries: List[LeaderboardEntry]) -> List[RankingEntry]:
+        ids = [player_id for _, player_id, _ in entries]
+        usernames = dict(
+            self.db.query(Player.id, Player.username).filter(Player.id.in_(ids)).all()
+        ) if ids else {}
+        return [
+            RankingEntry(
+                rank=rank,
+                player_id=player_id,
+                username=usernames.get(player_id),
+                rating=rating,
+                category=get_player_category(rating)
+            )
+            for rank, player_id, rating in entries
+        ]
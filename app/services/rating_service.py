@@ -0,0 +1,331 @@
+from datetime import datetime
+from typing import Dict, Iterable, NamedTuple, Optional
+
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func, insert, select, true, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache
+from app.db.pagination import Key, keyset_after, keyset_before
+from app.models.match import Match
+from app.models.player import Player
+from app.models.rating import RatingCheckpoint, RatingLedger
+from app.schemas.rating import RatingHistory, RatingPoint
+from app.utils.constants import (
+    CACHE_TTL,
+    DEFAULT_RATING_HISTORY_POINTS,
+    INITIAL_RATING,
+    RATING_CHECKPOINT_INTERVAL
+)
+from app.utils.downsampling import lttb
+from app.utils.helpers import calculate_elo_rating
+from app.utils.rating_engine import EloReplay, ratings_after, replay_elo, replay_elo_parallel
+
+# Posição de uma partida na ordem cronológica: (created_at, id)
+MatchKey = Key
+
+# Séries já reduzidas, por jogador, intervalo, número de pontos e versão do ledger
+history_cache = get_cache("rating_history", CACHE_TTL['rating_history'])
+
+
+class MatchHistory(NamedTuple):
+    """Colunas da tabela matches em ordem cronológica"""
+    match_ids: np.ndarray
+    player1_ids: np.ndarray
+    player2_ids: np.ndarray
+    player1_won: np.ndarray
+    created_at: np.ndarray
+
+
+class RatingService:
+    def __init__(self, db: Session, checkpoint_interval: int = RATING_CHECKPOINT_INTERVAL):
+        self.db = db
+        self.checkpoint_interval = checkpoint_interval
+        # Ratings alterados por esta instância, para atualizar o ranking após o commit
+        self.updated: Dict[int, float] = {}
+
+    def load_history(
+        self,
+        after: Optional[MatchKey] = None,
+        league_id: Optional[int] = None
+    ) -> MatchHistory:
+        """Carrega o histórico de partidas em ordem de created_at (empate pelo id)"""
+        query = (
+            select(Match.id, Match.player1_id, Match.player2_id, Match.winner_id, Match.created_at)
+            .order_by(Match.created_at, Match.id)
+        )
+        if after is not None:
+            query = query.where(keyset_after(Match.created_at, Match.id, after))
+        if league_id is not None:
+            query = query.where(Match.league_id == league_id)
+        rows = self.db.execute(query).all()
+
+        if not rows:
+            empty = np.empty(0, dtype=np.int64)
+            return MatchHistory(empty, empty, empty, np.empty(0, dtype=bool), np.empty(0, dtype=object))
+
+        match_ids, player1_ids, player2_ids, winner_ids, created_at = zip(*rows)
+        match_ids, player1_ids, player2_ids, winner_ids = (
+            np.asarray(column, dtype=np.int64)
+            for column in (match_ids, player1_ids, player2_ids, winner_ids)
+        )
+        return MatchHistory(
+            match_ids,
+            player1_ids,
+            player2_ids,
+            winner_ids == player1_ids,
+            np.asarray(created_at, dtype=object)
+        )
+
+    def get_ratings(self) -> Dict[int, float]:
+        """Rating recalculado de cada jogador que já disputou uma partida"""
+        history = self.load_history()
+        result = replay_elo(history.player1_ids, history.player2_ids, history.player1_won)
+        played = np.unique(np.concatenate((history.player1_ids, history.player2_ids)))
+        return dict(zip(played.tolist(), result.ratings[played].tolist()))
+
+    def record_match(self, match: Match) -> None:
+        """Aplica a partida mais recente do histórico: ratings, ledger e checkpoint; não faz commit"""
+        player1 = self.db.get(Player, match.player1_id)
+        player2 = self.db.get(Player, match.player2_id)
+        won = match.winner_id == match.player1_id
+        rating1, rating2 = player1.rating, player2.rating
+
+        player1.rating = calculate_elo_rating(rating1, rating2, won)
+        player2.rating = calculate_elo_rating(rating2, rating1, not won)
+        self.updated[player1.id] = player1.rating
+        self.updated[player2.id] = player2.rating
+        self.db.add_all([
+            RatingLedger(
+                match_id=match.id,
+                player_id=player.id,
+                match_created_at=match.created_at,
+                rating_before=before,
+                rating_after=player.rating
+            )
+            for player, before in ((player1, rating1), (player2, rating2))
+        ])
+        self.db.flush()
+
+        checkpoint = self._latest_checkpoint()
+        pending = select(func.count(Match.id))
+        if checkpoint is not None:
+            pending = pending.where(
+                keyset_after(Match.created_at, Match.id, (checkpoint.match_created_at, checkpoint.match_id))
+            )
+        if self.db.scalar(pending) >= self.checkpoint_interval:
+            snapshot = self.db.execute(
+                select(Player.id, Player.rating).where(Player.rating != INITIAL_RATING)
+            ).all()
+            self.db.add(RatingCheckpoint(
+                match_id=match.id,
+                match_created_at=match.created_at,
+                ratings={str(player_id): rating for player_id, rating in snapshot}
+            ))
+
+    def apply_match(self, match: Match) -> None:
+        """Aplica uma partida nova; retroativa, recalcula o sufixo desde o checkpoint anterior; não faz commit"""
+        self.db.flush()
+        later = self.db.scalar(
+            select(Match.id)
+            .where(keyset_after(Match.created_at, Match.id, (match.created_at, match.id)))
+            .limit(1)
+        )
+        if later is None:
+            self.record_match(match)
+        else:
+            self.recompute_from((match.created_at, match.id))
+
+    def discard_match(self, match: Match) -> None:
+        """Remove do ledger as linhas de uma partida que será excluída"""
+        self.db.execute(delete(RatingLedger).where(RatingLedger.match_id == match.id))
+
+    def recompute_from(
+        self,
+        key: Optional[MatchKey] = None,
+        player_ids: Iterable[int] = (),
+        workers: Optional[int] = None
+    ) -> int:
+        """Recalcula as partidas após o último checkpoint anterior a key (tudo, sem key); não faz commit"""
+        self.db.flush()
+
+        checkpoint = None
+        if key is not None:
+            checkpoint = self.db.scalars(
+                select(RatingCheckpoint)
+                .where(keyset_before(RatingCheckpoint.match_created_at, RatingCheckpoint.match_id, key))
+                .order_by(RatingCheckpoint.match_created_at.desc(), RatingCheckpoint.match_id.desc())
+                .limit(1)
+            ).first()
+
+        start = None
+        ratings = np.empty(0, dtype=np.float64)
+        checkpoint_filter = ledger_filter = true()
+        if checkpoint is not None:
+            start = (checkpoint.match_created_at, checkpoint.match_id)
+            checkpoint_filter = keyset_after(RatingCheckpoint.match_created_at, RatingCheckpoint.match_id, start)
+            ledger_filter = keyset_after(RatingLedger.match_created_at, RatingLedger.match_id, start)
+            snapshot = {int(player_id): rating for player_id, rating in checkpoint.ratings.items()}
+            if snapshot:
+                ratings = np.full(max(snapshot) + 1, float(INITIAL_RATING))
+                ratings[list(snapshot)] = list(snapshot.values())
+
+        stale = set(player_ids)
+        stale.update(self.db.scalars(select(RatingLedger.player_id).where(ledger_filter).distinct()))
+        self.db.execute(delete(RatingLedger).where(ledger_filter))
+        self.db.execute(delete(RatingCheckpoint).where(checkpoint_filter))
+
+        history = self.load_history(after=start)
+        if workers and workers > 1:
+            result = replay_elo_parallel(
+                history.player1_ids, history.player2_ids, history.player1_won,
+                ratings=ratings, workers=workers
+            )
+        else:
+            result = replay_elo(
+                history.player1_ids, history.player2_ids, history.player1_won,
+                ratings=ratings
+            )
+
+        interval = self.checkpoint_interval
+        for offset in range(0, len(history.match_ids), interval):
+            chunk = slice(offset, offset + interval)
+            self._write_ledger(history, chunk, result)
+
+            if offset + interval <= len(history.match_ids):
+                ratings = ratings_after(
+                    ratings,
+                    history.player1_ids[chunk],
+                    history.player2_ids[chunk],
+                    result.player1_after[chunk],
+                    result.player2_after[chunk]
+                )
+                last = offset + interval - 1
+                changed = np.flatnonzero(ratings != INITIAL_RATING)
+                self.db.add(RatingCheckpoint(
+                    match_id=int(history.match_ids[last]),
+                    match_created_at=history.created_at[last],
+                    ratings=dict(zip(map(str, changed.tolist()), ratings[changed].tolist()))
+                ))
+        ratings = result.ratings
+
+        stale.update(history.player1_ids.tolist())
+        stale.update(history.player2_ids.tolist())
+        if stale:
+            refreshed = {
+                player_id: float(ratings[player_id]) if player_id < len(ratings) else float(INITIAL_RATING)
+                for player_id in sorted(stale)
+            }
+            self.db.execute(update(Player), [
+                {"id": player_id, "rating": rating} for player_id, rating in refreshed.items()
+            ])
+            self.updated.update(refreshed)
+            # O UPDATE em lote por chave primária não sincroniza a sessão
+            for obj in list(self.db.identity_map.values()):
+                if isinstance(obj, Player):
+                    self.db.expire(obj, ["rating"])
+        self.db.flush()
+        return len(history.match_ids)
+
+    def rebuild(self, workers: Optional[int] = None) -> int:
+        """Recalcula o ledger, os checkpoints e os ratings a partir de todo o histórico"""
+        try:
+            self.db.execute(update(Player).values(rating=INITIAL_RATING))
+            replayed = self.recompute_from(None, workers=workers)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return replayed
+
+    def get_history(
+        self,
+        player_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        points: int = DEFAULT_RATING_HISTORY_POINTS
+    ) -> RatingHistory:
+        """Rating após cada partida do jogador em [start, end], lido do ledger e reduzido a points com LTTB"""
+        if self.db.get(Player, player_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Player not found"
+            )
+        filters = [RatingLedger.player_id == player_id]
+        if start is not None:
+            filters.append(RatingLedger.match_created_at >= start)
+        if end is not None:
+            filters.append(RatingLedger.match_created_at <= end)
+
+        # Versão barata do intervalo (só o índice): muda quando o ledger é
+        # reescrito, então entradas antigas do cache nunca são servidas
+        total, last_match, checksum = self.db.execute(
+            select(func.count(), func.max(RatingLedger.match_id), func.sum(RatingLedger.rating_after))
+            .where(*filters)
+        ).one()
+        cache_key = f"{player_id}:{start}:{end}:{points}:{total}:{last_match}:{checksum}"
+        cached = history_cache.get(cache_key)
+        if cached is not None:
+            return RatingHistory(**cached)
+
+        rows = self.db.execute(
+            select(
+                RatingLedger.match_id,
+                RatingLedger.match_created_at,
+                RatingLedger.rating_before,
+                RatingLedger.rating_after
+            )
+            .where(*filters)
+            .order_by(RatingLedger.match_created_at, RatingLedger.match_id)
+        ).all()
+        kept = range(len(rows))
+        if len(rows) > points:
+            timestamps = np.fromiter((row.match_created_at.timestamp() for row in rows), dtype=np.float64)
+            ratings = np.fromiter((row.rating_after for row in rows), dtype=np.float64)
+            kept = lttb(timestamps, ratings, points).tolist()
+
+        history = RatingHistory(
+            player_id=player_id,
+            start=start,
+            end=end,
+            total_points=len(rows),
+            downsampled=len(rows) > points,
+            points=[
+                RatingPoint(
+                    match_id=rows[i].match_id,
+                    played_at=rows[i].match_created_at,
+                    rating=rows[i].rating_after,
+                    change=rows[i].rating_after - rows[i].rating_before
+                )
+                for i in kept
+            ]
+        )
+        history_cache.set(cache_key, history.model_dump(mode="json"))
+        return history
+
+    def _latest_checkpoint(self) -> Optional[RatingCheckpoint]:
+        return self.db.scalars(
+            select(RatingCheckpoint)
+            .order_by(RatingCheckpoint.match_created_at.desc(), RatingCheckpoint.match_id.desc())
+            .limit(1)
+        ).first()
+
+    def _write_ledger(self, history: MatchHistory, chunk: slice, result: EloReplay) -> None:
+        rows = []
+        for match_id, created_at, p1, p2, before1, after1, before2, after2 in zip(
+            history.match_ids[chunk].tolist(),
+            history.created_at[chunk].tolist(),
+            history.player1_ids[chunk].tolist(),
+            history.player2_ids[chunk].tolist(),
+            result.player1_before[chunk].tolist(),
+            result.player1_after[chunk].tolist(),
+            result.player2_before[chunk].tolist(),
+            result.player2_after[chunk].tolist()
+        ):
+            rows.append({"match_id": match_id, "player_id": p1, "match_created_at": created_at,
+                         "rating_before": before1, "rating_after": after1})
+            rows.append({"match_id": match_id, "player_id": p2, "match_created_at": created_at,
+                         "rating_before": before2, "rating_after": after2})
+        if rows:
+            self.db.execute(insert(RatingLedger), rows)
@@ -0,0 +1,97 @@
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.match import Match
+from app.models.stats import HeadToHead
+from app.schemas.schedule import (
+    Schedule,
+    ScheduledBye,
+    ScheduledMatch,
+    ScheduleRequest,
+    SwissRound,
+    SwissRoundRequest
+)
+from app.services.tournament_service import TournamentService
+from app.utils.scheduling import Pair, PlayedPair, pack_tables, round_robin_rounds, swiss_pairings
+
+class ScheduleService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def round_robin(self, request: ScheduleRequest) -> Schedule:
+        """Todos os pares uma vez (método do círculo), distribuídos em request.tables mesas"""
+        TournamentService(self.db).get_ratings(request.player_ids)
+        return self._schedule(round_robin_rounds(request.player_ids), request.tables)
+
+    def swiss_round(self, request: SwissRoundRequest) -> SwissRound:
+        """Próxima rodada suíça por pontos e proximidade de rating, evitando pares que já se enfrentaram"""
+        ratings = dict(zip(
+            request.player_ids, TournamentService(self.db).get_ratings(request.player_ids)
+        ))
+        scores, played, rounds_played, had_bye = self._event_history(request)
+
+        pairs, bye, rematches = swiss_pairings(
+            request.player_ids, ratings, scores, played, had_bye
+        )
+        schedule = self._schedule([pairs + ([(bye, None)] if bye is not None else [])], request.tables)
+        return SwissRound(
+            **schedule.model_dump(),
+            round_number=rounds_played + 1,
+            rematches=rematches
+        )
+
+    def _event_history(
+        self,
+        request: SwissRoundRequest
+    ) -> Tuple[Dict[int, int], Set[PlayedPair], int, Set[int]]:
+        """Vitórias, pares já disputados, rodadas jogadas e quem já teve bye"""
+        players = set(request.player_ids)
+        if request.tournament_id is None:
+            # Índice de pares: a chave primária (player_low_id, player_high_id) de head_to_head
+            rows = self.db.execute(
+                select(HeadToHead.player_low_id, HeadToHead.player_high_id).where(
+                    HeadToHead.player_low_id.in_(players),
+                    HeadToHead.player_high_id.in_(players),
+                    HeadToHead.matches_played > 0
+                )
+            )
+            return {}, {frozenset(pair) for pair in rows}, 0, set()
+
+        wins: Dict[int, int] = Counter()
+        games: Dict[int, int] = Counter()
+        played: Set[PlayedPair] = set()
+        rows = self.db.execute(
+            select(Match.player1_id, Match.player2_id, Match.winner_id)
+            .where(Match.tournament_id == request.tournament_id)
+        )
+        for player1_id, player2_id, winner_id in rows:
+            played.add(frozenset((player1_id, player2_id)))
+            wins[winner_id] += 1
+            games[player1_id] += 1
+            games[player2_id] += 1
+
+        rounds_played = max((games[p] for p in players), default=0)
+        # Quem jogou menos rodadas que o líder ficou de fora em alguma: conta como bye
+        had_bye = {p for p in players if games[p] < rounds_played}
+        return {p: wins[p] for p in players}, played, rounds_played, had_bye
+
+    @staticmethod
+    def _schedule(rounds: List[List[Pair]], tables: int) -> Schedule:
+        placed = pack_tables(rounds, tables)
+        return Schedule(
+            rounds=len(rounds),
+            slots=max((slot for _, slot, _, _, _ in placed), default=0),
+            matches=[
+                ScheduledMatch(round=r, slot=slot, table=table, player1_id=p1, player2_id=p2)
+                for r, slot, table, p1, p2 in placed
+            ],
+            byes=[
+                ScheduledBye(round=r, player_id=player1)
+                for r, pairs in enumerate(rounds, start=1)
+                for player1, player2 in pairs
+                if player2 is None
+            ]
+        )
@@ -0,0 +1,157 @@
+from datetime import datetime
+from typing import Dict, Iterable, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, case, delete, func, insert, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.db.upsert import upsert_increment
+from app.models.match import Match
+from app.models.player import Player
+from app.models.set import Set
+from app.models.stats import PlayerStats
+from app.schemas.stats import PlayerStats as PlayerStatsSchema
+from app.utils.helpers import calculate_win_percentage
+
+STAT_COLUMNS = (
+    "matches_played",
+    "wins",
+    "losses",
+    "sets_won",
+    "sets_lost",
+    "points_won",
+    "points_lost",
+)
+
+# (score_p1, score_p2) de cada set
+SetScores = Iterable[Tuple[int, int]]
+# (player1_id, player2_id, winner_id, sets) de uma partida
+MatchResult = Tuple[int, int, int, SetScores]
+
+
+class StatsService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply_result(
+        self,
+        player1_id: int,
+        player2_id: int,
+        winner_id: int,
+        sets: SetScores,
+        sign: int = 1
+    ) -> None:
+        """Soma (sign=1) ou subtrai (sign=-1) uma partida dos agregados dos dois jogadores; não faz commit"""
+        self.apply_results([(player1_id, player2_id, winner_id, sets)], sign=sign)
+
+    def apply_results(self, results: Iterable[MatchResult], sign: int = 1) -> None:
+        """Soma ou subtrai várias partidas com um único upsert, agregando por jogador antes; não faz commit"""
+        totals: Dict[int, Dict[str, int]] = {}
+        for player1_id, player2_id, winner_id, sets in results:
+            sets = list(sets)
+            sets_p1 = sum(1 for score_p1, score_p2 in sets if score_p1 > score_p2)
+            sets_p2 = sum(1 for score_p1, score_p2 in sets if score_p2 > score_p1)
+            points_p1 = sum(score_p1 for score_p1, _ in sets)
+            points_p2 = sum(score_p2 for _, score_p2 in sets)
+
+            for player_id, sets_won, sets_lost, points_won, points_lost in (
+                (player1_id, sets_p1, sets_p2, points_p1, points_p2),
+                (player2_id, sets_p2, sets_p1, points_p2, points_p1),
+            ):
+                won = int(player_id == winner_id)
+                row = totals.setdefault(player_id, dict.fromkeys(STAT_COLUMNS, 0))
+                row["matches_played"] += sign
+                row["wins"] += sign * won
+                row["losses"] += sign * (1 - won)
+                row["sets_won"] += sign * sets_won
+                row["sets_lost"] += sign * sets_lost
+                row["points_won"] += sign * points_won
+                row["points_lost"] += sign * points_lost
+
+        rows = [{"player_id": player_id, **row} for player_id, row in totals.items()]
+        upsert_increment(self.db, PlayerStats, ["player_id"], rows, STAT_COLUMNS)
+
+    def remove_match(self, match: Match) -> None:
+        """Subtrai uma partida que será excluída; não faz commit"""
+        self.apply_result(
+            match.player1_id,
+            match.player2_id,
+            match.winner_id,
+            [(s.score_p1, s.score_p2) for s in match.sets],
+            sign=-1
+        )
+
+    def get_player_stats(self, player_id: int) -> PlayerStatsSchema:
+        stats = self.db.get(PlayerStats, player_id)
+        if stats is None:
+            if self.db.get(Player, player_id) is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Player not found"
+                )
+            # Jogador sem partidas ainda não tem linha agregada
+            return PlayerStatsSchema(player_id=player_id)
+
+        result = PlayerStatsSchema.model_validate(stats)
+        result.win_percentage = calculate_win_percentage(stats.wins, stats.matches_played)
+        return result
+
+    def rebuild(self) -> int:
+        """Recalcula os agregados de todos os jogadores com um INSERT ... SELECT; retorna quantos jogaram"""
+        set_totals = (
+            select(
+                Set.match_id,
+                func.sum(case((Set.score_p1 > Set.score_p2, 1), else_=0)).label("sets_p1"),
+                func.sum(case((Set.score_p2 > Set.score_p1, 1), else_=0)).label("sets_p2"),
+                func.sum(Set.score_p1).label("points_p1"),
+                func.sum(Set.score_p2).label("points_p2"),
+            )
+            .group_by(Set.match_id)
+            .subquery()
+        )
+
+        def side(player, own, other):
+            return (
+                select(
+                    player.label("player_id"),
+                    case((Match.winner_id == player, 1), else_=0).label("won"),
+                    func.coalesce(getattr(set_totals.c, f"sets_{own}"), 0).label("sets_won"),
+                    func.coalesce(getattr(set_totals.c, f"sets_{other}"), 0).label("sets_lost"),
+                    func.coalesce(getattr(set_totals.c, f"points_{own}"), 0).label("points_won"),
+                    func.coalesce(getattr(set_totals.c, f"points_{other}"), 0).label("points_lost"),
+                )
+                .select_from(Match)
+                .outerjoin(set_totals, set_totals.c.match_id == Match.id)
+            )
+
+        sides = union_all(
+            side(Match.player1_id, "p1", "p2"),
+            side(Match.player2_id, "p2", "p1")
+        ).subquery()
+        totals = (
+            select(
+                sides.c.player_id,
+                func.count(),
+                func.sum(sides.c.won),
+                func.sum(literal(1) - sides.c.won),
+                func.sum(sides.c.sets_won),
+                func.sum(sides.c.sets_lost),
+                func.sum(sides.c.points_won),
+                func.sum(sides.c.points_lost),
+                literal(datetime.now(), DateTime),
+            )
+            .group_by(sides.c.player_id)
+        )
+
+        try:
+            self.db.execute(delete(PlayerStats))
+            self.db.execute(
+                insert(PlayerStats).from_select(
+                    ["player_id", *STAT_COLUMNS, "updated_at"], totals
+                )
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self.db.scalar(select(func.count()).select_from(PlayerStats))
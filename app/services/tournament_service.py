@@ -0,0 +1,346 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import hashlib
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache
+from app.models.league import League
+from app.models.player import Player
+from app.models.tournament import BracketSlot, Round, Tournament
+from app.schemas.tournament import (
+    BracketRound,
+    PlayerOutcome,
+    TournamentBracket,
+    TournamentCreate,
+    TournamentSimulation,
+    TournamentSimulationRequest
+)
+from app.schemas.tournament import BracketSlot as BracketSlotSchema
+from app.services.head_to_head_service import pair_key
+from app.utils.constants import CACHE_TTL
+from app.utils.helpers import generate_tournament_brackets, round_name
+from app.utils.simulation import simulate_tournament
+
+# Resultados por (torneio, jogadores, seeds, parâmetros, snapshot dos ratings)
+simulation_cache = get_cache("tournament_simulation", CACHE_TTL['tournament_simulation'], maxsize=256)
+# Chave completa por torneio; invalidada após o commit de cada resultado
+bracket_cache = get_cache("tournament_brackets", CACHE_TTL['tournament_bracket'])
+
+# (match_id, tournament_id, player1_id, player2_id, winner_id, played_at)
+BracketResult = Tuple[int, Optional[int], int, int, int, datetime]
+
+class TournamentService:
+    def __init__(self, db: Session):
+        self.db = db
+        # Torneios cuja chave mudou na transação corrente
+        self.changed = set()
+
+    def get_ratings(self, player_ids: List[int]) -> List[float]:
+        rows = dict(
+            self.db.query(Player.id, Player.rating).filter(Player.id.in_(player_ids)).all()
+        )
+        missing = [player_id for player_id in player_ids if player_id not in rows]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Players not found: {', '.join(map(str, missing))}"
+            )
+        return [rows[player_id] for player_id in player_ids]
+
+    def simulate(self, request: TournamentSimulationRequest) -> TournamentSimulation:
+        """
+        Simula o torneio request.simulations vezes e retorna, para cada
+        jogador, a probabilidade de chegar a cada rodada e de ser campeão
+        """
+        ratings = self.get_ratings(request.player_ids)
+        cache_key = hashlib.sha1(repr((
+            request.tournament_id,
+            tuple(request.player_ids),
+            tuple(request.seeded_player_ids),
+            request.simulations,
+            request.seed,
+            tuple(ratings)
+        )).encode()).hexdigest()
+        cached = simulation_cache.get(cache_key)
+        if cached is not None:
+            return TournamentSimulation(**cached)
+
+        reached = simulate_tournament(
+            request.player_ids,
+            ratings,
+            request.simulations,
+            seeded_players=request.seeded_player_ids,
+            seed=request.seed
+        )
+        outcomes = [
+            PlayerOutcome(
+                player_id=player_id,
+                rating=rating,
+                round_probabilities=row[:-1],
+                win_probability=row[-1]
+            )
+            for player_id, rating, row in zip(request.player_ids, ratings, reached.tolist())
+        ]
+        outcomes.sort(key=lambda outcome: outcome.win_probability, reverse=True)
+
+        result = TournamentSimulation(
+            tournament_id=request.tournament_id,
+            simulations=request.simulations,
+            rounds=reached.shape[1] - 1,
+            players=outcomes
+        )
+        simulation_cache.set(cache_key, result.model_dump())
+        return result
+
+    def create(self, tournament_in: TournamentCreate) -> TournamentBracket:
+        """Cria o torneio com a chave inteira; quem recebe bye já entra na segunda rodada"""
+        self.get_ratings(tournament_in.player_ids)
+        if tournament_in.league_id is not None and self.db.get(League, tournament_in.league_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="League not found"
+            )
+
+        brackets = generate_tournament_brackets(tournament_in.player_ids, tournament_in.seeded_player_ids)
+        bracket_size = 2 * len(brackets)
+        rounds = bracket_size.bit_length() - 1
+        try:
+            tournament = Tournament(
+                name=tournament_in.name,
+                league_id=tournament_in.league_id,
+                status="In Progress",
+                bracket_size=bracket_size
+            )
+            self.db.add(tournament)
+            self.db.flush()
+            round_ids = self.db.scalars(
+                insert(Round).returning(Round.id, sort_by_parameter_order=True),
+                [{"tournament_id": tournament.id, "number": number} for number in range(1, rounds + 1)]
+            ).all()
+
+            slots = [
+                [
+                    {
+                        "tournament_id": tournament.id,
+                        "round_id": round_ids[number - 1],
+                        "round_number": number,
+                        "position": position,
+                        "player1_id": None,
+                        "player2_id": None,
+                        "winner_id": None,
+                    }
+                    for position in range(bracket_size >> number)
+                ]
+                for number in range(1, rounds + 1)
+            ]
+            for slot, match in zip(slots[0], brackets):
+                slot["player1_id"], slot["player2_id"] = match["player1"], match["player2"]
+                if match["player2"] is None:
+                    # Bye: o jogador avança sem partida
+                    slot["winner_id"] = match["player1"]
+                    side = "player1_id" if slot["position"] % 2 == 0 else "player2_id"
+                    slots[1][slot["position"] // 2][side] = match["player1"]
+            self.db.execute(insert(BracketSlot), [slot for round_slots in slots for slot in round_slots])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self.get_bracket(tournament.id)
+
+    def get_bracket(self, tournament_id: int) -> TournamentBracket:
+        """Chave completa do torneio, servida pelo bracket_cache após a primeira leitura"""
+        cached = bracket_cache.get(str(tournament_id))
+        if cached is not None:
+            return TournamentBracket(**cached)
+
+        tournament = self.db.get(Tournament, tournament_id)
+        if tournament is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tournament not found"
+            )
+        rounds = self.db.execute(
+            select(Round.number, Round.completed_at)
+            .where(Round.tournament_id == tournament_id)
+            .order_by(Round.number)
+        ).all()
+        by_round = {number: [] for number, _ in rounds}
+        slots = self.db.execute(
+            select(
+                BracketSlot.round_number, BracketSlot.position, BracketSlot.player1_id,
+                BracketSlot.player2_id, BracketSlot.winner_id, BracketSlot.match_id
+            )
+            .where(BracketSlot.tournament_id == tournament_id)
+            .order_by(BracketSlot.round_number, BracketSlot.position)
+        )
+        for round_number, *slot in slots:
+            by_round[round_number].append(BracketSlotSchema(**dict(zip(
+                ("position", "player1_id", "player2_id", "winner_id", "match_id"), slot
+            ))))
+
+        bracket = TournamentBracket(
+            id=tournament.id,
+            name=tournament.name,
+            league_id=tournament.league_id,
+            status=tournament.status,
+            bracket_size=tournament.bracket_size,
+            winner_id=tournament.winner_id,
+            created_at=tournament.created_at,
+            rounds=[
+                BracketRound(
+                    number=number,
+                    name=round_name(number, len(rounds)),
+                    completed_at=completed_at,
+                    slots=by_round[number]
+                )
+                for number, completed_at in rounds
+            ]
+        )
+        bracket_cache.set(str(tournament_id), bracket.model_dump(mode="json"))
+        return bracket
+
+    def record_results(self, results: Iterable[BracketResult]) -> List[Tuple[int, datetime]]:
+        """Preenche as posições decididas e avança os vencedores; retorna (campeão, data) das finais. Não faz commit"""
+        results = sorted((r for r in results if r[1] is not None), key=lambda r: (r[5], r[0]))
+        if not results:
+            return []
+        self.db.flush()
+        tournaments = {
+            tournament.id: tournament
+            for tournament in self.db.query(Tournament).filter(Tournament.id.in_({r[1] for r in results}))
+        }
+
+        champions = []
+        for match_id, tournament_id, player1_id, player2_id, winner_id, played_at in results:
+            tournament = tournaments.get(tournament_id)
+            if tournament is None:
+                continue
+            slot = self.db.query(BracketSlot).filter(
+                BracketSlot.tournament_id == tournament_id,
+                BracketSlot.winner_id.is_(None),
+                or_(
+                    and_(BracketSlot.player1_id == player1_id, BracketSlot.player2_id == player2_id),
+                    and_(BracketSlot.player1_id == player2_id, BracketSlot.player2_id == player1_id)
+                )
+            ).first()
+            if slot is None:
+                raise ValueError(
+                    f"Players {player1_id} and {player2_id} have no open match in tournament {tournament_id}"
+                )
+            slot.winner_id = winner_id
+            slot.match_id = match_id
+
+            next_slot = self._next_slot(tournament, slot)
+            if next_slot is None:
+                tournament.winner_id = winner_id
+                tournament.status = "Completed"
+                champions.append((winner_id, played_at))
+            else:
+                setattr(next_slot, self._side(slot), winner_id)
+            self.db.flush()
+
+            # Última partida da rodada
+            if not self.db.scalar(
+                select(func.count()).select_from(BracketSlot)
+                .where(BracketSlot.round_id == slot.round_id, BracketSlot.winner_id.is_(None))
+            ):
+                self.db.get(Round, slot.round_id).completed_at = played_at
+            self.changed.add(tournament_id)
+        return champions
+
+    def find_unplaced(self, results: Iterable[BracketResult]) -> Dict[int, str]:
+        """Resultados do lote sem posição aberta na chave, simulando o avanço em memória: {id: erro}"""
+        results = sorted((r for r in results if r[1] is not None), key=lambda r: (r[5], r[0]))
+        if not results:
+            return {}
+        # (torneio, rodada, posição) -> [player1_id, player2_id, winner_id], com o tamanho da chave
+        sizes = {}
+        slots = {}
+        for row in self.db.execute(
+            select(
+                BracketSlot.tournament_id, BracketSlot.round_number, BracketSlot.position,
+                BracketSlot.player1_id, BracketSlot.player2_id, BracketSlot.winner_id,
+                Tournament.bracket_size
+            )
+            .join(Tournament, Tournament.id == BracketSlot.tournament_id)
+            .where(BracketSlot.tournament_id.in_({r[1] for r in results}))
+        ):
+            sizes[row.tournament_id] = row.bracket_size
+            slots[row.tournament_id, row.round_number, row.position] = [
+                row.player1_id, row.player2_id, row.winner_id
+            ]
+        # (torneio, menor id, maior id) -> posição aberta do par, mantido a cada avanço
+        open_slots = {}
+
+        def track(key):
+            player1_id, player2_id, winner_id = slots[key]
+            if winner_id is None and player1_id is not None and player2_id is not None:
+                open_slots[(key[0],) + pair_key(player1_id, player2_id)] = key
+
+        for key in slots:
+            track(key)
+
+        errors = {}
+        for result_id, tournament_id, player1_id, player2_id, winner_id, _ in results:
+            if tournament_id not in sizes:
+                continue
+            key = open_slots.pop((tournament_id,) + pair_key(player1_id, player2_id), None)
+            if key is None:
+                errors[result_id] = (
+                    f"Players {player1_id} and {player2_id} have no open match in tournament {tournament_id}"
+                )
+                continue
+            slots[key][2] = winner_id
+            _, round_number, position = key
+            if 1 << round_number != sizes[tournament_id]:
+                next_key = (tournament_id, round_number + 1, position // 2)
+                slots[next_key][position % 2] = winner_id
+                track(next_key)
+        return errors
+
+    def reset_result(self, match_id: int) -> Optional[int]:
+        """Desfaz a posição decidida pela partida; numa final, retorna o campeão que perde o título. Não faz commit"""
+        self.db.flush()
+        slot = self.db.query(BracketSlot).filter(BracketSlot.match_id == match_id).first()
+        if slot is None:
+            return None
+        tournament = self.db.get(Tournament, slot.tournament_id)
+        next_slot = self._next_slot(tournament, slot)
+        champion_id = None
+        if next_slot is None:
+            champion_id = tournament.winner_id
+            tournament.winner_id = None
+            tournament.status = "In Progress"
+        elif next_slot.winner_id is not None:
+            raise ValueError("The winner of this match already played the next round")
+        else:
+            setattr(next_slot, self._side(slot), None)
+
+        slot.winner_id = None
+        slot.match_id = None
+        self.db.get(Round, slot.round_id).completed_at = None
+        self.changed.add(tournament.id)
+        return champion_id
+
+    def invalidate_brackets(self) -> None:
+        """Remove do cache as chaves alteradas pela última escrita confirmada"""
+        for tournament_id in self.changed:
+            bracket_cache.delete(str(tournament_id))
+        self.changed.clear()
+
+    def _next_slot(self, tournament: Tournament, slot: BracketSlot) -> Optional[BracketSlot]:
+        """Posição para onde vai o vencedor; None na final"""
+        if 1 << slot.round_number == tournament.bracket_size:
+            return None
+        return self.db.query(BracketSlot).filter(
+            BracketSlot.tournament_id == tournament.id,
+            BracketSlot.round_number == slot.round_number + 1,
+            BracketSlot.position == slot.position // 2
+        ).one()
+
+    @staticmethod
+    def _side(slot: BracketSlot) -> str:
+        return "player1_id" if slot.position % 2 == 0 else "player2_id"
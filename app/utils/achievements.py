@@ -0,0 +1,133 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .constants import ACHIEVEMENTS
+
+
+class Award(NamedTuple):
+    player_id: int
+    achievement: str
+    level: str
+    match_id: Optional[int]
+    awarded_at: datetime
+
+
+class PlayerProgress:
+    """Running counters of one player, as of the last event consumed."""
+    __slots__ = (
+        "matches_played", "current_streak", "best_streak",
+        "tournaments_won", "last_match_at", "last_match_id"
+    )
+
+    def __init__(
+        self,
+        matches_played: int = 0,
+        current_streak: int = 0,
+        best_streak: int = 0,
+        tournaments_won: int = 0,
+        last_match_at: Optional[datetime] = None,
+        last_match_id: Optional[int] = None
+    ):
+        self.matches_played = matches_played
+        self.current_streak = current_streak
+        self.best_streak = best_streak
+        self.tournaments_won = tournaments_won
+        self.last_match_at = last_match_at
+        self.last_match_id = last_match_id
+
+    def is_after_last(self, played_at: datetime, match_id: int) -> bool:
+        """Whether a match at (played_at, match_id) comes after every consumed one"""
+        return self.last_match_at is None or (self.last_match_at, self.last_match_id) < (played_at, match_id)
+
+
+class AchievementEngine:
+    """
+    Consumes match events in chronological order and awards badges as
+    counters reach the ACHIEVEMENTS thresholds.
+
+    Every counter grows by at most one per event, so a threshold is reached
+    exactly when the counter equals it: each event costs one dict lookup
+    per achievement type, whatever the history length.
+    """
+
+    def __init__(self, thresholds: Dict[str, Dict[str, int]] = ACHIEVEMENTS):
+        self.levels: Dict[str, Dict[int, str]] = {
+            achievement: {value: level for level, value in levels.items()}
+            for achievement, levels in thresholds.items()
+        }
+        self.progress: Dict[int, PlayerProgress] = {}
+
+    def get(self, player_id: int) -> PlayerProgress:
+        progress = self.progress.get(player_id)
+        if progress is None:
+            progress = self.progress[player_id] = PlayerProgress()
+        return progress
+
+    def record_result(
+        self,
+        player_id: int,
+        won: bool,
+        match_id: int,
+        played_at: datetime
+    ) -> List[Award]:
+        """Applies one match to one player's counters"""
+        progress = self.get(player_id)
+        progress.matches_played += 1
+        progress.current_streak = progress.current_streak + 1 if won else 0
+        progress.last_match_at = played_at
+        progress.last_match_id = match_id
+
+        awards = self._check(player_id, 'matches_played', progress.matches_played, match_id, played_at)
+        if progress.current_streak > progress.best_streak:
+            progress.best_streak = progress.current_streak
+            awards += self._check(player_id, 'winning_streak', progress.best_streak, match_id, played_at)
+        return awards
+
+    def record_match(
+        self,
+        match_id: int,
+        player1_id: int,
+        player2_id: int,
+        winner_id: int,
+        played_at: datetime
+    ) -> List[Award]:
+        return (
+            self.record_result(player1_id, winner_id == player1_id, match_id, played_at)
+            + self.record_result(player2_id, winner_id == player2_id, match_id, played_at)
+        )
+
+    def record_tournament_win(self, player_id: int, played_at: datetime) -> List[Award]:
+        progress = self.get(player_id)
+        progress.tournaments_won += 1
+        return self._check(player_id, 'tournaments_won', progress.tournaments_won, None, played_at)
+
+    def remove_tournament_win(self, player_id: int) -> Optional[str]:
+        """Undoes one title; returns the level the removed title had reached, if any"""
+        progress = self.get(player_id)
+        level = self.levels.get('tournaments_won', {}).get(progress.tournaments_won)
+        progress.tournaments_won = max(progress.tournaments_won - 1, 0)
+        return level
+
+    def consume(
+        self,
+        matches: Iterable[Tuple[int, int, int, int, datetime]]
+    ) -> Iterable[Award]:
+        """
+        Streams the awards of a chronological iterable of
+        (match_id, player1_id, player2_id, winner_id, played_at) rows.
+        """
+        for match_id, player1_id, player2_id, winner_id, played_at in matches:
+            yield from self.record_match(match_id, player1_id, player2_id, winner_id, played_at)
+
+    def _check(
+        self,
+        player_id: int,
+        achievement: str,
+        value: int,
+        match_id: Optional[int],
+        awarded_at: datetime
+    ) -> List[Award]:
+        level = self.levels.get(achievement, {}).get(value)
+        if level is None:
+            return []
+        return [Award(player_id, achievement, level, match_id, awarded_at)]
@@ -0,0 +1,168 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional
+import json
+import math
+import time
+
+
+class CacheBackend:
+    """
+    Key-value cache whose entries expire after a TTL.
+
+    Values must be JSON-serializable so that every backend stores them the
+    same way; callers rebuild their objects from what get returns.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class TTLCache(CacheBackend):
+    """
+    Small in-process LRU cache whose entries expire after a fixed TTL.
+
+    Safe to share between the threads of one worker process.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache shared by every worker process, stored as JSON strings under
+    "<namespace>:<key>" with the TTL enforced by Redis.
+    """
+
+    def __init__(self, client, namespace: str, ttl: float):
+        self.client = client
+        self.namespace = namespace
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self._name(key))
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self.client.set(self._name(key), json.dumps(value), ex=max(1, math.ceil(ttl)))
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self._name(key))
+
+    def clear(self) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        for name in self.client.scan_iter(match=f"{self.namespace}:*", count=500):
+            pipe.delete(name)
+        pipe.execute()
+
+    def _name(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+
+class TieredCache(CacheBackend):
+    """
+    Two-tier cache: an in-process TTLCache in front of an optional shared
+    backend (Redis). Reads try the local tier, then the shared one (filling
+    the local tier on a hit); writes and deletes go to both.
+
+    A delete only reaches the local tier of the process that made it, so the
+    local TTL bounds how long other processes may serve a stale entry.
+    Hit and miss counters per tier are kept for monitoring.
+    """
+
+    def __init__(self, local: TTLCache, shared: Optional[CacheBackend] = None):
+        self.local = local
+        self.shared = shared
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None:
+            self._count("local_hits")
+            return value
+        if self.shared is not None:
+            value = self.shared.get(key)
+            if value is not None:
+                self._count("shared_hits")
+                self.local.set(key, value)
+                return value
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if self.shared is not None:
+            self.shared.set(key, value, ttl)
+        self.local.set(key, value, None if ttl is None else min(ttl, self.local.ttl))
+
+    def delete(self, key: str) -> None:
+        if self.shared is not None:
+            self.shared.delete(key)
+        self.local.delete(key)
+
+    def clear(self) -> None:
+        if self.shared is not None:
+            self.shared.clear()
+        self.local.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.local_hits + self.shared_hits
+            total = hits + self.misses
+            return {
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_ratio": hits / total if total else 0.0,
+                "local_size": len(self.local),
+            }
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
@@ -5,17 +5,46 @@ INITIAL_RATING = 1000
 K_FACTOR = 32  # Base K-factor for ELO calculation
 MIN_RATING = 100
 MAX_RATING = 3000
+RATING_CHECKPOINT_INTERVAL = 500  # Matches between rating ledger checkpoints
+
+# Rating Systems
+RATING_SYSTEMS = {'elo', 'glicko2', 'gaussian'}
+DEFAULT_RATING_SYSTEM = 'elo'
+RATING_PERIOD_DAYS = 7  # Matches in the same period are rated as one batch
+GLICKO2_INITIAL_RD = 350
+GLICKO2_INITIAL_VOLATILITY = 0.06
+GLICKO2_TAU = 0.5
+GAUSSIAN_INITIAL_SIGMA = INITIAL_RATING / 3
+GAUSSIAN_BETA = GAUSSIAN_INITIAL_SIGMA / 2
+GAUSSIAN_TAU = GAUSSIAN_INITIAL_SIGMA / 100
 
 # Tournament Constants
 MIN_PLAYERS_TOURNAMENT = 4
 MAX_PLAYERS_TOURNAMENT = 64
 TOURNAMENT_BONUS_MULTIPLIER = 1.5
-TOURNAMENT_STATUSES = { "Pending" }
+TOURNAMENT_STATUSES = { "Pending", "In Progress", "Completed" }
+DEFAULT_TOURNAMENT_SIMULATIONS = 100_000
+MAX_TOURNAMENT_SIMULATIONS = 1_000_000
+
+# Scheduling (round-robin groups and Swiss events)
+MAX_PLAYERS_SCHEDULE = 512
+MAX_SCHEDULE_TABLES = 200
+SWISS_MAX_STEPS = 5_000  # Search nodes of the greedy search before the blossom matching takes over
+SWISS_SCORE_WEIGHT = 1_000  # Rating points one point of score difference is worth when pairing
 
 # Match Constants
 GAMES_TO_WIN = 3  # Best of 5
 MIN_POINTS_TO_WIN = 11
 MIN_POINT_DIFFERENCE = 2
+MAX_BULK_MATCHES = 1000  # Matches per bulk ingest request
+
+# Match Import
+IMPORT_CHUNK_SIZE = 500  # Matches inserted per transaction
+IMPORT_USERNAME_CACHE_SIZE = 10_000  # Username -> id lookups kept in memory
+MAX_IMPORT_ERRORS = 100  # Rejected lines reported in detail
+
+# Export
+EXPORT_BATCH_SIZE = 1000  # Rows fetched per round trip and written per response chunk
 
 # Player Categories
 PLAYER_CATEGORIES = {
@@ -29,8 +58,27 @@ PLAYER_CATEGORIES = {
 CACHE_TTL = {
     'rankings': 3600,  # 1 hour
     'statistics': 1800,  # 30 minutes
-    'player_profile': 300  # 5 minutes
+    'player_profile': 300,  # 5 minutes; writers also invalidate
+    'tournament_simulation': 600,  # 10 minutes
+    'rating_history': 900,  # 15 minutes
+    'league_ratings': 900,  # 15 minutes; keyed by the league version
+    'tournament_bracket': 600,  # 10 minutes; results also invalidate
+    'counts': 300  # 5 minutes; writers also invalidate
 }
+# Vida máxima no cache local quando há Redis: limita quanto tempo outro
+# processo pode servir um perfil já invalidado
+LOCAL_CACHE_TTL = 30
+PLAYER_CACHE_SIZE = 10_000
+
+# Compressão negociada (Accept-Encoding) das respostas
+COMPRESSION_MIN_SIZE = 1024  # Bytes; respostas menores seguem sem compressão
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+# Rating History
+DEFAULT_RATING_HISTORY_POINTS = 500  # Points kept by LTTB downsampling
+MAX_RATING_HISTORY_POINTS = 5000
 
 # Pagination
 DEFAULT_PAGE_SIZE = 20
@@ -44,6 +92,7 @@ RATE_LIMIT_API = {
 }
 
 # Achievement Thresholds
+ACHIEVEMENT_BATCH_SIZE = 1000  # Rows per fetch/insert while backfilling achievements
 ACHIEVEMENTS = {
     'winning_streak': {
         'bronze': 5,
@@ -0,0 +1,51 @@
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling (Steinarsson, 2013).
+
+    Keeps the first and last points and, for each of the threshold - 2
+    buckets in between, the point forming the largest triangle with the
+    point kept in the previous bucket and the average of the next bucket,
+    which preserves the peaks and valleys a chart needs.
+
+    Args:
+        x (np.ndarray): Increasing x coordinates (e.g. timestamps)
+        y (np.ndarray): Values at each x
+        threshold (int): Number of points to keep
+
+    Returns:
+        np.ndarray: Sorted indices of the kept points
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Limites dos buckets internos sobre os pontos 1..n-2
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_stop = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_stop = n - 1, n
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+
+        # Área (dobrada) do triângulo previous -> candidato -> média do próximo bucket
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
@@ -1,14 +1,31 @@
+from bisect import bisect_right
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple, Any
 import math
 from .constants import (
+    GAMES_TO_WIN,
     INITIAL_RATING,
     K_FACTOR,
     MIN_RATING,
     MAX_RATING,
+    MIN_POINT_DIFFERENCE,
+    MIN_POINTS_TO_WIN,
     PLAYER_CATEGORIES
 )
 
+def elo_expected_score(player_rating: float, opponent_rating: float) -> float:
+    """
+    Expected score (win probability) of a player against an opponent.
+    
+    Args:
+        player_rating (float): Current rating of the player
+        opponent_rating (float): Current rating of the opponent
+        
+    Returns:
+        float: Expected score between 0 and 1
+    """
+    return 1 / (1 + math.pow(10, (opponent_rating - player_rating) / 400))
+
 def calculate_elo_rating(
     player_rating: float,
     opponent_rating: float,
@@ -27,26 +44,31 @@ def calculate_elo_rating(
     Returns:
         float: New rating for the player
     """
-    expected_score = 1 / (1 + math.pow(10, (opponent_rating - player_rating) / 400))
+    expected_score = elo_expected_score(player_rating, opponent_rating)
     actual_score = 1.0 if won else 0.0
     new_rating = player_rating + k_factor * (actual_score - expected_score)
     
     return max(min(new_rating, MAX_RATING), MIN_RATING)
 
+# Limites inferiores das categorias em ordem crescente, para busca binária
+_CATEGORY_BOUNDS = sorted((min_rating, category) for category, (min_rating, _) in PLAYER_CATEGORIES.items())
+CATEGORY_LOWER_BOUNDS = [min_rating for min_rating, _ in _CATEGORY_BOUNDS]
+CATEGORY_NAMES = [category for _, category in _CATEGORY_BOUNDS]
+
 def get_player_category(rating: float) -> str:
     """
     Determine player's category based on their rating.
     
+    A rating between two ranges (e.g. 1200.5) belongs to the lower category.
+    
     Args:
         rating (float): Player's current rating
         
     Returns:
         str: Category name
     """
-    for category, (min_rating, max_rating) in PLAYER_CATEGORIES.items():
-        if min_rating <= rating <= max_rating:
-            return category
-    return 'beginner'
+    index = bisect_right(CATEGORY_LOWER_BOUNDS, rating) - 1
+    return CATEGORY_NAMES[max(index, 0)]
 
 def calculate_win_percentage(wins: int, total_matches: int) -> float:
     """
@@ -63,6 +85,21 @@ def calculate_win_percentage(wins: int, total_matches: int) -> float:
         return 0.0
     return round((wins / total_matches) * 100, 2)
 
+def calculate_percentile(rank: int, total: int) -> float:
+    """
+    Calculate the percentile of a ranking position.
+    
+    Args:
+        rank (int): Position in the ranking, 1 being the best
+        total (int): Number of ranked players
+        
+    Returns:
+        float: Percentage of players ranked at or below the position, between 0 and 100
+    """
+    if total == 0:
+        return 0.0
+    return round(((total - rank + 1) / total) * 100, 2)
+
 def format_duration(start_time: datetime, end_time: datetime) -> str:
     """
     Format the duration between two timestamps.
@@ -117,51 +154,107 @@ def paginate_results(
     
     return paginated_items, pagination_meta
 
+def seed_order(bracket_size: int) -> List[int]:
+    """
+    Standard seeding layout of a single-elimination bracket.
+
+    Each doubling replaces seed s by the pair (s, size + 1 - s), so seed 1
+    meets the lowest seed, 1 and 2 can only meet in the final, 1-4 in the
+    semifinals and so on. Built in O(bracket_size).
+
+    Args:
+        bracket_size (int): Power of two
+
+    Returns:
+        List[int]: Seed (1-based) at each bracket position, in pairs
+    """
+    order = [1]
+    while len(order) < bracket_size:
+        total = 2 * len(order) + 1
+        order = [seed for s in order for seed in (s, total - s)]
+    return order
+
 def generate_tournament_brackets(
     players: List[str],
     seeded_players: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
-    Generate tournament brackets based on number of players and seeds.
+    Generate the first round of a single-elimination bracket.
+
+    Seeded players rank first, in the given order, followed by the rest in
+    the order of players. Ranks are placed with seed_order and the missing
+    ranks beyond len(players) become byes, so byes go to the best seeds and
+    are spread across the bracket halves. Runs in O(len(players)).
     
     Args:
         players (List[str]): List of player IDs
-        seeded_players (Optional[List[str]]): List of seeded player IDs
+        seeded_players (Optional[List[str]]): List of seeded player IDs, best first
         
     Returns:
-        List[Dict[str, Any]]: Tournament bracket structure
+        List[Dict[str, Any]]: Round-1 matches; player2 is None for a bye
     """
     num_players = len(players)
     bracket_size = 2 ** math.ceil(math.log2(num_players))
-    byes = bracket_size - num_players
-    
-    # Initialize brackets
-    brackets = []
-    seeded_players = seeded_players or []
-    unseeded_players = [p for p in players if p not in seeded_players]
-    
-    # Distribute seeds and byes optimally
-    for i in range(bracket_size // 2):
-        match = {
+
+    seeded_players = list(dict.fromkeys(seeded_players or []))
+    seeded = set(seeded_players)
+    ranked = seeded_players + [p for p in players if p not in seeded]
+
+    # A posição 2i recebe sempre o melhor seed do par; o pior pode ser um bye
+    order = seed_order(bracket_size)
+    return [
+        {
             "match_id": i + 1,
             "round": 1,
-            "player1": None,
-            "player2": None
+            "player1": ranked[order[2 * i] - 1],
+            "player2": ranked[order[2 * i + 1] - 1] if order[2 * i + 1] <= num_players else None
         }
-        
-        # Add seeded players first
-        if i < len(seeded_players):
-            match["player1"] = seeded_players[i]
-        elif unseeded_players:
-            match["player1"] = unseeded_players.pop(0)
-            
-        # Add second player or bye
-        if unseeded_players:
-            match["player2"] = unseeded_players.pop(0)
-            
-        brackets.append(match)
-    
-    return brackets
+        for i in range(bracket_size // 2)
+    ]
+
+def round_name(round_number: int, rounds: int) -> str:
+    """Display name of a bracket round ("Final", "Semifinals", "Round of 16"...)"""
+    remaining = rounds - round_number
+    if remaining == 0:
+        return "Final"
+    if remaining == 1:
+        return "Semifinals"
+    if remaining == 2:
+        return "Quarterfinals"
+    return f"Round of {2 ** (remaining + 1)}"
+
+def validate_match_sets(sets: List[Tuple[int, int, int]]) -> Optional[str]:
+    """
+    Check that sets form a complete best-of-(2 * GAMES_TO_WIN - 1) match.
+
+    A set is won by reaching MIN_POINTS_TO_WIN with a MIN_POINT_DIFFERENCE
+    lead, so the winner's score must be exactly max(MIN_POINTS_TO_WIN,
+    loser + MIN_POINT_DIFFERENCE), and no set may follow the deciding one.
+
+    Args:
+        sets (List[Tuple[int, int, int]]): (set_number, score_p1, score_p2) of each set
+
+    Returns:
+        Optional[str]: Description of the first problem found, None if valid
+    """
+    if not sets:
+        return "Match must have at least one set"
+    sets = sorted(sets)
+    if [number for number, _, _ in sets] != list(range(1, len(sets) + 1)):
+        return "Set numbers must be consecutive starting at 1"
+
+    won = [0, 0]
+    for number, score_p1, score_p2 in sets:
+        if max(won) == GAMES_TO_WIN:
+            return f"Set {number} played after the match was decided"
+        high, low = max(score_p1, score_p2), min(score_p1, score_p2)
+        if low < 0 or high != max(MIN_POINTS_TO_WIN, low + MIN_POINT_DIFFERENCE):
+            return f"Invalid score in set {number}: {score_p1}-{score_p2}"
+        won[0 if score_p1 > score_p2 else 1] += 1
+
+    if max(won) != GAMES_TO_WIN:
+        return f"A player must win {GAMES_TO_WIN} sets"
+    return None
 
 def utc_now() -> datetime:
     """
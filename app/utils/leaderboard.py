@@ -0,0 +1,418 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from threading import RLock
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import math
+import time
+
+# (rank, player_id, rating)
+LeaderboardEntry = Tuple[int, int, float]
+
+
+class Leaderboard:
+    """
+    Order-statistic leaderboard over a sorted array of (-rating, -player_id)
+    keys. Rank, page and neighbourhood lookups are binary searches; an
+    update is one bisect to remove the old key and one to insert the new.
+
+    Ties share the same (competition) rank: 1 + number of better ratings.
+    Within a tie the highest player id is listed first, which is the order
+    Redis gives equal scores in a descending range.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[float, int]] = []
+        self._ratings: Dict[int, float] = {}
+        self._lock = RLock()
+        self.loaded_at: Optional[float] = None
+
+    def load(self, ratings: Iterable[Tuple[int, float]]) -> None:
+        """Replaces the whole leaderboard with (player_id, rating) pairs"""
+        with self._lock:
+            self._ratings = {player_id: float(rating) for player_id, rating in ratings}
+            self._keys = sorted((-rating, -player_id) for player_id, rating in self._ratings.items())
+            self.loaded_at = time.monotonic()
+
+    def is_stale(self, ttl: float) -> bool:
+        """Whether the board was never loaded or was loaded more than ttl seconds ago"""
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > ttl
+
+    def update(self, player_id: int, rating: float) -> None:
+        with self._lock:
+            self._discard(player_id)
+            self._ratings[player_id] = float(rating)
+            insort(self._keys, (-float(rating), -player_id))
+
+    def remove(self, player_id: int) -> None:
+        with self._lock:
+            self._discard(player_id)
+
+    def rating(self, player_id: int) -> Optional[float]:
+        return self._ratings.get(player_id)
+
+    def rank(self, player_id: int) -> Optional[int]:
+        with self._lock:
+            rating = self._ratings.get(player_id)
+            if rating is None:
+                return None
+            return bisect_left(self._keys, (-rating,)) + 1
+
+    def entries(self, start: int, stop: int) -> List[LeaderboardEntry]:
+        """Entries at positions [start, stop) of the leaderboard, best first"""
+        with self._lock:
+            return [
+                (bisect_left(self._keys, (negative_rating,)) + 1, -negative_id, -negative_rating)
+                for negative_rating, negative_id in self._keys[max(start, 0):max(stop, 0)]
+            ]
+
+    def page(self, page: int, page_size: int) -> List[LeaderboardEntry]:
+        start = (page - 1) * page_size
+        return self.entries(start, start + page_size)
+
+    def around(self, player_id: int, size: int = 10) -> List[LeaderboardEntry]:
+        """The size entries centred on player_id (shifted at the edges)"""
+        with self._lock:
+            rating = self._ratings.get(player_id)
+            if rating is None:
+                return []
+            position = bisect_left(self._keys, (-rating, -player_id))
+            start = min(max(position - size // 2, 0), max(len(self._keys) - size, 0))
+            return self.entries(start, start + size)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._ratings
+
+    def _discard(self, player_id: int) -> None:
+        rating = self._ratings.pop(player_id, None)
+        if rating is not None:
+            key = (-rating, -player_id)
+            index = bisect_left(self._keys, key)
+            if index < len(self._keys) and self._keys[index] == key:
+                del self._keys[index]
+
+
+class CategorizedLeaderboard(Leaderboard):
+    """
+    Leaderboard that also keeps one Leaderboard per category. A player moves
+    between category boards only when an update crosses a category boundary,
+    so category sizes are always available in O(1).
+    """
+
+    def __init__(self, categories: Iterable[str], categorize: Callable[[float], str]):
+        super().__init__()
+        self.categorize = categorize
+        self.categories: Dict[str, Leaderboard] = {name: Leaderboard() for name in categories}
+        self._category_of: Dict[int, str] = {}
+
+    def load(self, ratings: Iterable[Tuple[int, float]]) -> None:
+        with self._lock:
+            ratings = list(ratings)
+            super().load(ratings)
+            self._category_of = {}
+            buckets: Dict[str, List[Tuple[int, float]]] = {name: [] for name in self.categories}
+            for player_id, rating in ratings:
+                category = self.categorize(rating)
+                self._category_of[player_id] = category
+                buckets[category].append((player_id, rating))
+            for name, board in self.categories.items():
+                board.load(buckets[name])
+
+    def update(self, player_id: int, rating: float) -> None:
+        with self._lock:
+            super().update(player_id, rating)
+            category = self.categorize(rating)
+            previous = self._category_of.get(player_id)
+            if previous is not None and previous != category:
+                self.categories[previous].remove(player_id)
+            self._category_of[player_id] = category
+            self.categories[category].update(player_id, rating)
+
+    def remove(self, player_id: int) -> None:
+        with self._lock:
+            super().remove(player_id)
+            category = self._category_of.pop(player_id, None)
+            if category is not None:
+                self.categories[category].remove(player_id)
+
+    def category(self, player_id: int) -> Optional[str]:
+        return self._category_of.get(player_id)
+
+    def category_counts(self) -> Dict[str, int]:
+        return {name: len(board) for name, board in self.categories.items()}
+
+
+class LeaderboardBackend(ABC):
+    """
+    Storage of the materialized ranking: the whole leaderboard plus one per
+    category, addressed with category=None for the whole ranking.
+
+    Updates are ignored while the backend is not loaded; the next load
+    reads them from the database anyway.
+    """
+    categories: List[str]
+    categorize: Callable[[float], str]
+
+    @abstractmethod
+    def is_stale(self) -> bool:
+        """Whether the ranking must be (re)loaded from the database"""
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Marks the ranking stale so the next read reloads it"""
+
+    @abstractmethod
+    def load(self, ratings: Iterable[Tuple[int, float]]) -> None:
+        """Replaces the whole ranking with (player_id, rating) pairs"""
+
+    @abstractmethod
+    def update_many(self, ratings: Dict[int, float], existing_only: bool = False) -> None:
+        """
+        Sets the rating of several players at once.
+
+        Args:
+            ratings (Dict[int, float]): New rating by player id
+            existing_only (bool): Skip players that are not on the leaderboard
+        """
+
+    @abstractmethod
+    def remove(self, player_id: int) -> None:
+        """Takes a player off the ranking"""
+
+    @abstractmethod
+    def rating(self, player_id: int) -> Optional[float]:
+        """Rating of a player on the ranking, None if absent"""
+
+    @abstractmethod
+    def rank(self, player_id: int, category: Optional[str] = None) -> Optional[int]:
+        """Competition rank of a player, None if absent"""
+
+    @abstractmethod
+    def size(self, category: Optional[str] = None) -> int:
+        """Number of ranked players"""
+
+    @abstractmethod
+    def page(self, page: int, page_size: int, category: Optional[str] = None) -> List[LeaderboardEntry]:
+        """Entries of one 1-based page"""
+
+    @abstractmethod
+    def around(self, player_id: int, size: int = 10, category: Optional[str] = None) -> List[LeaderboardEntry]:
+        """Entries centred on a player"""
+
+    @abstractmethod
+    def category_counts(self) -> Dict[str, int]:
+        """Number of ranked players per category"""
+
+    def category(self, player_id: int) -> Optional[str]:
+        rating = self.rating(player_id)
+        return None if rating is None else self.categorize(rating)
+
+
+class MemoryLeaderboardBackend(LeaderboardBackend):
+    """Per-process backend over a CategorizedLeaderboard, reloaded after ttl seconds."""
+
+    def __init__(self, categories: Iterable[str], categorize: Callable[[float], str], ttl: float):
+        self.board = CategorizedLeaderboard(categories, categorize)
+        self.categories = list(self.board.categories)
+        self.categorize = categorize
+        self.ttl = ttl
+
+    def is_stale(self) -> bool:
+        return self.board.is_stale(self.ttl)
+
+    def invalidate(self) -> None:
+        self.board.loaded_at = None
+
+    def load(self, ratings: Iterable[Tuple[int, float]]) -> None:
+        self.board.load(ratings)
+
+    def update_many(self, ratings: Dict[int, float], existing_only: bool = False) -> None:
+        if self.board.loaded_at is None:
+            return
+        for player_id, rating in ratings.items():
+            if not existing_only or player_id in self.board:
+                self.board.update(player_id, rating)
+
+    def remove(self, player_id: int) -> None:
+        if self.board.loaded_at is not None:
+            self.board.remove(player_id)
+
+    def rating(self, player_id: int) -> Optional[float]:
+        return self.board.rating(player_id)
+
+    def rank(self, player_id: int, category: Optional[str] = None) -> Optional[int]:
+        return self._board(category).rank(player_id)
+
+    def size(self, category: Optional[str] = None) -> int:
+        return len(self._board(category))
+
+    def page(self, page: int, page_size: int, category: Optional[str] = None) -> List[LeaderboardEntry]:
+        return self._board(category).page(page, page_size)
+
+    def around(self, player_id: int, size: int = 10, category: Optional[str] = None) -> List[LeaderboardEntry]:
+        return self._board(category).around(player_id, size)
+
+    def category_counts(self) -> Dict[str, int]:
+        return self.board.category_counts()
+
+    def _board(self, category: Optional[str]) -> Leaderboard:
+        return self.board if category is None else self.board.categories[category]
+
+
+class RedisLeaderboardBackend(LeaderboardBackend):
+    """
+    Backend shared by every worker process, kept in Redis sorted sets: one
+    for the whole ranking and one per category, all expiring together with
+    a "loaded" marker after ttl seconds.
+
+    Members are zero-padded player ids, so a descending range lists equal
+    ratings by highest id first, exactly like Leaderboard. Reads take at
+    most two round trips and a batch of updates two pipelines, whatever
+    its size.
+    """
+
+    def __init__(
+        self,
+        client,
+        categories: Iterable[str],
+        categorize: Callable[[float], str],
+        ttl: float,
+        prefix: str = "rankings",
+        batch_size: int = 1000
+    ):
+        self.client = client
+        self.categories = list(categories)
+        self.categorize = categorize
+        self.ttl = max(1, math.ceil(ttl))
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self._loaded_key = f"{prefix}:loaded"
+
+    def is_stale(self) -> bool:
+        return not self.client.exists(self._loaded_key)
+
+    def invalidate(self) -> None:
+        self.client.delete(self._loaded_key)
+
+    def load(self, ratings: Iterable[Tuple[int, float]]) -> None:
+        boards: Dict[Optional[str], Dict[str, float]] = {None: {}}
+        boards.update((name, {}) for name in self.categories)
+        for player_id, rating in ratings:
+            member, rating = self._member(player_id), float(rating)
+            boards[None][member] = rating
+            boards[self.categorize(rating)][member] = rating
+
+        # MULTI/EXEC: os outros workers nunca veem o ranking pela metade
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(*(self._key(category) for category in boards))
+        for category, members in boards.items():
+            items = list(members.items())
+            for offset in range(0, len(items), self.batch_size):
+                pipe.zadd(self._key(category), dict(items[offset:offset + self.batch_size]))
+            pipe.expire(self._key(category), self.ttl)
+        pipe.set(self._loaded_key, 1, ex=self.ttl)
+        pipe.execute()
+
+    def update_many(self, ratings: Dict[int, float], existing_only: bool = False) -> None:
+        if not ratings:
+            return
+        player_ids = list(ratings)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.exists(self._loaded_key)
+        if existing_only:
+            for player_id in player_ids:
+                pipe.zscore(self._key(), self._member(player_id))
+        loaded, *scores = pipe.execute()
+        if not loaded:
+            return
+        if existing_only:
+            player_ids = [player_id for player_id, score in zip(player_ids, scores) if score is not None]
+            if not player_ids:
+                return
+
+        members = {self._member(player_id): float(ratings[player_id]) for player_id in player_ids}
+        buckets: Dict[str, Dict[str, float]] = {name: {} for name in self.categories}
+        for member, rating in members.items():
+            buckets[self.categorize(rating)][member] = rating
+
+        pipe = self.client.pipeline(transaction=True)
+        pipe.zadd(self._key(), members)
+        for name, bucket in buckets.items():
+            others = [member for member in members if member not in bucket]
+            if others:
+                pipe.zrem(self._key(name), *others)
+            if bucket:
+                pipe.zadd(self._key(name), bucket)
+        pipe.execute()
+
+    def remove(self, player_id: int) -> None:
+        member = self._member(player_id)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.zrem(self._key(), member)
+        for name in self.categories:
+            pipe.zrem(self._key(name), member)
+        pipe.execute()
+
+    def rating(self, player_id: int) -> Optional[float]:
+        return self.client.zscore(self._key(), self._member(player_id))
+
+    def rank(self, player_id: int, category: Optional[str] = None) -> Optional[int]:
+        key = self._key(category)
+        score = self.client.zscore(key, self._member(player_id))
+        if score is None:
+            return None
+        return self._better_than(key, score) + 1
+
+    def size(self, category: Optional[str] = None) -> int:
+        return self.client.zcard(self._key(category))
+
+    def page(self, page: int, page_size: int, category: Optional[str] = None) -> List[LeaderboardEntry]:
+        start = (page - 1) * page_size
+        return self._entries(self._key(category), start, start + page_size)
+
+    def around(self, player_id: int, size: int = 10, category: Optional[str] = None) -> List[LeaderboardEntry]:
+        key = self._key(category)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zrevrank(key, self._member(player_id))
+        pipe.zcard(key)
+        position, total = pipe.execute()
+        if position is None:
+            return []
+        start = min(max(position - size // 2, 0), max(total - size, 0))
+        return self._entries(key, start, start + size)
+
+    def category_counts(self) -> Dict[str, int]:
+        pipe = self.client.pipeline(transaction=False)
+        for name in self.categories:
+            pipe.zcard(self._key(name))
+        return dict(zip(self.categories, pipe.execute()))
+
+    def _entries(self, key: str, start: int, stop: int) -> List[LeaderboardEntry]:
+        if stop <= max(start, 0):
+            return []
+        start = max(start, 0)
+        rows = self.client.zrange(key, start, stop - 1, desc=True, withscores=True)
+        if not rows:
+            return []
+
+        # Só o primeiro rank pode depender de empates anteriores à página
+        entries = []
+        previous = rows[0][1]
+        rank = self._better_than(key, previous) + 1 if start else 1
+        for position, (member, score) in enumerate(rows, start):
+            if score != previous:
+                rank, previous = position + 1, score
+            entries.append((rank, int(member), score))
+        return entries
+
+    def _better_than(self, key: str, score: float) -> int:
+        return self.client.zcount(key, f"({score!r}", "+inf")
+
+    def _key(self, category: Optional[str] = None) -> str:
+        return f"{self.prefix}:all" if category is None else f"{self.prefix}:category:{category}"
+
+    @staticmethod
+    def _member(player_id: int) -> str:
+        return f"{player_id:012d}"
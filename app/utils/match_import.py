@@ -0,0 +1,119 @@
+import csv
+import hashlib
+import json
+from datetime import datetime
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+IMPORT_FORMATS = ("csv", "ndjson")
+CSV_COLUMNS = ("player1", "player2", "sets", "played_at", "tournament_id", "league_id")
+
+# (número da linha, registro normalizado ou None, mensagem de erro ou None)
+ParsedLine = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def detect_format(filename: str) -> str:
+    """Import format implied by a file extension"""
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        return "csv"
+    if extension in ("ndjson", "jsonl"):
+        return "ndjson"
+    raise ValueError(f"Cannot infer import format of {filename!r}; use one of {IMPORT_FORMATS}")
+
+
+def content_digest(stream: BinaryIO, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a seekable binary stream, read in chunks and rewound afterwards"""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def parse_sets(value: Any) -> List[Tuple[int, int]]:
+    """
+    Parses set scores given as "11-5 9-11 11-7" (CSV) or as a list of
+    [score_p1, score_p2] pairs or {"score_p1", "score_p2"} objects (NDJSON).
+    """
+    if isinstance(value, str):
+        pairs = [item.split("-") for item in value.replace(",", " ").split()]
+    else:
+        pairs = [
+            (item["score_p1"], item["score_p2"]) if isinstance(item, dict) else item
+            for item in value
+        ]
+    sets = []
+    for pair in pairs:
+        if len(pair) != 2:
+            raise ValueError(f"Invalid set score: {pair!r}")
+        sets.append((int(pair[0]), int(pair[1])))
+    return sets
+
+
+def normalize_record(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Validates the shape of one raw record; usernames are resolved later"""
+    missing = [name for name in ("player1", "player2", "sets") if not raw.get(name)]
+    if missing:
+        raise ValueError(f"Missing fields: {', '.join(missing)}")
+    played_at = raw.get("played_at")
+    return {
+        "player1": str(raw["player1"]).strip(),
+        "player2": str(raw["player2"]).strip(),
+        "sets": parse_sets(raw["sets"]),
+        "played_at": datetime.fromisoformat(played_at) if played_at else None,
+        "tournament_id": int(raw["tournament_id"]) if raw.get("tournament_id") else None,
+        "league_id": int(raw["league_id"]) if raw.get("league_id") else None,
+    }
+
+
+def _normalized(line: int, raw: Any) -> ParsedLine:
+    try:
+        if not isinstance(raw, dict):
+            raise ValueError("Record must be an object")
+        return line, normalize_record(raw), None
+    except (KeyError, TypeError, ValueError) as e:
+        return line, None, str(e)
+
+
+def parse_ndjson(lines: Iterable[str]) -> Iterator[ParsedLine]:
+    """Yields one parsed record per non-blank line of an NDJSON stream"""
+    for number, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+        try:
+            raw = json.loads(text)
+        except json.JSONDecodeError as e:
+            yield number, None, f"Invalid JSON: {e.msg}"
+            continue
+        yield _normalized(number, raw)
+
+
+def parse_csv(lines: Iterable[str]) -> Iterator[ParsedLine]:
+    """
+    Yields one parsed record per row of a CSV stream with a header naming
+    CSV_COLUMNS (player1, player2 and sets are required).
+    """
+    reader = csv.DictReader(lines)
+    for raw in reader:
+        yield _normalized(reader.line_num, raw)
+
+
+def read_records(lines: Iterable[str], fmt: str) -> Iterator[ParsedLine]:
+    if fmt == "csv":
+        return parse_csv(lines)
+    if fmt == "ndjson":
+        return parse_ndjson(lines)
+    raise ValueError(f"Unknown import format {fmt!r}; use one of {IMPORT_FORMATS}")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Groups an iterable into lists of at most size items, lazily"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
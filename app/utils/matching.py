@@ -0,0 +1,388 @@
+from typing import List, Sequence, Tuple
+
+# (vértice, vértice, peso inteiro)
+Edge = Tuple[int, int, int]
+
+
+def max_weight_matching(edges: Sequence[Edge], maxcardinality: bool = False) -> List[int]:
+    """
+    Maximum-weight matching of a general graph by Edmonds' blossom
+    algorithm with dual variables, in O(n^3) (after Galil, "Efficient
+    algorithms for finding maximum matching in graphs", 1986, and
+    J. van Rantwijk's implementation). Odd cycles of tight edges are
+    shrunk into blossoms, so unlike bipartite assignment it works on the
+    complete graph of a pairing round.
+
+    Weights must be integers, which keeps every dual variable and slack an
+    exact integer (vertex duals are doubled). With maxcardinality the
+    result is the heaviest among the maximum-cardinality matchings, so a
+    complete graph on an even number of vertices always gets a perfect
+    matching and minimizing a cost becomes maximizing (constant - cost).
+
+    Args:
+        edges (Sequence[Edge]): (i, j, weight) with vertices numbered from 0
+        maxcardinality (bool): Only consider maximum-cardinality matchings
+
+    Returns:
+        List[int]: Mate of each vertex, -1 when unmatched
+    """
+    if not edges:
+        return []
+
+    nedge = len(edges)
+    nvertex = 1 + max(max(i, j) for i, j, _ in edges)
+    maxweight = max(0, max(weight for _, _, weight in edges))
+
+    # Extremidade p da aresta p // 2; p ^ 1 é a outra ponta
+    endpoint = [edges[p // 2][p % 2] for p in range(2 * nedge)]
+    # Extremidades remotas das arestas de cada vértice
+    neighbend: List[List[int]] = [[] for _ in range(nvertex)]
+    for k, (i, j, _) in enumerate(edges):
+        neighbend[i].append(2 * k + 1)
+        neighbend[j].append(2 * k)
+
+    # mate[v]: extremidade remota da aresta do emparelhamento em v
+    mate = nvertex * [-1]
+    # Rótulos de vértices e blossoms de topo: 0 livre, 1 = S, 2 = T (5 marca a busca da base)
+    label = (2 * nvertex) * [0]
+    labelend = (2 * nvertex) * [-1]
+    inblossom = list(range(nvertex))
+    blossomparent = (2 * nvertex) * [-1]
+    blossomchilds: List = (2 * nvertex) * [None]
+    blossombase = list(range(nvertex)) + nvertex * [-1]
+    blossomendps: List = (2 * nvertex) * [None]
+    bestedge = (2 * nvertex) * [-1]
+    blossombestedges: List = (2 * nvertex) * [None]
+    unusedblossoms = list(range(nvertex, 2 * nvertex))
+    dualvar = nvertex * [maxweight] + nvertex * [0]
+    allowedge = nedge * [False]
+    queue: List[int] = []
+
+    def slack(k: int) -> int:
+        i, j, weight = edges[k]
+        return dualvar[i] + dualvar[j] - 2 * weight
+
+    def blossom_leaves(b: int):
+        if b < nvertex:
+            yield b
+        else:
+            for t in blossomchilds[b]:
+                if t < nvertex:
+                    yield t
+                else:
+                    yield from blossom_leaves(t)
+
+    def assign_label(w: int, t: int, p: int) -> None:
+        b = inblossom[w]
+        label[w] = label[b] = t
+        labelend[w] = labelend[b] = p
+        bestedge[w] = bestedge[b] = -1
+        if t == 1:
+            queue.extend(blossom_leaves(b))
+        elif t == 2:
+            # A base de um T está emparelhada; seu par vira S
+            base = blossombase[b]
+            assign_label(endpoint[mate[base]], 1, mate[base] ^ 1)
+
+    def scan_blossom(v: int, w: int) -> int:
+        # Sobe pelas duas árvores alternadamente até a base comum (-1: caminho aumentante)
+        path = []
+        base = -1
+        while v != -1 or w != -1:
+            b = inblossom[v]
+            if label[b] & 4:
+                base = blossombase[b]
+                break
+            path.append(b)
+            label[b] = 5
+            if labelend[b] == -1:
+                v = -1
+            else:
+                v = endpoint[labelend[b]]
+                b = inblossom[v]
+                v = endpoint[labelend[b]]
+            if w != -1:
+                v, w = w, v
+        for b in path:
+            label[b] = 1
+        return base
+
+    def add_blossom(base: int, k: int) -> None:
+        v, w, _ = edges[k]
+        bb = inblossom[base]
+        bv = inblossom[v]
+        bw = inblossom[w]
+        b = unusedblossoms.pop()
+        blossombase[b] = base
+        blossomparent[b] = -1
+        blossomparent[bb] = b
+        blossomchilds[b] = path = []
+        blossomendps[b] = endps = []
+        while bv != bb:
+            blossomparent[bv] = b
+            path.append(bv)
+            endps.append(labelend[bv])
+            v = endpoint[labelend[bv]]
+            bv = inblossom[v]
+        path.append(bb)
+        path.reverse()
+        endps.reverse()
+        endps.append(2 * k)
+        while bw != bb:
+            blossomparent[bw] = b
+            path.append(bw)
+            endps.append(labelend[bw] ^ 1)
+            w = endpoint[labelend[bw]]
+            bw = inblossom[w]
+
+        label[b] = 1
+        labelend[b] = labelend[bb]
+        dualvar[b] = 0
+        for v in blossom_leaves(b):
+            if label[inblossom[v]] == 2:
+                # Vértices T do ciclo viram S
+                queue.append(v)
+            inblossom[v] = b
+
+        # Melhor aresta do novo blossom para cada blossom S vizinho
+        bestedgeto = (2 * nvertex) * [-1]
+        for bv in path:
+            if blossombestedges[bv] is None:
+                nblists = [[p // 2 for p in neighbend[v]] for v in blossom_leaves(bv)]
+            else:
+                nblists = [blossombestedges[bv]]
+            for nblist in nblists:
+                for k in nblist:
+                    i, j, _ = edges[k]
+                    if inblossom[j] == b:
+                        i, j = j, i
+                    bj = inblossom[j]
+                    if (bj != b and label[bj] == 1
+                            and (bestedgeto[bj] == -1 or slack(k) < slack(bestedgeto[bj]))):
+                        bestedgeto[bj] = k
+            blossombestedges[bv] = None
+            bestedge[bv] = -1
+        blossombestedges[b] = [k for k in bestedgeto if k != -1]
+        bestedge[b] = -1
+        for k in blossombestedges[b]:
+            if bestedge[b] == -1 or slack(k) < slack(bestedge[b]):
+                bestedge[b] = k
+
+    def expand_blossom(b: int, endstage: bool) -> None:
+        for s in blossomchilds[b]:
+            blossomparent[s] = -1
+            if s < nvertex:
+                inblossom[s] = s
+            elif endstage and dualvar[s] == 0:
+                expand_blossom(s, endstage)
+            else:
+                for v in blossom_leaves(s):
+                    inblossom[v] = s
+
+        if not endstage and label[b] == 2:
+            # Refaz os rótulos do caminho par entre a entrada e a base do T expandido
+            entrychild = inblossom[endpoint[labelend[b] ^ 1]]
+            j = blossomchilds[b].index(entrychild)
+            if j & 1:
+                j -= len(blossomchilds[b])
+                jstep = 1
+                endptrick = 0
+            else:
+                jstep = -1
+                endptrick = 1
+            p = labelend[b]
+            while j != 0:
+                label[endpoint[p ^ 1]] = 0
+                label[endpoint[blossomendps[b][j - endptrick] ^ endptrick ^ 1]] = 0
+                assign_label(endpoint[p ^ 1], 2, p)
+                allowedge[blossomendps[b][j - endptrick] // 2] = True
+                j += jstep
+                p = blossomendps[b][j - endptrick] ^ endptrick
+                allowedge[p // 2] = True
+                j += jstep
+            bv = blossomchilds[b][j]
+            label[endpoint[p ^ 1]] = label[bv] = 2
+            labelend[endpoint[p ^ 1]] = labelend[bv] = p
+            bestedge[bv] = -1
+            j += jstep
+            while blossomchilds[b][j] != entrychild:
+                bv = blossomchilds[b][j]
+                if label[bv] == 1:
+                    j += jstep
+                    continue
+                for v in blossom_leaves(bv):
+                    if label[v] != 0:
+                        break
+                if label[v] != 0:
+                    label[v] = 0
+                    label[endpoint[mate[blossombase[bv]]]] = 0
+                    assign_label(v, 2, labelend[v])
+                j += jstep
+
+        label[b] = labelend[b] = -1
+        blossomchilds[b] = blossomendps[b] = None
+        blossombase[b] = -1
+        blossombestedges[b] = None
+        bestedge[b] = -1
+        unusedblossoms.append(b)
+
+    def augment_blossom(b: int, v: int) -> None:
+        # Troca as arestas do caminho par de v até a base; v passa a ser a base
+        t = v
+        while blossomparent[t] != b:
+            t = blossomparent[t]
+        if t >= nvertex:
+            augment_blossom(t, v)
+        i = j = blossomchilds[b].index(t)
+        if i & 1:
+            j -= len(blossomchilds[b])
+            jstep = 1
+            endptrick = 0
+        else:
+            jstep = -1
+            endptrick = 1
+        while j != 0:
+            j += jstep
+            t = blossomchilds[b][j]
+            p = blossomendps[b][j - endptrick] ^ endptrick
+            if t >= nvertex:
+                augment_blossom(t, endpoint[p])
+            j += jstep
+            t = blossomchilds[b][j]
+            if t >= nvertex:
+                augment_blossom(t, endpoint[p ^ 1])
+            mate[endpoint[p]] = p ^ 1
+            mate[endpoint[p ^ 1]] = p
+        blossomchilds[b] = blossomchilds[b][i:] + blossomchilds[b][:i]
+        blossomendps[b] = blossomendps[b][i:] + blossomendps[b][:i]
+        blossombase[b] = blossombase[blossomchilds[b][0]]
+
+    def augment_matching(k: int) -> None:
+        v, w, _ = edges[k]
+        for s, p in ((v, 2 * k + 1), (w, 2 * k)):
+            while True:
+                bs = inblossom[s]
+                if bs >= nvertex:
+                    augment_blossom(bs, s)
+                mate[s] = p
+                if labelend[bs] == -1:
+                    # Chegou a uma raiz livre
+                    break
+                t = endpoint[labelend[bs]]
+                bt = inblossom[t]
+                s = endpoint[labelend[bt]]
+                j = endpoint[labelend[bt] ^ 1]
+                if bt >= nvertex:
+                    augment_blossom(bt, j)
+                mate[j] = labelend[bt]
+                p = labelend[bt] ^ 1
+
+    # Cada estágio aumenta o emparelhamento em uma aresta, ou termina
+    for _ in range(nvertex):
+        label[:] = (2 * nvertex) * [0]
+        bestedge[:] = (2 * nvertex) * [-1]
+        blossombestedges[nvertex:] = nvertex * [None]
+        allowedge[:] = nedge * [False]
+        queue[:] = []
+        for v in range(nvertex):
+            if mate[v] == -1 and label[inblossom[v]] == 0:
+                assign_label(v, 1, -1)
+
+        augmented = False
+        while True:
+            while queue and not augmented:
+                v = queue.pop()
+                for p in neighbend[v]:
+                    k = p // 2
+                    w = endpoint[p]
+                    if inblossom[v] == inblossom[w]:
+                        continue
+                    if not allowedge[k]:
+                        kslack = slack(k)
+                        if kslack <= 0:
+                            allowedge[k] = True
+                    if allowedge[k]:
+                        if label[inblossom[w]] == 0:
+                            assign_label(w, 2, p ^ 1)
+                        elif label[inblossom[w]] == 1:
+                            base = scan_blossom(v, w)
+                            if base >= 0:
+                                add_blossom(base, k)
+                            else:
+                                augment_matching(k)
+                                augmented = True
+                                break
+                        elif label[w] == 0:
+                            label[w] = 2
+                            labelend[w] = p ^ 1
+                    elif label[inblossom[w]] == 1:
+                        b = inblossom[v]
+                        if bestedge[b] == -1 or kslack < slack(bestedge[b]):
+                            bestedge[b] = k
+                    elif label[w] == 0:
+                        if bestedge[w] == -1 or kslack < slack(bestedge[w]):
+                            bestedge[w] = k
+            if augmented:
+                break
+
+            # Sem aresta justa utilizável: ajusta as variáveis duais pelo menor delta
+            deltatype = -1
+            delta = deltaedge = deltablossom = None
+            if not maxcardinality:
+                deltatype = 1
+                delta = min(dualvar[:nvertex])
+            for v in range(nvertex):
+                if label[inblossom[v]] == 0 and bestedge[v] != -1:
+                    d = slack(bestedge[v])
+                    if deltatype == -1 or d < delta:
+                        delta, deltatype, deltaedge = d, 2, bestedge[v]
+            for b in range(2 * nvertex):
+                if blossomparent[b] == -1 and label[b] == 1 and bestedge[b] != -1:
+                    # Folga entre dois S é sempre par com pesos inteiros
+                    d = slack(bestedge[b]) // 2
+                    if deltatype == -1 or d < delta:
+                        delta, deltatype, deltaedge = d, 3, bestedge[b]
+            for b in range(nvertex, 2 * nvertex):
+                if (blossombase[b] >= 0 and blossomparent[b] == -1 and label[b] == 2
+                        and (deltatype == -1 or dualvar[b] < delta)):
+                    delta, deltatype, deltablossom = dualvar[b], 4, b
+            if deltatype == -1:
+                # Cardinalidade máxima atingida
+                deltatype = 1
+                delta = max(0, min(dualvar[:nvertex]))
+
+            for v in range(nvertex):
+                if label[inblossom[v]] == 1:
+                    dualvar[v] -= delta
+                elif label[inblossom[v]] == 2:
+                    dualvar[v] += delta
+            for b in range(nvertex, 2 * nvertex):
+                if blossombase[b] >= 0 and blossomparent[b] == -1:
+                    if label[b] == 1:
+                        dualvar[b] += delta
+                    elif label[b] == 2:
+                        dualvar[b] -= delta
+
+            if deltatype == 1:
+                break
+            elif deltatype == 2:
+                allowedge[deltaedge] = True
+                i, j, _ = edges[deltaedge]
+                if label[inblossom[i]] == 0:
+                    i, j = j, i
+                queue.append(i)
+            elif deltatype == 3:
+                allowedge[deltaedge] = True
+                i, j, _ = edges[deltaedge]
+                queue.append(i)
+            else:
+                expand_blossom(deltablossom, False)
+
+        if not augmented:
+            break
+        # Blossoms S de dual zero não ajudam mais: expande no fim do estágio
+        for b in range(nvertex, 2 * nvertex):
+            if blossomparent[b] == -1 and blossombase[b] >= 0 and label[b] == 1 and dualvar[b] == 0:
+                expand_blossom(b, True)
+
+    return [endpoint[p] if p >= 0 else -1 for p in mate]
@@ -0,0 +1,297 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+import heapq
+import math
+import os
+
+import numpy as np
+
+from .constants import (
+    INITIAL_RATING,
+    K_FACTOR,
+    MIN_RATING,
+    MAX_RATING
+)
+
+
+class EloReplay(NamedTuple):
+    """
+    Result of replaying a match history.
+
+    ratings is indexed by player id; the per-match arrays are aligned with
+    the input order of the matches.
+    """
+    ratings: np.ndarray
+    player1_before: np.ndarray
+    player1_after: np.ndarray
+    player2_before: np.ndarray
+    player2_after: np.ndarray
+
+
+def schedule_batches(
+    player1_ids: np.ndarray,
+    player2_ids: np.ndarray
+) -> np.ndarray:
+    """
+    Assign every match to a conflict-free batch.
+
+    A match lands in the first batch after the last batch of either of its
+    players, so no player appears twice in a batch and every match sees the
+    ratings produced by all earlier matches of its players.
+
+    Args:
+        player1_ids (np.ndarray): First player of each match, in chronological order
+        player2_ids (np.ndarray): Second player of each match, in chronological order
+
+    Returns:
+        np.ndarray: Batch number of each match
+    """
+    size = int(max(player1_ids.max(initial=0), player2_ids.max(initial=0))) + 1
+    next_batch = [0] * size
+    batches = [0] * len(player1_ids)
+
+    for i, (p1, p2) in enumerate(zip(player1_ids.tolist(), player2_ids.tolist())):
+        batch = next_batch[p1] if next_batch[p1] > next_batch[p2] else next_batch[p2]
+        batches[i] = batch
+        next_batch[p1] = next_batch[p2] = batch + 1
+
+    return np.asarray(batches, dtype=np.int64)
+
+
+def _initial_ratings(size: int, ratings: Optional[np.ndarray]) -> np.ndarray:
+    # Jogadores fora do array inicial começam com INITIAL_RATING
+    if ratings is None:
+        return np.full(size, float(INITIAL_RATING), dtype=np.float64)
+    ratings = np.asarray(ratings, dtype=np.float64)
+    current = np.full(max(size, len(ratings)), float(INITIAL_RATING), dtype=np.float64)
+    current[:len(ratings)] = ratings
+    return current
+
+
+def _expected_scores(player_ratings: np.ndarray, opponent_ratings: np.ndarray) -> np.ndarray:
+    # math.pow keeps the result bit-identical to calculate_elo_rating;
+    # np.power may round the last ulp differently on SIMD builds.
+    exponents = ((opponent_ratings - player_ratings) / 400).tolist()
+    powers = np.fromiter(
+        map(math.pow, [10.0] * len(exponents), exponents),
+        dtype=np.float64,
+        count=len(exponents)
+    )
+    return 1 / (1 + powers)
+
+
+def replay_elo(
+    player1_ids: np.ndarray,
+    player2_ids: np.ndarray,
+    player1_won: np.ndarray,
+    ratings: Optional[np.ndarray] = None,
+    k_factor: float = K_FACTOR
+) -> EloReplay:
+    """
+    Replay a chronological match history with the ELO rule of
+    calculate_elo_rating, one conflict-free batch at a time.
+
+    Args:
+        player1_ids (np.ndarray): First player of each match
+        player2_ids (np.ndarray): Second player of each match
+        player1_won (np.ndarray): Whether the first player won each match
+        ratings (Optional[np.ndarray]): Starting ratings indexed by player id;
+            players not covered start at INITIAL_RATING
+        k_factor (float): K-factor for ELO calculation
+
+    Returns:
+        EloReplay: Final ratings and per-match before/after ratings
+    """
+    player1_ids = np.asarray(player1_ids, dtype=np.int64)
+    player2_ids = np.asarray(player2_ids, dtype=np.int64)
+    score1 = np.asarray(player1_won, dtype=bool).astype(np.float64)
+    score2 = 1.0 - score1
+
+    size = int(max(player1_ids.max(initial=0), player2_ids.max(initial=0))) + 1
+    current = _initial_ratings(size, ratings)
+
+    n = len(player1_ids)
+    before1 = np.empty(n, dtype=np.float64)
+    before2 = np.empty(n, dtype=np.float64)
+    after1 = np.empty(n, dtype=np.float64)
+    after2 = np.empty(n, dtype=np.float64)
+
+    if n:
+        batches = schedule_batches(player1_ids, player2_ids)
+        order = np.argsort(batches, kind="stable")
+        bounds = np.flatnonzero(np.diff(batches[order])) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [n]))
+
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            idx = order[start:end]
+            p1 = player1_ids[idx]
+            p2 = player2_ids[idx]
+            r1 = current[p1]
+            r2 = current[p2]
+
+            new1 = r1 + k_factor * (score1[idx] - _expected_scores(r1, r2))
+            new2 = r2 + k_factor * (score2[idx] - _expected_scores(r2, r1))
+            new1 = np.maximum(np.minimum(new1, MAX_RATING), MIN_RATING)
+            new2 = np.maximum(np.minimum(new2, MAX_RATING), MIN_RATING)
+
+            current[p1] = new1
+            current[p2] = new2
+            before1[idx] = r1
+            before2[idx] = r2
+            after1[idx] = new1
+            after2[idx] = new2
+
+    return EloReplay(current, before1, after1, before2, after2)
+
+
+def ratings_after(
+    ratings: np.ndarray,
+    player1_ids: np.ndarray,
+    player2_ids: np.ndarray,
+    player1_after: np.ndarray,
+    player2_after: np.ndarray
+) -> np.ndarray:
+    """
+    Apply the per-match results of a replay to a ratings array: every player
+    ends with the rating after their last match in the slice.
+
+    Args:
+        ratings (np.ndarray): Ratings indexed by player id before the slice
+        player1_ids (np.ndarray): First player of each match
+        player2_ids (np.ndarray): Second player of each match
+        player1_after (np.ndarray): First player's rating after each match
+        player2_after (np.ndarray): Second player's rating after each match
+
+    Returns:
+        np.ndarray: New ratings array
+    """
+    players = np.column_stack((player1_ids, player2_ids)).ravel()[::-1]
+    values = np.column_stack((player1_after, player2_after)).ravel()[::-1]
+    last_players, last_index = np.unique(players, return_index=True)
+
+    result = _initial_ratings(int(players.max(initial=0)) + 1, ratings)
+    result[last_players] = values[last_index]
+    return result
+
+
+def connected_components(
+    player1_ids: np.ndarray,
+    player2_ids: np.ndarray
+) -> np.ndarray:
+    """
+    Find the connected components of the player graph with union-find.
+
+    Args:
+        player1_ids (np.ndarray): First player of each match
+        player2_ids (np.ndarray): Second player of each match
+
+    Returns:
+        np.ndarray: Component of each match, labelled by its smallest player id
+    """
+    player1_ids = np.asarray(player1_ids, dtype=np.int64)
+    player2_ids = np.asarray(player2_ids, dtype=np.int64)
+    size = int(max(player1_ids.max(initial=0), player2_ids.max(initial=0))) + 1
+    parent = list(range(size))
+
+    def find(x: int) -> int:
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    # Partidas repetidas entre o mesmo par não mudam os componentes
+    edges = np.unique(
+        np.column_stack((np.minimum(player1_ids, player2_ids), np.maximum(player1_ids, player2_ids))),
+        axis=0
+    )
+    for a, b in edges.tolist():
+        root_a, root_b = find(a), find(b)
+        if root_a < root_b:
+            parent[root_b] = root_a
+        elif root_b < root_a:
+            parent[root_a] = root_b
+
+    roots = np.fromiter((find(x) for x in range(size)), dtype=np.int64, count=size)
+    return roots[player1_ids]
+
+
+def group_components(components: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Pack components into at most n_groups groups of similar match counts,
+    largest component first (ties by label), so the split is deterministic.
+
+    Args:
+        components (np.ndarray): Component of each match
+        n_groups (int): Maximum number of groups
+
+    Returns:
+        np.ndarray: Group of each match, numbered from 0
+    """
+    labels, counts = np.unique(components, return_counts=True)
+    n_groups = max(1, min(n_groups, len(labels)))
+    loads = [(0, group) for group in range(n_groups)]
+    assignment = np.empty(len(labels), dtype=np.int64)
+
+    for component in np.lexsort((labels, -counts)).tolist():
+        load, group = heapq.heappop(loads)
+        assignment[component] = group
+        heapq.heappush(loads, (load + int(counts[component]), group))
+
+    return assignment[np.searchsorted(labels, components)]
+
+
+def replay_elo_parallel(
+    player1_ids: np.ndarray,
+    player2_ids: np.ndarray,
+    player1_won: np.ndarray,
+    ratings: Optional[np.ndarray] = None,
+    k_factor: float = K_FACTOR,
+    workers: Optional[int] = None
+) -> EloReplay:
+    """
+    Same result as replay_elo, but independent components of the player
+    graph are replayed in a process pool, one task per component group.
+
+    Args:
+        player1_ids (np.ndarray): First player of each match
+        player2_ids (np.ndarray): Second player of each match
+        player1_won (np.ndarray): Whether the first player won each match
+        ratings (Optional[np.ndarray]): Starting ratings indexed by player id
+        k_factor (float): K-factor for ELO calculation
+        workers (Optional[int]): Pool size, defaults to the number of CPUs
+
+    Returns:
+        EloReplay: Final ratings and per-match before/after ratings
+    """
+    player1_ids = np.asarray(player1_ids, dtype=np.int64)
+    player2_ids = np.asarray(player2_ids, dtype=np.int64)
+    player1_won = np.asarray(player1_won, dtype=bool)
+    workers = workers or os.cpu_count() or 1
+
+    groups = group_components(connected_components(player1_ids, player2_ids), workers)
+    n_groups = int(groups.max(initial=0)) + 1
+    if workers <= 1 or n_groups <= 1:
+        return replay_elo(player1_ids, player2_ids, player1_won, ratings, k_factor)
+
+    indices = [np.flatnonzero(groups == group) for group in range(n_groups)]
+    with ProcessPoolExecutor(max_workers=min(workers, n_groups)) as pool:
+        futures = [
+            pool.submit(replay_elo, player1_ids[idx], player2_ids[idx], player1_won[idx], ratings, k_factor)
+            for idx in indices
+        ]
+        results = [future.result() for future in futures]
+
+    # Os grupos não compartilham jogadores, então a junção é por posição
+    size = int(max(player1_ids.max(), player2_ids.max())) + 1
+    final = _initial_ratings(size, ratings)
+    per_match = [np.empty(len(player1_ids), dtype=np.float64) for _ in range(4)]
+    for idx, result in zip(indices, results):
+        players = np.unique(np.concatenate((player1_ids[idx], player2_ids[idx])))
+        final[players] = result.ratings[players]
+        for target, source in zip(per_match, result[1:]):
+            target[idx] = source
+
+    return EloReplay(final, *per_match)
@@ -0,0 +1,289 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Tuple, Type
+
+import numpy as np
+
+from .constants import (
+    INITIAL_RATING,
+    K_FACTOR,
+    MIN_RATING,
+    MAX_RATING,
+    GLICKO2_INITIAL_RD,
+    GLICKO2_INITIAL_VOLATILITY,
+    GLICKO2_TAU,
+    GAUSSIAN_INITIAL_SIGMA,
+    GAUSSIAN_BETA,
+    GAUSSIAN_TAU
+)
+
+# Fator de conversão entre a escala Glicko e a escala Glicko-2
+GLICKO2_SCALE = 173.7178
+GLICKO2_EPSILON = 0.000001
+
+
+class RatingSystem(ABC):
+    """
+    Base class of the pluggable rating systems.
+
+    The state of every system is a 2D array with one row per player id and
+    one column per entry of `columns`; the first column is always the
+    rating used for rankings. rate_period processes a whole rating period:
+    every match in it is rated against the state at the start of the period.
+    """
+    name: str = ""
+    columns: Tuple[str, ...] = ("rating",)
+
+    @abstractmethod
+    def initial_state(self, size: int) -> np.ndarray:
+        """State of size players who have not played yet"""
+
+    @abstractmethod
+    def rate_period(
+        self,
+        state: np.ndarray,
+        player1_ids: np.ndarray,
+        player2_ids: np.ndarray,
+        player1_won: np.ndarray
+    ) -> np.ndarray:
+        """New state after one rating period, every match rated against the given state"""
+
+    def replay(
+        self,
+        player1_ids: np.ndarray,
+        player2_ids: np.ndarray,
+        player1_won: np.ndarray,
+        period_ids: np.ndarray
+    ) -> np.ndarray:
+        """
+        Rates a chronological history one period at a time.
+
+        Args:
+            player1_ids (np.ndarray): First player of each match
+            player2_ids (np.ndarray): Second player of each match
+            player1_won (np.ndarray): Whether the first player won each match
+            period_ids (np.ndarray): Non-decreasing rating period of each match
+
+        Returns:
+            np.ndarray: Final state indexed by player id
+        """
+        player1_ids = np.asarray(player1_ids, dtype=np.int64)
+        player2_ids = np.asarray(player2_ids, dtype=np.int64)
+        player1_won = np.asarray(player1_won, dtype=bool)
+        period_ids = np.asarray(period_ids)
+
+        size = int(max(player1_ids.max(initial=0), player2_ids.max(initial=0))) + 1
+        state = self.initial_state(size)
+
+        bounds = np.flatnonzero(np.diff(period_ids)) + 1
+        for start, end in zip(
+            np.concatenate(([0], bounds)).tolist(),
+            np.concatenate((bounds, [len(period_ids)])).tolist()
+        ):
+            if start < end:
+                state = self.rate_period(
+                    state, player1_ids[start:end], player2_ids[start:end], player1_won[start:end]
+                )
+        return state
+
+
+class EloSystem(RatingSystem):
+    """ELO with rating periods: deltas are summed against period-start ratings."""
+    name = "elo"
+    columns = ("rating",)
+
+    def __init__(self, k_factor: float = K_FACTOR):
+        self.k_factor = k_factor
+
+    def initial_state(self, size: int) -> np.ndarray:
+        return np.full((size, 1), float(INITIAL_RATING))
+
+    def rate_period(self, state, player1_ids, player2_ids, player1_won):
+        ratings = state[:, 0]
+        expected = 1 / (1 + np.power(10.0, (ratings[player2_ids] - ratings[player1_ids]) / 400))
+        change = self.k_factor * (player1_won - expected)
+
+        delta = np.bincount(player1_ids, weights=change, minlength=len(ratings))
+        delta -= np.bincount(player2_ids, weights=change, minlength=len(ratings))
+
+        new_state = state.copy()
+        new_state[:, 0] = np.clip(ratings + delta, MIN_RATING, MAX_RATING)
+        return new_state
+
+
+class Glicko2System(RatingSystem):
+    """Glicko-2 (Glickman, 2012) with the volatility step vectorized over players."""
+    name = "glicko2"
+    columns = ("rating", "deviation", "volatility")
+
+    def __init__(self, tau: float = GLICKO2_TAU):
+        self.tau = tau
+
+    def initial_state(self, size: int) -> np.ndarray:
+        state = np.empty((size, 3))
+        state[:, 0] = INITIAL_RATING
+        state[:, 1] = GLICKO2_INITIAL_RD
+        state[:, 2] = GLICKO2_INITIAL_VOLATILITY
+        return state
+
+    @staticmethod
+    def _g(phi: np.ndarray) -> np.ndarray:
+        return 1 / np.sqrt(1 + 3 * phi ** 2 / np.pi ** 2)
+
+    def rate_period(self, state, player1_ids, player2_ids, player1_won):
+        size = len(state)
+        mu = (state[:, 0] - INITIAL_RATING) / GLICKO2_SCALE
+        phi = state[:, 1] / GLICKO2_SCALE
+        sigma = state[:, 2]
+
+        # Cada partida contribui para os dois jogadores
+        players = np.concatenate((player1_ids, player2_ids))
+        opponents = np.concatenate((player2_ids, player1_ids))
+        scores = np.concatenate((player1_won, ~player1_won)).astype(np.float64)
+
+        g = self._g(phi[opponents])
+        expected = 1 / (1 + np.exp(-g * (mu[players] - mu[opponents])))
+        v_inv = np.bincount(players, weights=g ** 2 * expected * (1 - expected), minlength=size)
+        delta_sum = np.bincount(players, weights=g * (scores - expected), minlength=size)
+
+        played = v_inv > 0
+        v = np.divide(1, v_inv, out=np.zeros(size), where=played)
+        delta = v * delta_sum
+
+        new_sigma = sigma.copy()
+        new_sigma[played] = self._volatility(delta[played], phi[played], v[played], sigma[played])
+
+        phi_star = np.sqrt(phi ** 2 + new_sigma ** 2)
+        new_phi = phi_star.copy()
+        new_phi[played] = 1 / np.sqrt(1 / phi_star[played] ** 2 + v_inv[played])
+        new_mu = mu + new_phi ** 2 * delta_sum
+
+        new_state = np.empty_like(state)
+        new_state[:, 0] = new_mu * GLICKO2_SCALE + INITIAL_RATING
+        new_state[:, 1] = np.minimum(new_phi * GLICKO2_SCALE, GLICKO2_INITIAL_RD)
+        new_state[:, 2] = new_sigma
+        return new_state
+
+    def _volatility(self, delta, phi, v, sigma):
+        # Algoritmo de Illinois do passo 5, aplicado a todos os jogadores de uma vez
+        tau2 = self.tau ** 2
+        a = np.log(sigma ** 2)
+
+        def f(x):
+            ex = np.exp(x)
+            return (ex * (delta ** 2 - phi ** 2 - v - ex) / (2 * (phi ** 2 + v + ex) ** 2)
+                    - (x - a) / tau2)
+
+        A = a.copy()
+        big = delta ** 2 > phi ** 2 + v
+        B = np.where(big, np.log(np.where(big, delta ** 2 - phi ** 2 - v, 1.0)), a - self.tau)
+        pending = ~big
+        k = 1
+        while pending.any():
+            still = f(a - k * self.tau) < 0
+            pending &= still
+            B = np.where(pending, a - (k + 1) * self.tau, B)
+            k += 1
+
+        fA, fB = f(A), f(B)
+        active = np.abs(B - A) > GLICKO2_EPSILON
+        while active.any():
+            C = A + (A - B) * fA / (fB - fA)
+            fC = f(C)
+            swap = fC * fB <= 0
+            A = np.where(active & swap, B, A)
+            fA = np.where(active, np.where(swap, fB, fA / 2), fA)
+            B = np.where(active, C, B)
+            fB = np.where(active, fC, fB)
+            active &= np.abs(B - A) > GLICKO2_EPSILON
+
+        return np.exp(A / 2)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-x ** 2 / 2) / np.sqrt(2 * np.pi)
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    # erfc de Chebyshev (Numerical Recipes), erro relativo < 1.2e-7 em toda a reta
+    z = np.abs(x) / np.sqrt(2)
+    t = 1 / (1 + 0.5 * z)
+    erfc = t * np.exp(
+        -z * z - 1.26551223 + t * (1.00002368 + t * (0.37409196 + t * (0.09678418 + t * (
+            -0.18628806 + t * (0.27886807 + t * (-1.13520398 + t * (1.48851587 + t * (
+                -0.82215223 + t * 0.17087277))))))))
+    )
+    return np.where(x >= 0, 1 - erfc / 2, erfc / 2)
+
+
+class GaussianSystem(RatingSystem):
+    """
+    TrueSkill-style Gaussian skill model for 1v1 matches without draws.
+
+    Within a period every match is rated against period-start beliefs; mean
+    shifts add up and variance shrink factors multiply per player.
+    """
+    name = "gaussian"
+    columns = ("rating", "deviation")
+
+    def __init__(
+        self,
+        beta: float = GAUSSIAN_BETA,
+        tau: float = GAUSSIAN_TAU
+    ):
+        self.beta = beta
+        self.tau = tau
+
+    def initial_state(self, size: int) -> np.ndarray:
+        state = np.empty((size, 2))
+        state[:, 0] = INITIAL_RATING
+        state[:, 1] = GAUSSIAN_INITIAL_SIGMA
+        return state
+
+    def rate_period(self, state, player1_ids, player2_ids, player1_won):
+        mu = state[:, 0]
+        variance = state[:, 1] ** 2 + self.tau ** 2
+
+        winners = np.where(player1_won, player1_ids, player2_ids)
+        losers = np.where(player1_won, player2_ids, player1_ids)
+
+        c = np.sqrt(2 * self.beta ** 2 + variance[winners] + variance[losers])
+        t = (mu[winners] - mu[losers]) / c
+        v = _norm_pdf(t) / np.maximum(_norm_cdf(t), 1e-300)
+        w = v * (v + t)
+
+        new_mu = mu.copy()
+        np.add.at(new_mu, winners, variance[winners] / c * v)
+        np.add.at(new_mu, losers, -variance[losers] / c * v)
+
+        shrink = np.ones(len(state))
+        np.multiply.at(shrink, winners, 1 - variance[winners] / c ** 2 * w)
+        np.multiply.at(shrink, losers, 1 - variance[losers] / c ** 2 * w)
+
+        played = np.zeros(len(state), dtype=bool)
+        played[winners] = played[losers] = True
+
+        new_state = np.empty_like(state)
+        new_state[:, 0] = new_mu
+        new_state[:, 1] = np.where(played, np.sqrt(variance * shrink), state[:, 1])
+        return new_state
+
+
+RATING_SYSTEMS: Dict[str, Type[RatingSystem]] = {
+    system.name: system for system in (EloSystem, Glicko2System, GaussianSystem)
+}
+
+
+def get_rating_system(name: str) -> RatingSystem:
+    """
+    Get a rating system instance by name.
+
+    Args:
+        name (str): One of RATING_SYSTEMS
+
+    Returns:
+        RatingSystem: New instance with default parameters
+    """
+    try:
+        return RATING_SYSTEMS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown rating system: {name}")
@@ -0,0 +1,190 @@
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+
+from .constants import SWISS_MAX_STEPS, SWISS_SCORE_WEIGHT
+from .matching import max_weight_matching
+
+Pair = Tuple[Hashable, Optional[Hashable]]
+# Par já disputado, sem ordem
+PlayedPair = FrozenSet[Hashable]
+
+
+def round_robin_rounds(players: List[Hashable]) -> List[List[Pair]]:
+    """
+    Round-robin rounds by the circle method: the first player stays fixed
+    while the others rotate one position per round, so every pair meets
+    exactly once in len(players) - 1 rounds (one more bye round-slot for an
+    odd count).
+
+    Args:
+        players (List[Hashable]): Player IDs
+
+    Returns:
+        List[List[Pair]]: Pairs of each round; (player, None) is a bye
+    """
+    circle = list(players)
+    if len(circle) % 2:
+        circle.append(None)
+    n = len(circle)
+    fixed, rotating = circle[0], circle[1:]
+
+    rounds = []
+    for _ in range(n - 1):
+        current = [fixed] + rotating
+        pairs = [(current[i], current[n - 1 - i]) for i in range(n // 2)]
+        rounds.append([(b, a) if a is None else (a, b) for a, b in pairs])
+        rotating = rotating[-1:] + rotating[:-1]
+    return rounds
+
+
+def swiss_pairings(
+    players: List[Hashable],
+    ratings: Dict[Hashable, float],
+    scores: Optional[Dict[Hashable, float]] = None,
+    played: Optional[Set[PlayedPair]] = None,
+    had_bye: Iterable[Hashable] = (),
+    max_steps: int = SWISS_MAX_STEPS
+) -> Tuple[List[Pair], Optional[Hashable], int]:
+    """
+    Pairs one Swiss round. Players are ranked by score then rating and the
+    best unpaired player takes the closest available opponent (score first,
+    then rating) it has not met yet. A dead end backtracks to the next
+    closest opponent, within max_steps search nodes. When the search runs
+    out of budget (late rounds of a long event), a minimum-cost perfect
+    matching over all pairs decides instead: fewest rematches first, then
+    the smallest score and rating distances.
+
+    Args:
+        players (List[Hashable]): Player IDs
+        ratings (Dict[Hashable, float]): Rating of each player
+        scores (Optional[Dict[Hashable, float]]): Points in the event so far
+        played (Optional[Set[PlayedPair]]): Pairs already played, as frozensets
+        had_bye (Iterable[Hashable]): Players that already had a bye
+        max_steps (int): Search nodes before falling back to the blossom matching
+
+    Returns:
+        Tuple[List[Pair], Optional[Hashable], int]: Pairs, bye player and number of rematches
+    """
+    scores = scores or {}
+    played = played or set()
+    ranked = sorted(players, key=lambda p: (-scores.get(p, 0), -ratings[p]))
+
+    bye = None
+    if len(ranked) % 2:
+        # Bye para o pior colocado que ainda não teve um
+        had_bye = set(had_bye)
+        bye = next((p for p in reversed(ranked) if p not in had_bye), ranked[-1])
+        ranked.remove(bye)
+
+    pairs = _closest_pairs(ranked, ratings, scores, played, max_steps)
+    if pairs is None:
+        pairs = _min_cost_pairs(ranked, ratings, scores, played)
+    rematches = sum(frozenset((a, b)) in played for a, b in pairs)
+    return pairs, bye, rematches
+
+
+def _closest_pairs(
+    ranked: List[Hashable],
+    ratings: Dict[Hashable, float],
+    scores: Dict[Hashable, float],
+    played: Set[PlayedPair],
+    max_steps: int
+) -> Optional[List[Pair]]:
+    pairs: List[Pair] = []
+    steps = 0
+
+    def distance(a: Hashable, b: Hashable) -> Tuple[float, float]:
+        return abs(scores.get(a, 0) - scores.get(b, 0)), abs(ratings[a] - ratings[b])
+
+    def solve(remaining: List[Hashable]) -> bool:
+        nonlocal steps
+        if not remaining:
+            return True
+        steps += 1
+        if steps > max_steps:
+            return False
+        top, rest = remaining[0], remaining[1:]
+        candidates = sorted(
+            (p for p in rest if frozenset((top, p)) not in played),
+            key=lambda p: distance(top, p)
+        )
+        for opponent in candidates:
+            pairs.append((top, opponent))
+            if solve([p for p in rest if p != opponent]):
+                return True
+            pairs.pop()
+            if steps > max_steps:
+                return False
+        return False
+
+    return pairs if solve(ranked) else None
+
+
+def _min_cost_pairs(
+    ranked: List[Hashable],
+    ratings: Dict[Hashable, float],
+    scores: Dict[Hashable, float],
+    played: Set[PlayedPair]
+) -> List[Pair]:
+    costs = {
+        (i, j): round(
+            SWISS_SCORE_WEIGHT * abs(scores.get(a, 0) - scores.get(b, 0)) + abs(ratings[a] - ratings[b])
+        )
+        for i, a in enumerate(ranked)
+        for j, b in enumerate(ranked[i + 1:], start=i + 1)
+    }
+    # Uma revanche custa mais que todas as distâncias da rodada somadas
+    penalty = len(ranked) // 2 * max(costs.values(), default=0) + 1
+    for i, j in costs:
+        if frozenset((ranked[i], ranked[j])) in played:
+            costs[i, j] += penalty
+    # Máximo de (teto - custo) entre os emparelhamentos perfeitos = custo mínimo
+    ceiling = max(costs.values(), default=0) + 1
+    mate = max_weight_matching([(i, j, ceiling - cost) for (i, j), cost in costs.items()], maxcardinality=True)
+    return [(ranked[i], ranked[j]) for i, j in enumerate(mate) if i < j]
+
+
+def pack_tables(rounds: List[List[Pair]], tables: int) -> List[Tuple[int, int, int, Hashable, Hashable]]:
+    """
+    Places the matches of consecutive rounds on tables and time slots.
+
+    Matches are taken in round order and each goes to the earliest slot
+    after both players' previous match that still has a free table, so no
+    player is booked twice in a slot and a round may start on tables left
+    free by the previous one. Full slots are skipped with a union-find
+    "next free slot" pointer, keeping placement near O(1) per match.
+
+    Args:
+        rounds (List[List[Pair]]): Output of round_robin_rounds or swiss_pairings
+        tables (int): Tables available in each slot
+
+    Returns:
+        List[Tuple[int, int, int, Hashable, Hashable]]: (round, slot, table, player1, player2),
+            rounds, slots and tables numbered from 1; byes are left out
+    """
+    used: List[int] = []
+    # Próximo slot possivelmente livre a partir de cada slot cheio
+    skip: Dict[int, int] = {}
+    next_slot: Dict[Hashable, int] = {}
+
+    def free_from(slot: int) -> int:
+        root = slot
+        while root in skip:
+            root = skip[root]
+        while slot != root:
+            skip[slot], slot = root, skip[slot]
+        return root
+
+    placed = []
+    for round_number, pairs in enumerate(rounds, start=1):
+        for player1, player2 in pairs:
+            if player2 is None:
+                continue
+            slot = free_from(max(next_slot.get(player1, 0), next_slot.get(player2, 0)))
+            while len(used) <= slot:
+                used.append(0)
+            used[slot] += 1
+            if used[slot] == tables:
+                skip[slot] = slot + 1
+            next_slot[player1] = next_slot[player2] = slot + 1
+            placed.append((round_number, slot + 1, used[slot], player1, player2))
+    return placed
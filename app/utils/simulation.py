@@ -0,0 +1,100 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .helpers import generate_tournament_brackets
+
+# Marca uma posição vazia (bye) na chave
+BYE = -1
+
+
+def bracket_slots(brackets: List[Dict[str, Any]], players: List[Any]) -> np.ndarray:
+    """
+    Flatten the round-1 layout of generate_tournament_brackets into bracket
+    positions holding indexes into players (BYE for empty positions).
+
+    Args:
+        brackets (List[Dict[str, Any]]): Output of generate_tournament_brackets
+        players (List[Any]): Players the brackets were generated from
+
+    Returns:
+        np.ndarray: Position -> player index, two positions per first-round match
+    """
+    index = {player: i for i, player in enumerate(players)}
+    slots = np.full(2 * len(brackets), BYE, dtype=np.int64)
+    for i, match in enumerate(brackets):
+        for j, key in enumerate(("player1", "player2")):
+            if match[key] is not None:
+                slots[2 * i + j] = index[match[key]]
+    return slots
+
+
+def simulate_bracket(
+    slots: np.ndarray,
+    ratings: np.ndarray,
+    simulations: int,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    Monte Carlo simulation of a single-elimination bracket. Every round of
+    every simulation is drawn at once with the ELO expected score.
+
+    Args:
+        slots (np.ndarray): Position -> player index (BYE for empty positions)
+        ratings (np.ndarray): Rating of each player index
+        simulations (int): Number of simulated tournaments
+        seed (Optional[int]): Seed for the random generator
+
+    Returns:
+        np.ndarray: Shape (players, rounds + 1); column r is the probability of
+            reaching round r + 1, the last column the probability of winning
+    """
+    rng = np.random.default_rng(seed)
+    n_players = len(ratings)
+    rounds = int(np.log2(len(slots)))
+    # A última posição de rating_ext é usada pelos byes
+    rating_ext = np.append(np.asarray(ratings, dtype=np.float64), 0.0)
+    dtype = np.int16 if n_players < np.iinfo(np.int16).max else np.int32
+
+    alive = np.broadcast_to(slots.astype(dtype), (simulations, len(slots)))
+    reached = np.zeros((n_players, rounds + 1))
+
+    for round_number in range(rounds + 1):
+        present = alive[alive != BYE]
+        reached[:, round_number] = np.bincount(present, minlength=n_players)[:n_players] / simulations
+        if round_number == rounds:
+            break
+
+        first, second = alive[:, 0::2], alive[:, 1::2]
+        p_first = 1 / (1 + np.power(10.0, (rating_ext[second] - rating_ext[first]) / 400))
+        first_wins = rng.random(first.shape) < p_first
+        first_wins |= second == BYE
+        first_wins &= first != BYE
+        alive = np.where(first_wins, first, second)
+
+    return reached
+
+
+def simulate_tournament(
+    players: List[Any],
+    ratings: List[float],
+    simulations: int,
+    seeded_players: Optional[List[Any]] = None,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    Simulate a tournament laid out by generate_tournament_brackets.
+
+    Args:
+        players (List[Any]): Player IDs
+        ratings (List[float]): Rating of each player, aligned with players
+        simulations (int): Number of simulated tournaments
+        seeded_players (Optional[List[Any]]): Seeded player IDs
+        seed (Optional[int]): Seed for the random generator
+
+    Returns:
+        np.ndarray: See simulate_bracket; rows are aligned with players
+    """
+    brackets = generate_tournament_brackets(list(players), list(seeded_players or []))
+    slots = bracket_slots(brackets, players)
+    return simulate_bracket(slots, np.asarray(ratings), simulations, seed)
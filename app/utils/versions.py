@@ -0,0 +1,80 @@
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Dict, Tuple
+import time
+
+# (version, modified_at em segundos desde a época)
+Version = Tuple[int, float]
+
+
+class VersionStore(ABC):
+    """
+    Version counters of resources ("player:42") and collections
+    ("players"), bumped by the writers after their commit and read by the
+    endpoints to build ETag/Last-Modified without touching the database.
+
+    A key never bumped reports version 0 modified when the store was
+    created, so a counter lost on restart never repeats an old validator.
+    """
+
+    def __init__(self):
+        self.created_at = time.time()
+
+    @abstractmethod
+    def get(self, key: str) -> Version:
+        """Current (version, modified_at) of a key"""
+
+    @abstractmethod
+    def bump(self, *keys: str) -> None:
+        """Advances the version of every key, stamped with the current time"""
+
+
+class MemoryVersionStore(VersionStore):
+    """Counters of a single worker process"""
+
+    def __init__(self):
+        super().__init__()
+        self._versions: Dict[str, Version] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> Version:
+        return self._versions.get(key, (0, self.created_at))
+
+    def bump(self, *keys: str) -> None:
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                version, _ = self._versions.get(key, (0, self.created_at))
+                self._versions[key] = (version + 1, now)
+
+
+class RedisVersionStore(VersionStore):
+    """
+    Counters shared by every worker process, one Redis hash per key with
+    the version ("v") and the modification time ("t"). A bump of any number
+    of keys is one MULTI/EXEC round trip; a read is one HMGET.
+    """
+
+    def __init__(self, client, prefix: str = "versions"):
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Version:
+        version, modified_at = self.client.hmget(self._name(key), "v", "t")
+        if version is None or modified_at is None:
+            return 0, self.created_at
+        return int(version), float(modified_at)
+
+    def bump(self, *keys: str) -> None:
+        if not keys:
+            return
+        now = time.time()
+        pipe = self.client.pipeline(transaction=True)
+        for key in keys:
+            pipe.hincrby(self._name(key), "v", 1)
+            pipe.hset(self._name(key), "t", now)
+        pipe.execute()
+
+    def _name(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
@@ -0,0 +1,174 @@
+"""
+Compara a vazão do caminho sync (def + SessionLocal no threadpool) com o
+caminho async (async def + AsyncSession) em leituras de jogador, com
+níveis crescentes de requisições simultâneas, contra DATABASE_URL.
+
+Depois mede a latência p50/p99 de GET /api/v1/players/{id} da aplicação
+enquanto um escritor cria partidas sem parar: partidas novas (atualização
+incremental) e retroativas (replay de todo o histórico de ratings). Uma
+escrita que ocupe o event loop aparece como cauda na latência das leituras.
+
+Uso:
+    python benchmarks/bench_async_endpoints.py --requests 2000 --concurrency 1 8 32 128 --matches 2000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.deps import get_async_db, get_db  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.main import app as main_app  # noqa: E402
+from app.models.player import Player  # noqa: E402
+from app.schemas.match import MatchCreate  # noqa: E402
+from app.schemas.player import Player as PlayerSchema  # noqa: E402
+from app.services.match_service import MatchService  # noqa: E402
+from app.services.player_service import AsyncPlayerService, PlayerService  # noqa: E402
+
+app = FastAPI()
+SETS = [{"set_number": n, "score_p1": 11, "score_p2": 7} for n in range(1, 4)]
+# Partidas retroativas caem antes de todo o histórico: cada uma refaz o replay inteiro
+HISTORY_START = datetime(2020, 1, 1)
+
+
+@app.get("/sync/{player_id}", response_model=PlayerSchema)
+def get_player_sync(player_id: int, db: Session = Depends(get_db)):
+    return PlayerService(db).get_by_id(player_id)
+
+
+@app.get("/async/{player_id}", response_model=PlayerSchema)
+async def get_player_async(player_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await AsyncPlayerService(db).get_by_id(player_id)
+
+
+def create_players(n_players: int) -> list:
+    tag = uuid.uuid4().hex[:8]
+    db = SessionLocal()
+    try:
+        players = [
+            Player(username=f"bench_{tag}_{i}", email=f"bench_{tag}_{i}@example.com",
+                   full_name=f"Bench {i}", hashed_password="x")
+            for i in range(n_players)
+        ]
+        db.add_all(players)
+        db.commit()
+        return [player.id for player in players]
+    finally:
+        db.close()
+
+
+def create_history(player_ids: list, n_matches: int) -> None:
+    db = SessionLocal()
+    try:
+        MatchService(db).create_matches_bulk([
+            MatchCreate(
+                player1_id=player_ids[i % len(player_ids)],
+                player2_id=player_ids[(i + 1) % len(player_ids)],
+                sets=SETS,
+                created_at=HISTORY_START + timedelta(days=1, minutes=i)
+            )
+            for i in range(n_matches)
+        ])
+    finally:
+        db.close()
+
+
+async def run(path: str, player_ids: list, n_requests: int, concurrency: int) -> float:
+    limit = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def request(i: int) -> None:
+            async with limit:
+                response = await client.get(f"/{path}/{player_ids[i % len(player_ids)]}")
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(request(i) for i in range(n_requests)))
+        return n_requests / (time.perf_counter() - started)
+
+
+async def reads_during_writes(
+    player_ids: list,
+    n_requests: int,
+    concurrency: int,
+    backdated: Optional[bool]
+) -> Tuple[float, float, int]:
+    """p50 e p99 (ms) das leituras e escritas concluídas; backdated None = sem escritor"""
+    limit = asyncio.Semaphore(concurrency)
+    latencies = []
+    done = asyncio.Event()
+    transport = httpx.ASGITransport(app=main_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def read(i: int) -> None:
+            async with limit:
+                started = time.perf_counter()
+                response = await client.get(f"/api/v1/players/{player_ids[i % len(player_ids)]}")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        async def write() -> int:
+            writes = 0
+            while not done.is_set():
+                match = {
+                    "player1_id": player_ids[writes % len(player_ids)],
+                    "player2_id": player_ids[(writes + 1) % len(player_ids)],
+                    "sets": SETS,
+                }
+                if backdated:
+                    match["created_at"] = (HISTORY_START + timedelta(seconds=writes)).isoformat()
+                (await client.post("/api/v1/matches/", json=match)).raise_for_status()
+                writes += 1
+            return writes
+
+        writer = asyncio.create_task(write()) if backdated is not None else None
+        await asyncio.gather(*(read(i) for i in range(n_requests)))
+        done.set()
+        writes = await writer if writer is not None else 0
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    return p50, p99, writes
+
+
+async def bench(args: argparse.Namespace) -> None:
+    # Um só event loop: o pool do engine async fica preso ao loop em que abriu as conexões
+    player_ids = create_players(args.players)
+    print(f"{args.requests} requests per run, {args.players} players")
+    print(f"{'concurrency':>11} {'sync req/s':>12} {'async req/s':>12}")
+    for concurrency in args.concurrency:
+        sync_rate = await run("sync", player_ids, args.requests, concurrency)
+        async_rate = await run("async", player_ids, args.requests, concurrency)
+        print(f"{concurrency:>11} {sync_rate:12,.0f} {async_rate:12,.0f}")
+
+    create_history(player_ids, args.matches)
+    concurrency = max(args.concurrency)
+    print(f"\nGET /api/v1/players/{{id}} at concurrency {concurrency}, {args.matches} matches of history")
+    print(f"{'writer':>10} {'p50 ms':>8} {'p99 ms':>8} {'writes':>7}")
+    for name, backdated in (("none", None), ("write", False), ("replay", True)):
+        p50, p99, writes = await reads_during_writes(player_ids, args.requests, concurrency, backdated)
+        print(f"{name:>10} {p50:8.1f} {p99:8.1f} {writes:7}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--matches", type=int, default=2_000, help="Histórico replayado pelas escritas retroativas")
+    asyncio.run(bench(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compara o tempo de CPU por requisição das listagens de jogadores e
+partidas (páginas de 100 itens) com a validação pelo response_model e com
+o caminho rápido (dicts projetados + orjson), contra DATABASE_URL.
+
+Uso:
+    python benchmarks/bench_list_serialization.py --requests 500
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.player import Player  # noqa: E402
+from app.schemas.match import MatchCreate  # noqa: E402
+from app.services.match_service import MatchService  # noqa: E402
+
+PAGE_SIZE = 100
+
+
+def create_data(n_players: int, n_matches: int) -> None:
+    tag = uuid.uuid4().hex[:8]
+    db = SessionLocal()
+    try:
+        players = [
+            Player(username=f"bench_{tag}_{i}", email=f"bench_{tag}_{i}@example.com",
+                   full_name=f"Bench Player {i}", hashed_password="x",
+                   bio="Benchmark player", avatar_url=f"https://example.com/{tag}/{i}.png")
+            for i in range(n_players)
+        ]
+        db.add_all(players)
+        db.commit()
+        player_ids = [player.id for player in players]
+        sets = [{"set_number": n, "score_p1": 11, "score_p2": 7} for n in range(1, 4)]
+        MatchService(db).create_matches_bulk([
+            MatchCreate(
+                player1_id=player_ids[i % n_players],
+                player2_id=player_ids[(i + 1) % n_players],
+                sets=sets
+            )
+            for i in range(n_matches)
+        ])
+    finally:
+        db.close()
+
+
+async def cpu_per_request(path: str, n_requests: int, fast: bool) -> float:
+    settings.FAST_JSON_RESPONSES = fast
+    transport = httpx.ASGITransport(app=app)
+    # identity: a compressão não entra na medida
+    headers = {"Accept-Encoding": "identity"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        for _ in range(10):
+            (await client.get(path, params={"limit": PAGE_SIZE})).raise_for_status()
+        started = time.process_time()
+        for _ in range(n_requests):
+            (await client.get(path, params={"limit": PAGE_SIZE})).raise_for_status()
+        return (time.process_time() - started) / n_requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--matches", type=int, default=200)
+    args = parser.parse_args()
+
+    create_data(args.players, args.matches)
+    print(f"{args.requests} requests per run, pages of {PAGE_SIZE}")
+    print(f"{'endpoint':>18} {'response_model':>15} {'orjson':>10} {'speedup':>8}")
+    for path in ("/api/v1/players/", "/api/v1/matches/"):
+        slow = asyncio.run(cpu_per_request(path, args.requests, fast=False))
+        fast = asyncio.run(cpu_per_request(path, args.requests, fast=True))
+        print(f"{path:>18} {slow * 1000:13.2f}ms {fast * 1000:8.2f}ms {slow / fast:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
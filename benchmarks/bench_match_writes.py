@@ -0,0 +1,75 @@
+"""
+Mede a latência de criação de partidas (p50/p99) com escritores concorrentes
+contra o banco configurado em DATABASE_URL.
+
+Uso:
+    python benchmarks/bench_match_writes.py --writers 8 --matches 2000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal  # noqa: E402
+from app.schemas.match import MatchCreate  # noqa: E402
+from app.schemas.player import PlayerCreate  # noqa: E402
+from app.services.match_service import MatchService  # noqa: E402
+from app.services.player_service import PlayerService  # noqa: E402
+
+
+def create_players(n_players: int) -> list:
+    tag = uuid.uuid4().hex[:8]
+    db = SessionLocal()
+    try:
+        service = PlayerService(db)
+        return [
+            service.create(PlayerCreate(
+                username=f"bench_{tag}_{i}", email=f"bench_{tag}_{i}@example.com",
+                full_name=f"Bench {i}", password="benchmark"
+            )).id
+            for i in range(n_players)
+        ]
+    finally:
+        db.close()
+
+
+def write_match(player_ids: list) -> float:
+    player1_id, player2_id = random.sample(player_ids, 2)
+    sets = [{"set_number": n, "score_p1": 11, "score_p2": 7} for n in range(1, 4)]
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        MatchService(db).create_match(MatchCreate(player1_id=player1_id, player2_id=player2_id, sets=sets))
+        return time.perf_counter() - started
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--matches", type=int, default=2_000)
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--writers", type=int, default=8)
+    args = parser.parse_args()
+
+    player_ids = create_players(args.players)
+    print(f"{args.matches} matches, {args.players} players, {args.writers} writers")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(args.writers) as pool:
+        latencies = np.array(list(pool.map(write_match, [player_ids] * args.matches))) * 1000
+    elapsed = time.perf_counter() - started
+
+    p50, p99 = np.percentile(latencies, [50, 99])
+    print(f"p50 {p50:8.2f}ms  p99 {p99:8.2f}ms  {args.matches / elapsed:10,.0f} matches/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compara a vazão dos sistemas de rating sobre o mesmo histórico sintético.
+
+Uso:
+    python benchmarks/bench_rating_systems.py --matches 1000000 --players 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.rating_engine import replay_elo  # noqa: E402
+from app.utils.rating_systems import RATING_SYSTEMS  # noqa: E402
+
+
+def synthetic_history(n_matches: int, n_players: int, n_periods: int, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    skill = rng.normal(0, 200, n_players + 1)
+    player1_ids = rng.integers(1, n_players + 1, n_matches)
+    offsets = rng.integers(1, n_players, n_matches)
+    player2_ids = (player1_ids - 1 + offsets) % n_players + 1
+    p_win = 1 / (1 + 10 ** ((skill[player2_ids] - skill[player1_ids]) / 400))
+    player1_won = rng.random(n_matches) < p_win
+    period_ids = np.sort(rng.integers(0, n_periods, n_matches))
+    return player1_ids, player2_ids, player1_won, period_ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--matches", type=int, default=1_000_000)
+    parser.add_argument("--players", type=int, default=5_000)
+    parser.add_argument("--periods", type=int, default=520)
+    args = parser.parse_args()
+
+    history = synthetic_history(args.matches, args.players, args.periods)
+    print(f"{args.matches} matches, {args.players} players, {args.periods} rating periods")
+
+    started = time.perf_counter()
+    replay_elo(*history[:3])
+    elapsed = time.perf_counter() - started
+    print(f"{'elo (sequential)':<18} {elapsed:8.3f}s {args.matches / elapsed:14,.0f} matches/s")
+
+    for name, system_class in RATING_SYSTEMS.items():
+        system = system_class()
+        started = time.perf_counter()
+        system.replay(*history)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<18} {elapsed:8.3f}s {args.matches / elapsed:14,.0f} matches/s")
+
+
+if __name__ == "__main__":
+    main()
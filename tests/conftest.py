@@ -1,12 +1,19 @@
 import pytest
-from typing import Generator
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from itertools import count
+from typing import Generator, List
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.api.deps import get_db
+from app.api.deps import get_async_db, get_db
 from app.db.base import Base
+from app.models.player import Player
+from app.services.league_service import ratings_cache as league_ratings_cache
+from app.services.player_service import profile_cache
 
 # Criar banco de dados de teste
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -14,6 +21,9 @@ engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Mesmo arquivo pelo driver assíncrono; NullPool porque cada TestClient tem seu event loop
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 @pytest.fixture(scope="session")
 def db() -> Generator:
@@ -35,7 +45,12 @@ def client() -> Generator:
         finally:
             db.close()
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
@@ -45,11 +60,75 @@ def clean_tables(db):
     """Limpa as tabelas após cada teste"""
     # Limpeza em ordem para evitar problemas de foreign key
     tables = [
-        'ranking',
-        'match',
-        'tournament',
-        'player'
+        'bracket_slots',
+        'tournament_rounds',
+        'tournaments',
+        'import_checkpoints',
+        'rating_checkpoints',
+        'rating_ledger',
+        'player_stats',
+        'head_to_head',
+        'achievement_progress',
+        'player_achievements',
+        'sets',
+        'match_participants',
+        'matches',
+        'leagues',
+        'players'
     ]
     for table in tables:
-        db.execute(f'DELETE FROM {table}')
-    db.commit()
\ No newline at end of file
+        db.execute(text(f'DELETE FROM {table}'))
+    db.commit()
+    # Os ids recomeçam após a limpeza: perfis e ratings em cache seriam de outro jogador ou liga
+    profile_cache.clear()
+    league_ratings_cache.clear()
+
+@pytest.fixture
+def make_players(db):
+    """
+    Fábrica de jogadores gravados no banco de teste; devolve os ids.
+    Cada coluna extra recebe um valor para todos ou uma lista com um por jogador.
+    """
+    numbers = count()
+
+    def make(n: int, **columns) -> List[int]:
+        players = []
+        for i in range(n):
+            number = next(numbers)
+            values = {key: value[i] if isinstance(value, list) else value for key, value in columns.items()}
+            username = values.pop("username", f"player{number}")
+            values.setdefault("full_name", f"Player {number}")
+            players.append(Player(
+                username=username, email=f"{username}@example.com", hashed_password="x", **values
+            ))
+        db.add_all(players)
+        db.commit()
+        return [player.id for player in players]
+
+    return make
+
+@pytest.fixture
+def async_session_factory():
+    """Fábrica de AsyncSession sobre o banco de teste"""
+    return TestingAsyncSessionLocal
+
+@pytest.fixture
+def count_queries():
+    """Context manager que coleta os comandos SQL enviados ao banco de teste"""
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engines = (engine, async_engine.sync_engine)
+        for target in engines:
+            event.listen(target, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            for target in engines:
+                event.remove(target, "before_cursor_execute", record)
+
+    return counter
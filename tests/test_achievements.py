@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.achievement import AchievementProgress, PlayerAchievement
+from app.schemas.match import MatchCreate
+from app.services.achievement_service import AchievementService
+from app.services.match_service import MatchService
+from app.utils.achievements import AchievementEngine
+
+START = datetime(2024, 5, 1)
+THRESHOLDS = {
+    'winning_streak': {'bronze': 2, 'silver': 3},
+    'matches_played': {'bronze': 3},
+    'tournaments_won': {'bronze': 1},
+}
+
+def test_engine_tracks_streaks_and_awards_once():
+    engine = AchievementEngine(THRESHOLDS)
+    results = [True, True, False, True, True, True, True]
+    awards = []
+    for match_id, won in enumerate(results, start=1):
+        awards += engine.record_match(match_id, 1, 2, 1 if won else 2, START + timedelta(days=match_id))
+
+    progress = engine.get(1)
+    assert (progress.current_streak, progress.best_streak, progress.matches_played) == (4, 4, 7)
+    assert [(a.player_id, a.achievement, a.level, a.match_id) for a in awards] == [
+        (1, 'winning_streak', 'bronze', 2),
+        (1, 'matches_played', 'bronze', 3),
+        (2, 'matches_played', 'bronze', 3),
+        (1, 'winning_streak', 'silver', 6),
+    ]
+    assert engine.record_tournament_win(2, START)[0].level == 'bronze'
+
+@pytest.fixture
+def players(make_players):
+    return make_players(2)
+
+@pytest.fixture
+def match_service(db):
+    service = MatchService(db)
+    service.achievement_service = AchievementService(db, THRESHOLDS)
+    return service
+
+def play(service, winner_id, loser_id, days):
+    return service.create_match(MatchCreate(
+        player1_id=winner_id, player2_id=loser_id,
+        sets=[{"set_number": 1, "score_p1": 11, "score_p2": 8}],
+        created_at=START + timedelta(days=days)
+    ))
+
+def state(db):
+    db.expire_all()
+    progress = {
+        row.player_id: (row.matches_played, row.current_streak, row.best_streak)
+        for row in db.query(AchievementProgress).all()
+    }
+    awards = sorted(
+        (row.player_id, row.achievement, row.level, row.match_id)
+        for row in db.query(PlayerAchievement).all()
+    )
+    return progress, awards
+
+def test_service_matches_backfill(db, players, match_service):
+    a, b = players
+    play(match_service, a, b, days=1)
+    play(match_service, a, b, days=3)
+    play(match_service, b, a, days=4)
+    # Retroativa: reprocessa o histórico dos dois jogadores
+    play(match_service, a, b, days=2)
+
+    incremental = state(db)
+    assert incremental[0][a] == (4, 0, 3)
+    assert ('winning_streak', 'silver') in {(award[1], award[2]) for award in incremental[1] if award[0] == a}
+
+    assert AchievementService(db, THRESHOLDS).backfill(batch_size=2) == 4
+    assert state(db) == incremental
+
+def test_delete_replays_streak(db, players, match_service):
+    a, b = players
+    play(match_service, a, b, days=1)
+    middle = play(match_service, b, a, days=2)
+    play(match_service, a, b, days=3)
+
+    match_service.delete_match(middle.id)
+
+    progress, awards = state(db)
+    assert progress[a] == (2, 2, 2)
+    assert progress[b] == (2, 0, 0)
+    assert (a, 'winning_streak', 'bronze') in {award[:3] for award in awards}
+
+def test_achievements_endpoint(client, db, players, match_service):
+    play(match_service, players[0], players[1], days=1)
+
+    response = client.get(f"/api/v1/players/{players[0]}/achievements")
+    assert response.status_code == 200
+    assert (response.json()["current_streak"], response.json()["matches_played"]) == (1, 1)
+    assert client.get("/api/v1/players/999999/achievements").status_code == 404
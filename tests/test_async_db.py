@@ -0,0 +1,73 @@
+import asyncio
+import inspect
+import threading
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app.core.cache import run_cache_io
+from app.core.config import settings
+from app.db.session import async_database_url
+from app.main import app
+from app.schemas.match import MatchCreate
+from app.services.match_service import AsyncMatchService, MatchService
+from app.services.player_service import AsyncPlayerService
+
+WIN = [{"set_number": n, "score_p1": 11, "score_p2": 6} for n in range(1, 4)]
+
+def test_async_database_url_picks_the_async_driver():
+    assert async_database_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert async_database_url("postgresql+psycopg2://u@db/app") == "postgresql+asyncpg://u@db/app"
+    assert async_database_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+    with pytest.raises(ValueError):
+        async_database_url("mysql://u@db/app")
+
+@pytest.fixture
+def players(make_players):
+    return make_players(4)
+
+def test_async_services_run_concurrently(db, players, async_session_factory):
+    service = MatchService(db)
+    created = [
+        service.create_match(MatchCreate(player1_id=a, player2_id=b, sets=WIN))
+        for a, b in [(players[0], players[1]), (players[2], players[3])]
+    ]
+
+    async def read(player_id):
+        async with async_session_factory() as session:
+            return await AsyncPlayerService(session).get_by_id(player_id)
+
+    async def scenario():
+        # Sessões independentes em paralelo no mesmo event loop
+        fetched_players = await asyncio.gather(*(read(player_id) for player_id in players))
+        async with async_session_factory() as session:
+            service = AsyncMatchService(session)
+            fetched = await service.get_match(created[0].id)
+            page = await service.get_matches_page(player_id=players[2], lean=True)
+            total = await service.count_matches(player_id=players[2])
+            # Segunda leitura vem do profile_cache
+            cached = await AsyncPlayerService(session).get_by_id(players[0])
+        return fetched_players, fetched, page, total, cached
+
+    fetched_players, fetched, page, total, cached = asyncio.run(scenario())
+
+    assert [player.id for player in fetched_players] == players
+    assert [s.score_p1 for s in fetched.sets] == [11, 11, 11]
+    assert [item["id"] for item in page.items] == [created[1].id]
+    assert total == 1
+    assert cached.username == fetched_players[0].username
+
+def test_writes_stay_off_the_event_loop():
+    # Replays de rating, conquistas e chaves rodam no threadpool, não no event loop
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.methods & {"POST", "PATCH", "PUT", "DELETE"}:
+            assert not inspect.iscoroutinefunction(route.endpoint), route.path
+
+def test_redis_cache_calls_run_in_the_threadpool(monkeypatch):
+    async def thread_of_call():
+        return await run_cache_io(threading.get_ident)
+
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "memory")
+    assert asyncio.run(thread_of_call()) == threading.get_ident()
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "redis")
+    assert asyncio.run(thread_of_call()) != threading.get_ident()
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.achievement import AchievementProgress
+from app.models.match import Match
+from app.models.player import Player
+from app.models.set import Set
+from app.models.stats import HeadToHead, PlayerStats
+from app.schemas.match import MatchCreate
+from app.services.achievement_service import AchievementService
+from app.services import match_service
+from app.services.match_service import MatchService
+from app.services.rating_service import RatingService
+from app.utils.helpers import validate_match_sets
+
+START = datetime(2024, 7, 1)
+STRAIGHT_SETS = [
+    {"set_number": 1, "score_p1": 11, "score_p2": 5},
+    {"set_number": 2, "score_p1": 13, "score_p2": 11},
+    {"set_number": 3, "score_p1": 11, "score_p2": 9},
+]
+
+@pytest.mark.parametrize("sets, valid", [
+    ([(1, 11, 5), (2, 13, 11), (3, 11, 9)], True),
+    ([(1, 5, 11), (2, 11, 3), (3, 3, 11), (4, 11, 0), (5, 9, 11)], True),
+    ([(1, 11, 5), (2, 11, 5)], False),                          # ninguém venceu 3 sets
+    ([(1, 11, 5), (2, 11, 5), (3, 11, 5), (4, 11, 5)], False),  # set após a decisão
+    ([(1, 11, 10), (2, 11, 5), (3, 11, 5)], False),             # sem 2 pontos de vantagem
+    ([(1, 14, 11), (2, 11, 5), (3, 11, 5)], False),             # passou do fim do set
+    ([(1, 11, 5), (3, 11, 5), (4, 11, 5)], False),              # numeração com lacuna
+])
+def test_validate_match_sets(sets, valid):
+    assert (validate_match_sets(sets) is None) == valid
+
+@pytest.fixture
+def players(make_players):
+    return make_players(3)
+
+def item(player1_id, player2_id, days, sets=STRAIGHT_SETS):
+    return MatchCreate(
+        player1_id=player1_id, player2_id=player2_id, sets=sets,
+        created_at=START + timedelta(days=days)
+    )
+
+def test_bulk_reports_errors_and_keeps_valid_items(db, players):
+    a, b, c = players
+    result = MatchService(db).create_matches_bulk([
+        item(a, b, 1),
+        item(a, a, 2),
+        item(b, 999999, 3),
+        item(c, a, 4, sets=STRAIGHT_SETS[:2]),
+        item(c, b, 5),
+    ])
+
+    assert result.created == 2
+    assert [e.index for e in result.errors] == [1, 2, 3]
+    assert result.match_ids[1:4] == [None, None, None]
+    assert db.query(Match).count() == 2
+    assert db.query(Set).count() == 6
+    first = db.get(Match, result.match_ids[0])
+    assert (first.winner_id, [s.set_number for s in first.sets]) == (a, [1, 2, 3])
+
+def test_bulk_matches_sequential_inserts(db, players):
+    a, b, c = players
+    service = MatchService(db)
+    service.create_match(item(b, c, 10))
+    # Lote com uma partida retroativa em relação à já existente
+    service.create_matches_bulk([item(a, b, 11), item(c, a, 5), item(a, b, 12)])
+
+    bulk = {
+        "ratings": {p.id: p.rating for p in db.query(Player).all()},
+        "stats": {s.player_id: (s.matches_played, s.wins, s.sets_won, s.points_won)
+                  for s in db.query(PlayerStats).all()},
+        "progress": {p.player_id: (p.matches_played, p.current_streak, p.best_streak)
+                     for p in db.query(AchievementProgress).all()},
+        "h2h": {(h.player_low_id, h.player_high_id): (h.matches_played, h.low_wins, h.last_match_at)
+                for h in db.query(HeadToHead).all()},
+    }
+    assert bulk["stats"][a] == (3, 2, 6, 35 + 35 + 25)
+    assert bulk["h2h"][tuple(sorted((a, b)))] == (2, 2, START + timedelta(days=12))
+
+    RatingService(db).rebuild()
+    AchievementService(db).backfill()
+    db.expire_all()
+    assert {p.id: p.rating for p in db.query(Player).all()} == pytest.approx(bulk["ratings"])
+    assert {p.player_id: (p.matches_played, p.current_streak, p.best_streak)
+            for p in db.query(AchievementProgress).all()} == bulk["progress"]
+
+def test_bulk_endpoint(client, players):
+    a, b, _ = players
+    payload = {"matches": [
+        {"player1_id": a, "player2_id": b, "sets": STRAIGHT_SETS},
+        {"player1_id": a, "player2_id": b, "sets": STRAIGHT_SETS[:1]},
+    ]}
+    response = client.post("/api/v1/matches/bulk", json=payload)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 1
+    assert body["match_ids"][1] is None
+    assert body["errors"][0]["index"] == 1
+
+    assert client.post("/api/v1/matches/bulk", json={"matches": []}).status_code == 422
+
+def test_post_commit_failure_is_not_reported_as_rejected(db, players, monkeypatch):
+    def unavailable():
+        raise ConnectionError("cache unavailable")
+    monkeypatch.setattr(match_service.count_cache, "clear", unavailable)
+
+    # A partida já foi confirmada: o erro do cache não vira um 400 de lote rejeitado
+    with pytest.raises(ConnectionError):
+        MatchService(db).create_matches_bulk([item(players[0], players[1], 1)])
+    assert db.query(Match).count() == 1
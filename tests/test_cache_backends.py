@@ -0,0 +1,107 @@
+import pytest
+
+from app.utils.cache import RedisCache, TTLCache
+from app.utils.helpers import CATEGORY_NAMES, get_player_category
+from app.utils.leaderboard import MemoryLeaderboardBackend, RedisLeaderboardBackend
+
+def _redis_client():
+    from app.core.cache import get_redis
+
+    client = get_redis()
+    try:
+        client.ping()
+    except Exception:
+        pytest.skip("Redis server not available")
+    return client
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        yield MemoryLeaderboardBackend(CATEGORY_NAMES, get_player_category, ttl=60)
+        return
+    client = _redis_client()
+    backend = RedisLeaderboardBackend(client, CATEGORY_NAMES, get_player_category, ttl=60, prefix="test:rankings")
+    yield backend
+    client.delete(*client.keys("test:rankings:*"))
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "memory":
+        yield TTLCache(ttl=60)
+        return
+    cache = RedisCache(_redis_client(), "test:cache", ttl=60)
+    yield cache
+    cache.clear()
+
+@pytest.fixture
+def loaded(backend):
+    backend.load([(1, 1000), (2, 1300), (3, 1100), (4, 1100), (5, 1500), (6, 1900)])
+    return backend
+
+def test_backend_is_stale_until_loaded(backend):
+    assert backend.is_stale()
+    backend.update_many({1: 1000})
+    assert backend.size() == 0
+
+    backend.load([(1, 1000)])
+    assert not backend.is_stale()
+
+    backend.invalidate()
+    assert backend.is_stale()
+
+def test_backend_ranks_and_pages(loaded):
+    assert [loaded.rank(player_id) for player_id in (6, 5, 2, 3, 4, 1)] == [1, 2, 3, 4, 4, 6]
+    assert loaded.rank(42) is None
+    assert loaded.rating(2) == 1300.0
+    # A página começa no meio de um empate: o rank vem das notas melhores
+    assert loaded.page(2, 2) == [(3, 2, 1300.0), (4, 4, 1100.0)]
+    assert loaded.page(3, 2) == [(4, 3, 1100.0), (6, 1, 1000.0)]
+    assert [player_id for _, player_id, _ in loaded.around(1, 3)] == [4, 3, 1]
+
+def test_backend_categories(loaded):
+    assert loaded.category_counts() == {"beginner": 3, "intermediate": 2, "advanced": 1, "elite": 0}
+    assert loaded.category(5) == "intermediate"
+    assert loaded.rank(2, "intermediate") == 2
+    assert loaded.size("intermediate") == 2
+    assert loaded.page(1, 10, "beginner") == [(1, 4, 1100.0), (1, 3, 1100.0), (3, 1, 1000.0)]
+
+def test_backend_batch_update_moves_players(loaded):
+    loaded.update_many({1: 2500, 5: 1150, 42: 1200}, existing_only=True)
+
+    assert loaded.size() == 6
+    assert loaded.rank(1) == 1
+    assert loaded.category_counts() == {"beginner": 3, "intermediate": 1, "advanced": 1, "elite": 1}
+    assert loaded.rank(5, "beginner") == 1
+
+    loaded.update_many({42: 1200})
+    assert loaded.rank(42, "beginner") == 1
+
+def test_backend_remove(loaded):
+    loaded.remove(6)
+
+    assert loaded.rank(6) is None
+    assert loaded.rank(5) == 1
+    assert loaded.category_counts()["advanced"] == 0
+    assert loaded.around(6) == []
+
+def test_cache_backend_round_trip(cache):
+    assert cache.get("missing") is None
+
+    cache.set("key", {"players": [1, 2], "probability": 0.5})
+    assert cache.get("key") == {"players": [1, 2], "probability": 0.5}
+
+    cache.delete("key")
+    assert cache.get("key") is None
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.clear()
+    assert cache.get("a") is None and cache.get("b") is None
+
+def test_ttl_cache_entry_expires():
+    cache = TTLCache(ttl=60)
+    cache.set("short", 1, ttl=-1)
+    cache.set("long", 2)
+
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
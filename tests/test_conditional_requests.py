@@ -0,0 +1,112 @@
+import gzip
+
+import pytest
+
+from app.api.compression import COMPRESSORS, negotiate_encoding
+from app.schemas.match import MatchCreate
+from app.services.match_service import MatchService
+from app.utils.versions import MemoryVersionStore
+
+def test_memory_versions_start_at_creation_and_bump():
+    store = MemoryVersionStore()
+    assert store.get("player:1") == (0, store.created_at)
+
+    store.bump("players", "player:1")
+    store.bump("player:1")
+    assert store.get("player:1")[0] == 2
+    assert store.get("players")[0] == 1
+    assert store.get("player:1")[1] >= store.created_at
+
+def test_negotiate_encoding():
+    available = ["br", "gzip"]
+    assert negotiate_encoding("gzip, deflate, br", available) == "br"
+    assert negotiate_encoding("br;q=0.5, gzip", available) == "gzip"
+    assert negotiate_encoding("*", available) == "br"
+    assert negotiate_encoding("gzip;q=0, identity", available) is None
+    assert negotiate_encoding("", available) is None
+
+@pytest.fixture
+def players(make_players):
+    return make_players(2)
+
+def play(db, winner_id, loser_id):
+    return MatchService(db).create_match(MatchCreate(
+        player1_id=winner_id, player2_id=loser_id,
+        sets=[{"set_number": 1, "score_p1": 11, "score_p2": 7}]
+    ))
+
+def test_player_304_skips_the_database(client, players, count_queries):
+    url = f"/api/v1/players/{players[0]}"
+    first = client.get(url)
+    etag = first.headers["etag"]
+    assert first.status_code == 200 and first.headers["last-modified"]
+
+    with count_queries() as statements:
+        cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert statements == []
+
+    assert client.get(url, headers={"If-Modified-Since": first.headers["last-modified"]}).status_code == 304
+    assert client.get(url, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+def test_writes_bump_resource_and_collection_versions(client, db, players):
+    a, b = players
+    player_etag = client.get(f"/api/v1/players/{a}").headers["etag"]
+    list_etag = client.get("/api/v1/players/").headers["etag"]
+    other_etag = client.get(f"/api/v1/players/{b}").headers["etag"]
+
+    client.patch(f"/api/v1/players/{b}", json={"full_name": "Renamed"})
+    assert client.get(f"/api/v1/players/{a}", headers={"If-None-Match": player_etag}).status_code == 304
+    assert client.get(f"/api/v1/players/{b}", headers={"If-None-Match": other_etag}).status_code == 200
+    assert client.get("/api/v1/players/", headers={"If-None-Match": list_etag}).status_code == 200
+
+    # Rating alterado por uma partida também muda o jogador
+    play(db, a, b)
+    response = client.get(f"/api/v1/players/{a}", headers={"If-None-Match": player_etag})
+    assert response.status_code == 200 and response.json()["rating"] > 1000
+
+def test_match_versions(client, db, players):
+    a, b = players
+    match = play(db, a, b)
+    url = f"/api/v1/matches/{match.id}"
+    match_etag = client.get(url).headers["etag"]
+    list_etag = client.get("/api/v1/matches/").headers["etag"]
+    history_etag = client.get(f"/api/v1/players/{a}/matches").headers["etag"]
+
+    assert client.get(url, headers={"If-None-Match": match_etag}).status_code == 304
+    assert client.get("/api/v1/matches/", headers={"If-None-Match": list_etag}).status_code == 304
+
+    client.patch(url, json={
+        "player1_id": a, "player2_id": b,
+        "sets": [{"set_number": n, "score_p1": 5, "score_p2": 11} for n in (1, 2, 3)]
+    })
+    response = client.get(url, headers={"If-None-Match": match_etag})
+    assert response.status_code == 200 and response.json()["sets"][0]["score_p2"] == 11
+    assert client.get("/api/v1/matches/", headers={"If-None-Match": list_etag}).status_code == 200
+    assert client.get(
+        f"/api/v1/players/{a}/matches", headers={"If-None-Match": history_etag}
+    ).status_code == 200
+
+def test_list_responses_are_compressed(client, make_players):
+    make_players(30)
+
+    response = client.get("/api/v1/players/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert len(response.json()) == 30
+
+    raw = client.get("/api/v1/players/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+    assert raw.json() == response.json()
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    with client.stream("GET", "/api/v1/players/", headers={"Accept-Encoding": "gzip"}) as stream:
+        assert gzip.decompress(b"".join(stream.iter_raw())) == raw.content
+
+    if "br" in COMPRESSORS:
+        brotli = client.get("/api/v1/players/", headers={"Accept-Encoding": "br, gzip"})
+        assert brotli.headers["content-encoding"] == "br"
+        assert brotli.json() == raw.json()
@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.schemas.match import MatchCreate
+from app.services.export_service import ExportService
+from app.services.match_service import MatchService
+from app.utils.match_import import parse_sets
+
+START = datetime(2024, 8, 1)
+
+@pytest.fixture
+def matches(db, make_players):
+    a, b, c = make_players(3, is_active=[True, True, False])
+    service = MatchService(db)
+    for day, (p1, p2, tournament_id) in enumerate([(a, b, None), (b, c, 7), (a, c, 7)]):
+        service.create_match(MatchCreate(
+            player1_id=p1, player2_id=p2, tournament_id=tournament_id,
+            sets=[{"set_number": 1, "score_p1": 11, "score_p2": 9},
+                  {"set_number": 2, "score_p1": 8, "score_p2": 11}][:day % 2 + 1],
+            created_at=START + timedelta(days=day)
+        ))
+    return a, b, c
+
+def test_export_matches_ndjson_with_filters(db, matches):
+    a, b, c = matches
+    lines = "".join(ExportService(db, batch_size=2).export_matches("ndjson")).splitlines()
+    records = [json.loads(line) for line in lines]
+
+    assert [(r["player1_id"], r["player2_id"]) for r in records] == [(a, b), (b, c), (a, c)]
+    assert [len(r["sets"]) for r in records] == [1, 2, 1]
+    assert records[1]["sets"][1] == {"set_number": 2, "score_p1": 8, "score_p2": 11}
+    assert records[0]["created_at"] == START.isoformat()
+
+    filtered = "".join(ExportService(db).export_matches("ndjson", player_id=c, tournament_id=7))
+    assert len(filtered.splitlines()) == 2
+
+def test_export_skips_orm_objects(db, matches):
+    db.expunge_all()
+    chunks = list(ExportService(db, batch_size=1).export_players("csv"))
+
+    assert len(db.identity_map) == 0
+    assert len(chunks) == 3
+    rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+    assert [row["username"] for row in rows] == ["player0", "player1", "player2"]
+    assert "hashed_password" not in rows[0]
+
+def test_export_endpoints(client, matches):
+    response = client.get("/api/v1/matches/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert parse_sets(rows[1]["sets"]) == [(11, 9), (8, 11)]
+
+    response = client.get("/api/v1/players/export", params={"active_only": True})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert len(response.text.splitlines()) == 2
+    assert client.get("/api/v1/players/export", params={"format": "xml"}).status_code == 422
@@ -0,0 +1,45 @@
+import pytest
+
+from app.core.config import settings
+from app.main import app
+from app.schemas.match import MatchCreate
+from app.services.match_service import MatchService
+
+@pytest.fixture
+def players(db, make_players):
+    ids = make_players(3, avatar_url=["https://example.com", None, None])
+    MatchService(db).create_match(MatchCreate(
+        player1_id=ids[0], player2_id=ids[1],
+        sets=[{"set_number": 1, "score_p1": 11, "score_p2": 6}]
+    ))
+    return ids
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/players/?limit=2",
+    "/api/v1/players/?skip=1",
+    "/api/v1/matches/",
+    "/api/v1/matches/?skip=0&limit=5",
+    "/api/v1/players/{id}/matches",
+])
+def test_fast_path_matches_response_model(client, players, monkeypatch, path):
+    url = path.format(id=players[0])
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+    slow = client.get(url)
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = client.get(url)
+
+    assert fast.status_code == slow.status_code == 200
+    assert fast.content == slow.content
+    for header in ("etag", "link", "x-next-cursor"):
+        assert fast.headers.get(header) == slow.headers.get(header)
+
+def test_avatar_url_is_normalized_like_the_schema(client, players):
+    player = client.get("/api/v1/players/").json()[0]
+    assert player["avatar_url"] == "https://example.com/"
+    assert "hashed_password" not in player
+
+def test_openapi_keeps_list_schemas():
+    paths = app.openapi()["paths"]
+    for path, schema in (("/api/v1/players/", "Player"), ("/api/v1/matches/", "Match")):
+        content = paths[path]["get"]["responses"]["200"]["content"]["application/json"]
+        assert content["schema"]["items"]["$ref"] == f"#/components/schemas/{schema}"
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.stats import HeadToHead
+from app.schemas.match import MatchCreate, MatchUpdate
+from app.services.head_to_head_service import H2H_COUNTERS, HeadToHeadService
+from app.services.match_service import MatchService
+
+START = datetime(2024, 3, 1)
+
+@pytest.fixture
+def players(make_players):
+    return make_players(3)
+
+def play(service, player1_id, player2_id, sets_p1, sets_p2, days):
+    sets = [{"set_number": n + 1, "score_p1": 11, "score_p2": 6} for n in range(sets_p1)]
+    sets += [{"set_number": sets_p1 + n + 1, "score_p1": 6, "score_p2": 11} for n in range(sets_p2)]
+    return service.create_match(MatchCreate(
+        player1_id=player1_id, player2_id=player2_id, sets=sets,
+        created_at=START + timedelta(days=days)
+    ))
+
+def snapshot(db):
+    db.expire_all()
+    return {
+        (row.player_low_id, row.player_high_id): tuple(getattr(row, c) for c in H2H_COUNTERS) + (row.last_match_at,)
+        for row in db.query(HeadToHead).all()
+    }
+
+def test_pair_record_is_symmetric(db, players):
+    a, b, _ = players
+    service = MatchService(db)
+    play(service, a, b, 3, 1, days=2)
+    play(service, b, a, 3, 2, days=5)
+    play(service, b, a, 0, 3, days=1)
+
+    h2h = HeadToHeadService(db)
+    record = h2h.get_pair(a, b)
+    assert (record.matches_played, record.wins, record.losses) == (3, 2, 1)
+    assert (record.sets_won, record.sets_lost, record.set_differential) == (8, 4, 4)
+    assert record.last_match_at == START + timedelta(days=5)
+
+    reverse = h2h.get_pair(b, a)
+    assert (reverse.wins, reverse.losses, reverse.set_differential) == (1, 2, -4)
+
+def test_update_and_delete_keep_record_in_sync(db, players):
+    a, b, c = players
+    service = MatchService(db)
+    first = play(service, a, b, 3, 0, days=1)
+    last = play(service, a, b, 3, 0, days=4)
+
+    service.update_match(last.id, MatchUpdate(player1_id=a, player2_id=c, sets=[
+        {"set_number": n, "score_p1": 4, "score_p2": 11} for n in (1, 2, 3)
+    ]))
+    h2h = HeadToHeadService(db)
+    assert h2h.get_pair(a, b).matches_played == 1
+    assert h2h.get_pair(a, b).last_match_at == START + timedelta(days=1)
+    assert h2h.get_pair(c, a).wins == 1
+
+    service.delete_match(first.id)
+    assert h2h.get_pair(a, b).matches_played == 0
+    assert (min(a, b), max(a, b)) not in snapshot(db)
+
+def test_rebuild_matches_incremental_records(db, players):
+    a, b, c = players
+    service = MatchService(db)
+    play(service, a, b, 3, 2, days=1)
+    play(service, c, a, 1, 3, days=2)
+    play(service, b, c, 3, 0, days=3)
+    play(service, b, a, 3, 1, days=0)
+
+    incremental = snapshot(db)
+    assert HeadToHeadService(db).rebuild() == 3
+    assert snapshot(db) == incremental
+
+def test_matrix_endpoint(client, db, players):
+    a, b, c = players
+    service = MatchService(db)
+    play(service, a, b, 3, 0, days=1)
+    play(service, c, a, 3, 1, days=2)
+
+    response = client.get("/api/v1/head-to-head/", params={"player_ids": [c, a, b]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["wins"] == [[0, 1, 0], [0, 0, 1], [0, 0, 0]]
+    assert [(r["player_id"], r["opponent_id"]) for r in body["records"]] == [(c, a), (a, b)]
+
+    response = client.get(f"/api/v1/head-to-head/{b}/{a}")
+    assert response.json()["losses"] == 1
+    assert client.get(f"/api/v1/head-to-head/{a}/999999").status_code == 404
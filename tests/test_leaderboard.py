@@ -0,0 +1,116 @@
+import pytest
+
+from app import cli
+from app.models.player import Player
+from app.schemas.match import MatchCreate
+from app.services.match_service import MatchService
+from app.services.player_service import PlayerService
+from app.services.ranking_service import RankingService, leaderboard
+from app.utils.helpers import CATEGORY_NAMES, get_player_category
+from app.utils.leaderboard import CategorizedLeaderboard, Leaderboard
+
+@pytest.fixture
+def board():
+    board = Leaderboard()
+    board.load([(1, 1000), (2, 1200), (3, 1100), (4, 1100), (5, 900)])
+    return board
+
+def test_rank_uses_competition_ranking(board):
+    assert [board.rank(player_id) for player_id in (2, 3, 4, 1, 5)] == [1, 2, 2, 4, 5]
+    assert board.rank(42) is None
+
+def test_update_moves_player(board):
+    board.update(5, 1300)
+
+    assert board.rank(5) == 1
+    assert board.rank(2) == 2
+    assert len(board) == 5
+
+def test_page_and_around(board):
+    assert board.page(2, 2) == [(2, 3, 1100.0), (4, 1, 1000.0)]
+    assert [player_id for _, player_id, _ in board.around(1, 3)] == [3, 1, 5]
+    assert [player_id for _, player_id, _ in board.around(2, 3)] == [2, 4, 3]
+
+def test_remove(board):
+    board.remove(2)
+
+    assert 2 not in board
+    assert board.rank(3) == 1
+
+def test_ranking_follows_match_results(db, make_players):
+    leaderboard.invalidate()
+    players = make_players(3)
+    ranking_service = RankingService(db)
+    ranking_service.ensure_loaded()
+
+    MatchService(db).create_match(MatchCreate(
+        player1_id=players[2],
+        player2_id=players[0],
+        sets=[{"set_number": 1, "score_p1": 11, "score_p2": 7}]
+    ))
+
+    assert ranking_service.get_player_rank(players[2]).rank == 1
+    assert ranking_service.get_player_rank(players[0]).rank == 3
+
+    PlayerService(db).soft_delete(db.get(Player, players[2]))
+    assert ranking_service.get_page(1, 10).total == 2
+
+def test_rebuild_ratings_command_reloads_the_ranking(db, make_players, monkeypatch):
+    leaderboard.invalidate()
+    players = make_players(2)
+    MatchService(db).create_match(MatchCreate(
+        player1_id=players[1],
+        player2_id=players[0],
+        sets=[{"set_number": n, "score_p1": 11, "score_p2": 7} for n in (1, 2, 3)]
+    ))
+    # Rating corrompido fora da API e já carregado no ranking: só o rebuild o corrige
+    db.query(Player).filter(Player.id == players[0]).update({"rating": 5000.0})
+    db.commit()
+    leaderboard.invalidate()
+    ranking_service = RankingService(db)
+    assert ranking_service.get_player_rank(players[0]).rank == 1
+
+    monkeypatch.setattr(cli, "SessionLocal", lambda: db)
+    cli.main(["rebuild-ratings", "--workers", "1"])
+
+    assert ranking_service.get_player_rank(players[1]).rank == 1
+
+@pytest.mark.parametrize("rating,category", [
+    (50, "beginner"),
+    (1200, "beginner"),
+    (1200.5, "beginner"),
+    (1201, "intermediate"),
+    (1800.5, "intermediate"),
+    (2401, "elite"),
+    (3000, "elite"),
+])
+def test_get_player_category(rating, category):
+    assert get_player_category(rating) == category
+
+def test_categorized_board_moves_players_across_boundaries():
+    board = CategorizedLeaderboard(CATEGORY_NAMES, get_player_category)
+    board.load([(1, 1000), (2, 1300), (3, 1500), (4, 1900)])
+    assert board.category_counts() == {"beginner": 1, "intermediate": 2, "advanced": 1, "elite": 0}
+
+    board.update(1, 1250)
+    board.update(4, 2500)
+
+    assert board.category_counts() == {"beginner": 0, "intermediate": 3, "advanced": 0, "elite": 1}
+    assert board.categories["intermediate"].page(1, 2) == [(1, 3, 1500.0), (2, 2, 1300.0)]
+    assert board.categories["intermediate"].rank(1) == 3
+
+    board.remove(3)
+    assert board.category_counts()["intermediate"] == 2
+    assert board.category(3) is None
+
+def test_player_ranking_percentiles(db, make_players):
+    leaderboard.invalidate()
+    players = make_players(4, rating=[1000, 1100, 1300, 1500])
+    ranking_service = RankingService(db)
+
+    ranking = ranking_service.get_player_rank(players[2])
+
+    assert (ranking.rank, ranking.percentile) == (2, 75.0)
+    assert (ranking.category, ranking.category_rank, ranking.category_percentile) == ("intermediate", 2, 50.0)
+    summary = {c.category: c.players for c in ranking_service.get_categories()}
+    assert summary == {"beginner": 2, "intermediate": 2, "advanced": 0, "elite": 0}
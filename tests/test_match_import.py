@@ -0,0 +1,99 @@
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from app.models.match import Match
+from app.models.match_import import ImportCheckpoint
+from app.models.player import Player
+from app.services.import_service import MatchImportService
+from app.utils.match_import import chunked, parse_csv, parse_sets
+
+CSV = """player1,player2,sets,played_at
+ana,bia,11-5 11-7 11-9,2019-03-01T10:00:00
+bia,ana,11-5 5-11 11-7 11-3,2019-03-02T10:00:00
+ana,zeca,11-5 11-7 11-9,2019-03-03T10:00:00
+ana,bia,11-5 11-7,2019-03-04T10:00:00
+bia,ana,11-5 11-7 12-10,2019-03-05T10:00:00
+"""
+
+@pytest.fixture
+def players(make_players):
+    names = ["ana", "bia"]
+    return dict(zip(names, make_players(2, username=names)))
+
+def test_parse_sets_and_csv_lines():
+    assert parse_sets("11-5, 9-11") == [(11, 5), (9, 11)]
+    assert parse_sets([[11, 5], {"score_p1": 9, "score_p2": 11}]) == [(11, 5), (9, 11)]
+
+    parsed = list(parse_csv(io.StringIO("player1,player2,sets\nana,,11-5\nana,bia,11-x\n")))
+    assert [(line, error is not None) for line, _, error in parsed] == [(2, True), (3, True)]
+    assert [len(chunk) for chunk in chunked(range(5), 2)] == [2, 2, 1]
+
+def test_import_csv_reports_rejected_lines(db, players):
+    progress = []
+    result = MatchImportService(db, chunk_size=2).import_lines(
+        io.StringIO(CSV), "csv", progress=lambda r: progress.append(r.lines)
+    )
+
+    assert (result.imported, result.rejected, result.lines) == (3, 2, 6)
+    assert [(e.line, "zeca" in e.detail) for e in result.errors] == [(4, True), (5, False)]
+    assert progress == [3, 5, 6]
+    first = db.query(Match).order_by(Match.created_at).first()
+    assert (first.winner_id, first.created_at) == (players["ana"], datetime(2019, 3, 1, 10))
+    assert db.get(Player, players["bia"]).rating != 1000
+
+def test_import_resumes_after_last_committed_chunk(db, players):
+    lines = CSV.splitlines(keepends=True)
+
+    def interrupted():
+        yield from lines[:4]
+        raise KeyboardInterrupt
+
+    service = MatchImportService(db, chunk_size=2)
+    with pytest.raises(KeyboardInterrupt):
+        service.import_lines(interrupted(), "csv", source="history.csv")
+    assert db.query(Match).count() == 2
+    assert db.get(ImportCheckpoint, "history.csv").line == 3
+
+    result = MatchImportService(db, chunk_size=2).import_lines(
+        io.StringIO(CSV), "csv", source="history.csv", resume=True
+    )
+    assert (result.resumed_from, result.imported, result.rejected) == (3, 3, 2)
+    assert db.query(Match).count() == 3
+
+def test_import_endpoint(client, players):
+    ndjson = "\n".join(json.dumps(record) for record in [
+        {"player1": "ana", "player2": "bia", "sets": [[11, 5], [11, 7], [11, 9]]},
+        {"player1": "ana", "player2": "bia"},
+        "not an object",
+    ])
+    response = client.post(
+        "/api/v1/matches/import",
+        files={"file": ("history.ndjson", ndjson.encode(), "application/x-ndjson")}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["imported"], body["rejected"]) == (1, 2)
+    assert body["errors"][0]["detail"] == "Missing fields: sets"
+
+    response = client.post(
+        "/api/v1/matches/import",
+        files={"file": ("history.txt", b"", "text/plain")}
+    )
+    assert response.status_code == 400
+
+def test_import_endpoint_checkpoints_by_content(client, players):
+    def upload(records, resume=False):
+        ndjson = "\n".join(json.dumps(record) for record in records)
+        return client.post(
+            "/api/v1/matches/import", params={"resume": resume},
+            files={"file": ("history.ndjson", ndjson.encode(), "application/x-ndjson")}
+        ).json()
+
+    first = upload([{"player1": "ana", "player2": "bia", "sets": [[11, 5], [11, 7], [11, 9]]}])
+    # Mesmo nome, outro conteúdo: começa do zero em vez de pular a primeira linha
+    second = upload([{"player1": "bia", "player2": "ana", "sets": [[11, 5], [11, 7], [11, 9]]}], resume=True)
+    assert first["source"] != second["source"]
+    assert (second["resumed_from"], second["imported"]) == (0, 1)
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.models.match_participant import MatchParticipant
+from app.schemas.match import MatchCreate, MatchUpdate
+from app.services.match_service import MatchService
+from app.services.participant_service import ParticipantService
+
+START = datetime(2024, 11, 1)
+
+@pytest.fixture
+def players(make_players):
+    return make_players(3)
+
+def play(service, winner_id, loser_id, days):
+    return service.create_match(MatchCreate(
+        player1_id=winner_id, player2_id=loser_id,
+        sets=[{"set_number": 1, "score_p1": 11, "score_p2": 6}],
+        created_at=START + timedelta(days=days)
+    ))
+
+def participants(db):
+    db.expire_all()
+    return sorted(
+        (row.player_id, row.match_id, row.opponent_id, row.created_at, row.won)
+        for row in db.query(MatchParticipant).all()
+    )
+
+def test_participants_follow_match_writes(db, players):
+    a, b, c = players
+    service = MatchService(db)
+    first = play(service, a, b, days=1)
+    second = play(service, b, c, days=2)
+    service.create_matches_bulk([MatchCreate(
+        player1_id=c, player2_id=a, created_at=START + timedelta(days=3),
+        sets=[{"set_number": n, "score_p1": 11, "score_p2": 4} for n in (1, 2, 3)]
+    )])
+
+    service.update_match(first.id, MatchUpdate(
+        player1_id=a, player2_id=b, sets=[{"set_number": n, "score_p1": 3, "score_p2": 11} for n in (1, 2, 3)]
+    ))
+    service.delete_match(second.id)
+
+    incremental = participants(db)
+    assert len(incremental) == 4
+    assert (a, first.id, b, START + timedelta(days=1), False) in incremental
+
+    assert ParticipantService(db).rebuild() == 2
+    assert participants(db) == incremental
+
+def test_player_history_filters(client, db, players):
+    a, b, c = players
+    service = MatchService(db)
+    ids = [play(service, a, opponent, days=day).id for day, opponent in enumerate([b, c, b, c, b])]
+
+    response = client.get(f"/api/v1/players/{a}/matches", params={"opponent_id": b, "limit": 2})
+    assert [m["id"] for m in response.json()] == [ids[0], ids[2]]
+    following = client.get(f"/api/v1/players/{a}/matches", params={
+        "opponent_id": b, "limit": 2, "cursor": response.headers["x-next-cursor"]
+    })
+    assert [m["id"] for m in following.json()] == [ids[4]]
+
+    response = client.get(f"/api/v1/players/{c}/matches", params={
+        "start": (START + timedelta(days=2)).isoformat(), "end": (START + timedelta(days=3)).isoformat()
+    })
+    assert [m["id"] for m in response.json()] == [ids[3]]
+    assert client.get("/api/v1/players/999999/matches").status_code == 404
+
+def test_player_filter_is_an_index_range(db, players):
+    query = MatchService(db)._filtered(player_id=players[0], opponent_id=players[1])
+    compiled = query.statement.compile(compile_kwargs={"literal_binds": True})
+    plan = " ".join(str(row[-1]) for row in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+
+    assert "ix_match_participants_opponent_time" in plan
+    assert "SCAN matches" not in plan
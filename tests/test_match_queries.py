@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.schemas.match import MatchCreate
+from app.services.match_service import MatchService
+
+START = datetime(2024, 10, 1)
+
+@pytest.fixture
+def matches(db, make_players):
+    a, b = make_players(2)
+    service = MatchService(db)
+    for day in range(25):
+        service.create_match(MatchCreate(
+            player1_id=a, player2_id=b,
+            sets=[{"set_number": n, "score_p1": 11, "score_p2": 5 + n} for n in (1, 2)],
+            created_at=START + timedelta(days=day)
+        ))
+    db.expunge_all()
+    return a, b
+
+def test_match_list_uses_two_queries(client, db, matches, count_queries):
+    with count_queries() as statements:
+        response = client.get("/api/v1/matches/", params={"limit": 100})
+    assert response.status_code == 200
+    assert len(response.json()) == 25
+    assert all(len(match["sets"]) == 2 for match in response.json())
+    assert len(statements) == 2
+
+    with count_queries() as statements:
+        client.get("/api/v1/matches/", params={"limit": 10, "skip": 10, "player_id": matches[0]})
+    assert len(statements) == 2
+
+def test_orm_listing_and_detail_preload_sets(client, db, matches, count_queries):
+    service = MatchService(db)
+    with count_queries() as statements:
+        listed = service.get_matches(limit=100)
+        assert sum(len(match.sets) for match in listed) == 50
+    assert len(statements) == 2
+
+    with count_queries() as statements:
+        response = client.get(f"/api/v1/matches/{listed[0].id}")
+    assert response.json()["sets"][1] == {"set_number": 2, "score_p1": 11, "score_p2": 7}
+    assert len(statements) == 2
+
+def test_lean_rows_match_orm_listing(db, matches):
+    service = MatchService(db)
+    lean = service.get_matches_page(limit=5, player_id=matches[1], lean=True)
+    orm = service.get_matches_page(limit=5, player_id=matches[1])
+
+    assert lean.next_cursor == orm.next_cursor
+    assert [row["id"] for row in lean.items] == [match.id for match in orm.items]
+    assert lean.items[0]["sets"] == [
+        {"set_number": s.set_number, "score_p1": s.score_p1, "score_p2": s.score_p2}
+        for s in orm.items[0].sets
+    ]
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db.pagination import decode_cursor, encode_cursor
+from app.models.player import Player
+from app.schemas.match import MatchCreate
+from app.services.match_service import MatchService, count_cache
+from app.services.player_service import PlayerService
+
+START = datetime(2024, 9, 1)
+
+def test_cursor_round_trip():
+    key = (START, 42)
+    assert decode_cursor(encode_cursor(key, "prev")) == (key, "prev")
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+@pytest.fixture
+def matches(db, make_players):
+    a, b, c = make_players(3)
+    service = MatchService(db)
+    ids = []
+    # Dias repetidos: o id desempata a ordem
+    for day, (p1, p2) in zip([0, 1, 1, 1, 2, 3, 3], [(a, b), (b, c), (a, c), (a, b), (c, a), (b, a), (c, b)]):
+        ids.append(service.create_match(MatchCreate(
+            player1_id=p1, player2_id=p2,
+            sets=[{"set_number": 1, "score_p1": 11, "score_p2": 7}],
+            created_at=START + timedelta(days=day)
+        )).id)
+    count_cache.clear()
+    return (a, b, c), ids
+
+def test_keyset_pages_walk_both_ways(db, matches):
+    _, ids = matches
+    service = MatchService(db)
+
+    pages, cursor = [], None
+    while True:
+        page = service.get_matches_page(cursor=cursor, limit=3)
+        pages.append([m.id for m in page.items])
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    assert pages == [ids[0:3], ids[3:6], ids[6:]]
+    assert service.get_matches_page(limit=3).prev_cursor is None
+
+    previous = service.get_matches_page(cursor=page.prev_cursor, limit=3)
+    assert [m.id for m in previous.items] == ids[3:6]
+    assert [m.id for m in service.get_matches_page(cursor=previous.prev_cursor, limit=3).items] == ids[0:3]
+
+def test_keyset_page_with_filter_matches_offset(db, matches):
+    (a, _, _), _ = matches
+    service = MatchService(db)
+    page = service.get_matches_page(limit=2, player_id=a)
+    following = service.get_matches_page(cursor=page.next_cursor, limit=2, player_id=a)
+    offset = service.get_matches(skip=2, limit=2, player_id=a)
+    assert [m.id for m in following.items] == [m.id for m in offset]
+
+def test_match_list_headers_and_cached_total(client, db, matches):
+    (a, b, _), ids = matches
+    response = client.get("/api/v1/matches/", params={"limit": 4, "include_total": True})
+    assert [m["id"] for m in response.json()] == ids[:4]
+    assert response.headers["x-total-count"] == "7"
+    assert 'rel="next"' in response.headers["link"]
+
+    response = client.get("/api/v1/matches/", params={"cursor": response.headers["x-next-cursor"]})
+    assert [m["id"] for m in response.json()] == ids[4:]
+    assert "x-next-cursor" not in response.headers
+
+    MatchService(db).create_match(MatchCreate(
+        player1_id=a, player2_id=b, sets=[{"set_number": 1, "score_p1": 11, "score_p2": 3}]
+    ))
+    response = client.get("/api/v1/matches/", params={"include_total": True, "player_id": a})
+    assert response.headers["x-total-count"] == "6"
+    assert client.get("/api/v1/matches/", params={"cursor": "bogus"}).status_code == 400
+
+def test_player_list_cursor(client, db, matches):
+    (_, b, _), _ = matches
+    PlayerService(db).soft_delete(db.get(Player, b))
+    response = client.get("/api/v1/players/", params={"limit": 1, "include_total": True})
+    assert response.headers["x-total-count"] == "2"
+    following = client.get("/api/v1/players/", params={"limit": 1, "cursor": response.headers["x-next-cursor"]})
+    assert [p["username"] for p in response.json() + following.json()] == ["player0", "player2"]
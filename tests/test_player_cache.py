@@ -0,0 +1,66 @@
+import pytest
+
+from app.schemas.match import MatchCreate
+from app.schemas.player import PlayerUpdate
+from app.services.match_service import MatchService
+from app.services.player_service import PlayerService
+from app.utils.cache import TieredCache, TTLCache
+
+def test_tiered_cache_fills_local_tier_and_counts():
+    shared = TTLCache(ttl=60)
+    cache = TieredCache(TTLCache(ttl=5), shared)
+
+    assert cache.get("a") is None
+    shared.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("a") == 1
+    cache.delete("a")
+    assert shared.get("a") is None and cache.get("a") is None
+
+    stats = cache.stats()
+    assert (stats["local_hits"], stats["shared_hits"], stats["misses"]) == (1, 1, 2)
+    assert stats["hit_ratio"] == 0.5
+
+@pytest.fixture
+def players(make_players):
+    return make_players(2)
+
+def test_lookups_hit_the_cache(db, players, count_queries):
+    service = PlayerService(db)
+    db.expunge_all()
+    assert service.get_by_username("player0").id == players[0]
+    db.expunge_all()
+
+    with count_queries() as statements:
+        assert service.get_by_id(players[0]).email == "player0@example.com"
+        assert service.get_by_username("player0").id == players[0]
+    assert statements == []
+
+    # Instância vinda do cache é persistente: a atualização vira um UPDATE
+    db.expunge_all()
+    player = service.get_by_id(players[0])
+    service.update(player, PlayerUpdate(email="renamed@example.com"))
+    db.expunge_all()
+    assert service.get_by_id(players[0]).email == "renamed@example.com"
+    assert service.get_by_email("player0@example.com") is None
+
+def test_writes_invalidate_profiles(client, db, players):
+    a, b = players
+    assert client.get(f"/api/v1/players/{a}").json()["rating"] == 1000
+
+    MatchService(db).create_match(MatchCreate(
+        player1_id=a, player2_id=b,
+        sets=[{"set_number": n, "score_p1": 11, "score_p2": 3} for n in range(1, 4)]
+    ))
+    assert client.get(f"/api/v1/players/{a}").json()["rating"] > 1000
+
+    assert client.patch(f"/api/v1/players/{a}", json={"bio": "Lefty"}).status_code == 200
+    assert client.get(f"/api/v1/players/{a}").json()["bio"] == "Lefty"
+
+    client.delete(f"/api/v1/players/{a}")
+    assert client.get(f"/api/v1/players/{a}").json()["is_active"] is False
+    client.post(f"/api/v1/players/{a}/reactivate")
+    assert client.get(f"/api/v1/players/{a}").json()["is_active"] is True
+
+    stats = client.get("/health/cache").json()["player_profile"]
+    assert stats["local_hits"] > 0 and stats["misses"] > 0
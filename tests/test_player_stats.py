@@ -0,0 +1,64 @@
+import pytest
+
+from app.models.stats import PlayerStats
+from app.schemas.match import MatchCreate, MatchUpdate
+from app.services.match_service import MatchService
+from app.services.stats_service import STAT_COLUMNS, StatsService
+
+@pytest.fixture
+def players(make_players):
+    return make_players(3)
+
+def snapshot(db):
+    db.expire_all()
+    return {
+        row.player_id: tuple(getattr(row, column) for column in STAT_COLUMNS)
+        for row in db.query(PlayerStats).all()
+    }
+
+def test_stats_follow_match_writes(db, players):
+    a, b, c = players
+    service = MatchService(db)
+    first = service.create_match(MatchCreate(player1_id=a, player2_id=b, sets=[
+        {"set_number": 1, "score_p1": 11, "score_p2": 7},
+        {"set_number": 2, "score_p1": 9, "score_p2": 11},
+        {"set_number": 3, "score_p1": 11, "score_p2": 4},
+    ]))
+    service.create_match(MatchCreate(player1_id=c, player2_id=a, sets=[
+        {"set_number": 1, "score_p1": 11, "score_p2": 3},
+    ]))
+
+    stats = StatsService(db).get_player_stats(a)
+    assert (stats.matches_played, stats.wins, stats.losses) == (2, 1, 1)
+    assert (stats.sets_won, stats.sets_lost, stats.points_won, stats.points_lost) == (2, 2, 34, 33)
+    assert stats.win_percentage == 50.0
+
+    service.update_match(first.id, MatchUpdate(player1_id=a, player2_id=b, sets=[
+        {"set_number": n, "score_p1": 2, "score_p2": 11} for n in (1, 2, 3)
+    ]))
+    assert snapshot(db)[b] == (1, 1, 0, 3, 0, 33, 6)
+
+    service.delete_match(first.id)
+    assert snapshot(db)[b] == (0, 0, 0, 0, 0, 0, 0)
+    assert snapshot(db)[a] == (1, 0, 1, 0, 1, 3, 11)
+
+def test_rebuild_matches_incremental_stats(db, players):
+    a, b, c = players
+    service = MatchService(db)
+    for p1, p2, score in [(a, b, 11), (b, c, 6), (c, a, 11), (a, c, 8)]:
+        service.create_match(MatchCreate(player1_id=p1, player2_id=p2, sets=[
+            {"set_number": 1, "score_p1": score, "score_p2": 9},
+            {"set_number": 2, "score_p1": 11, "score_p2": 13},
+            {"set_number": 3, "score_p1": 11, "score_p2": 5},
+        ]))
+
+    incremental = snapshot(db)
+    assert StatsService(db).rebuild() == 3
+    assert snapshot(db) == incremental
+
+def test_stats_endpoint(client, db, players):
+    response = client.get(f"/api/v1/players/{players[0]}/stats")
+    assert response.status_code == 200
+    assert response.json()["matches_played"] == 0
+
+    assert client.get("/api/v1/players/999999/stats").status_code == 404
@@ -36,6 +36,9 @@ def test_create_player_duplicate_email():
     assert "Email already registered" in response.json()["detail"]
 
 def test_create_player_duplicate_username():
+    # Primeiro criar um jogador
+    client.post("/api/v1/players/", json=test_player_data)
+
     # Tentar criar jogador com username duplicado
     duplicate_player = dict(test_player_data)
     duplicate_player["email"] = "another@example.com"
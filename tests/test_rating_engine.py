@@ -0,0 +1,95 @@
+import numpy as np
+
+from app.utils.constants import INITIAL_RATING, MAX_RATING, MIN_RATING
+from app.utils.helpers import calculate_elo_rating
+from app.utils.rating_engine import (
+    connected_components,
+    group_components,
+    ratings_after,
+    replay_elo,
+    replay_elo_parallel,
+    schedule_batches
+)
+
+
+def scalar_replay(player1_ids, player2_ids, player1_won):
+    ratings = {}
+    for p1, p2, won in zip(player1_ids, player2_ids, player1_won):
+        r1 = ratings.get(p1, INITIAL_RATING)
+        r2 = ratings.get(p2, INITIAL_RATING)
+        ratings[p1] = calculate_elo_rating(r1, r2, won)
+        ratings[p2] = calculate_elo_rating(r2, r1, not won)
+    return ratings
+
+def random_history(n_matches, n_players, seed=0):
+    rng = np.random.default_rng(seed)
+    player1_ids = rng.integers(1, n_players + 1, n_matches)
+    offsets = rng.integers(1, n_players, n_matches)
+    player2_ids = (player1_ids - 1 + offsets) % n_players + 1
+    return player1_ids, player2_ids, rng.random(n_matches) < 0.5
+
+def test_schedule_batches_is_conflict_free():
+    player1_ids, player2_ids, _ = random_history(2000, 40)
+    batches = schedule_batches(player1_ids, player2_ids)
+
+    for batch in np.unique(batches):
+        members = np.flatnonzero(batches == batch)
+        players = np.concatenate((player1_ids[members], player2_ids[members]))
+        assert len(players) == len(np.unique(players))
+
+def test_replay_matches_scalar_elo():
+    player1_ids, player2_ids, player1_won = random_history(5000, 60)
+    expected = scalar_replay(player1_ids.tolist(), player2_ids.tolist(), player1_won.tolist())
+
+    result = replay_elo(player1_ids, player2_ids, player1_won)
+
+    for player_id, rating in expected.items():
+        assert result.ratings[player_id] == rating
+
+def test_replay_clamps_ratings():
+    ratings = np.array([0.0, MAX_RATING, MIN_RATING])
+    result = replay_elo(np.array([1]), np.array([2]), np.array([True]), ratings=ratings)
+
+    assert result.player1_after[0] == MAX_RATING
+    assert result.player2_after[0] == MIN_RATING
+
+def test_replay_records_before_and_after():
+    result = replay_elo(np.array([1, 1]), np.array([2, 3]), np.array([True, False]))
+
+    assert result.player1_before[0] == INITIAL_RATING
+    assert result.player1_before[1] == result.player1_after[0]
+    assert result.ratings[1] == result.player1_after[1]
+
+def test_connected_components_label_by_smallest_player():
+    components = connected_components(np.array([5, 2, 7, 3]), np.array([2, 9, 8, 9]))
+    assert components.tolist() == [2, 2, 7, 2]
+
+def test_group_components_keeps_components_together():
+    components = np.array([1, 4, 1, 6, 4, 1, 8])
+    groups = group_components(components, 2)
+
+    for label in np.unique(components):
+        assert len(np.unique(groups[components == label])) == 1
+    assert sorted(np.bincount(groups).tolist()) == [3, 4]
+
+def test_parallel_replay_matches_sequential():
+    # Três divisões que nunca se enfrentam
+    histories = [random_history(1500, 20, seed) for seed in range(3)]
+    player1_ids = np.concatenate([h[0] + 100 * i for i, h in enumerate(histories)])
+    player2_ids = np.concatenate([h[1] + 100 * i for i, h in enumerate(histories)])
+    player1_won = np.concatenate([h[2] for h in histories])
+    order = np.random.default_rng(7).permutation(len(player1_ids))
+
+    args = (player1_ids[order], player2_ids[order], player1_won[order])
+    sequential = replay_elo(*args)
+    parallel = replay_elo_parallel(*args, workers=3)
+
+    assert np.array_equal(sequential.ratings, parallel.ratings)
+    assert np.array_equal(sequential.player2_after, parallel.player2_after)
+
+def test_ratings_after_keeps_last_result_per_player():
+    ratings = ratings_after(
+        np.array([0.0, 1000.0]), np.array([1, 2]), np.array([2, 3]),
+        np.array([1010.0, 990.0]), np.array([990.0, 1005.0])
+    )
+    assert ratings.tolist() == [0.0, 1010.0, 990.0, 1005.0]
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.models.player import Player
+from app.schemas.match import MatchCreate
+from app.services.match_service import MatchService
+from app.services.rating_service import RatingService, history_cache
+from app.utils.downsampling import lttb
+
+START = datetime(2024, 6, 1)
+
+def test_lttb_keeps_endpoints_and_extremes():
+    x = np.arange(1000, dtype=np.float64)
+    y = np.sin(x / 50)
+    y[437] = 10.0
+
+    kept = lttb(x, y, 50)
+
+    assert len(kept) == 50
+    assert kept[0] == 0 and kept[-1] == 999
+    assert np.all(np.diff(kept) > 0)
+    assert 437 in kept.tolist()
+
+def test_lttb_returns_everything_below_threshold():
+    assert lttb(np.arange(5), np.arange(5), 10).tolist() == [0, 1, 2, 3, 4]
+
+@pytest.fixture
+def history(db, make_players):
+    a, b = make_players(2)
+    service = MatchService(db)
+    for day in range(12):
+        winner, loser = (a, b) if day % 3 else (b, a)
+        service.create_match(MatchCreate(
+            player1_id=winner, player2_id=loser,
+            sets=[{"set_number": 1, "score_p1": 11, "score_p2": 9}],
+            created_at=START + timedelta(days=day)
+        ))
+    history_cache.clear()
+    return a, b
+
+def test_history_follows_ledger_and_filters(db, history):
+    a, _ = history
+    full = RatingService(db).get_history(a, points=100)
+
+    assert (full.total_points, full.downsampled) == (12, False)
+    assert full.points[-1].rating == db.get(Player, a).rating
+    assert full.points[0].change == full.points[0].rating - 1000
+
+    ranged = RatingService(db).get_history(
+        a, start=START + timedelta(days=3), end=START + timedelta(days=5), points=100
+    )
+    assert [p.played_at.day for p in ranged.points] == [4, 5, 6]
+
+    reduced = RatingService(db).get_history(a, points=5)
+    assert (reduced.total_points, reduced.downsampled, len(reduced.points)) == (12, True, 5)
+
+def test_history_cache_is_invalidated_by_ledger_changes(db, history):
+    a, b = history
+    service = RatingService(db)
+    before = service.get_history(a, end=START + timedelta(days=30))
+
+    MatchService(db).create_match(MatchCreate(
+        player1_id=b, player2_id=a,
+        sets=[{"set_number": 1, "score_p1": 11, "score_p2": 2}],
+        created_at=START - timedelta(days=1)
+    ))
+
+    after = service.get_history(a, end=START + timedelta(days=30))
+    assert after.total_points == before.total_points + 1
+    assert after.points[-1].rating != before.points[-1].rating
+
+def test_rating_history_endpoint(client, db, history):
+    a, _ = history
+    response = client.get(f"/api/v1/players/{a}/rating-history", params={
+        "end": (START + timedelta(days=30)).isoformat(), "points": 3
+    })
+    assert response.status_code == 200
+    assert len(response.json()["points"]) == 3
+    assert response.headers["cache-control"].startswith("public")
+
+    assert client.get(f"/api/v1/players/{a}/rating-history", params={
+        "start": START.isoformat(), "end": (START - timedelta(days=1)).isoformat()
+    }).status_code == 400
+    assert client.get("/api/v1/players/999999/rating-history").status_code == 404
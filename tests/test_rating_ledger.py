@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.match import Match
+from app.models.player import Player
+from app.models.rating import RatingCheckpoint, RatingLedger
+from app.schemas.match import MatchCreate, MatchUpdate
+from app.services.match_service import MatchService
+from app.services.rating_service import RatingService
+
+START = datetime(2024, 1, 1)
+
+@pytest.fixture
+def players(make_players):
+    return make_players(4)
+
+@pytest.fixture
+def match_service(db):
+    service = MatchService(db)
+    service.rating_service = RatingService(db, checkpoint_interval=3)
+    return service
+
+def match_data(player1_id, player2_id, player1_wins, minutes):
+    sets = [{"set_number": n, "score_p1": 11 if player1_wins else 5,
+             "score_p2": 5 if player1_wins else 11} for n in (1, 2, 3)]
+    return MatchCreate(player1_id=player1_id, player2_id=player2_id, sets=sets,
+                       created_at=START + timedelta(minutes=minutes))
+
+def assert_consistent(db):
+    replayed = RatingService(db).get_ratings()
+    for player in db.query(Player).all():
+        db.refresh(player)
+        assert player.rating == pytest.approx(replayed.get(player.id, 1000.0), abs=1e-9)
+    assert db.query(RatingLedger).count() == 2 * db.query(Match).count()
+
+def test_appended_matches_fill_ledger_and_checkpoints(db, players, match_service):
+    for minute in range(7):
+        match_service.create_match(match_data(players[minute % 2], players[2 + minute % 2], minute % 3 == 0, minute))
+
+    assert_consistent(db)
+    assert db.query(RatingCheckpoint).count() == 2
+
+def test_backdated_insert_edit_and_delete_replay_suffix(db, players, match_service):
+    created = [
+        match_service.create_match(match_data(players[i % 4], players[(i + 1) % 4], i % 2 == 0, 10 * i))
+        for i in range(9)
+    ]
+
+    match_service.create_match(match_data(players[0], players[2], True, 75))
+    assert_consistent(db)
+
+    edited = created[7]
+    update = MatchUpdate(player1_id=edited.player1_id, player2_id=edited.player2_id,
+                         sets=[{"set_number": n, "score_p1": 2, "score_p2": 11} for n in (1, 2, 3)])
+    match_service.update_match(edited.id, update)
+    assert_consistent(db)
+
+    match_service.delete_match(created[1].id)
+    assert_consistent(db)
+
+def test_recompute_replays_only_after_checkpoint(db, players, match_service):
+    created = [
+        match_service.create_match(match_data(players[0], players[1], i % 2 == 0, i))
+        for i in range(8)
+    ]
+
+    last = created[-1]
+    replayed = match_service.rating_service.recompute_from((last.created_at, last.id))
+    assert replayed == 2
+
+def test_parallel_rebuild_matches_incremental_ledger(db, players, match_service):
+    for minute in range(7):
+        match_service.create_match(match_data(players[minute % 2], players[2 + minute % 2], minute % 3 == 0, minute))
+    incremental = {player.id: player.rating for player in db.query(Player).all()}
+
+    RatingService(db, checkpoint_interval=3).rebuild(workers=2)
+
+    for player in db.query(Player).all():
+        assert player.rating == incremental[player.id]
+    assert db.query(RatingCheckpoint).count() == 2
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.models.league import League
+from app.models.match import Match
+from app.schemas.match import MatchCreate
+from app.services.league_service import LeagueService
+from app.services.match_service import MatchService
+from app.utils.constants import INITIAL_RATING
+from app.utils.rating_systems import (
+    EloSystem,
+    GaussianSystem,
+    Glicko2System,
+    get_rating_system
+)
+
+def test_glicko2_matches_reference_example():
+    # Exemplo do artigo de Glickman, deslocado de 1500 para INITIAL_RATING
+    offset = 1500 - INITIAL_RATING
+    system = Glicko2System(tau=0.5)
+    state = system.initial_state(5)
+    state[1] = [1500 - offset, 200, 0.06]
+    state[2] = [1400 - offset, 30, 0.06]
+    state[3] = [1550 - offset, 100, 0.06]
+    state[4] = [1700 - offset, 300, 0.06]
+
+    new_state = system.rate_period(
+        state, np.array([1, 1, 1]), np.array([2, 3, 4]), np.array([True, False, False])
+    )
+
+    assert new_state[1, 0] + offset == pytest.approx(1464.06, abs=0.01)
+    assert new_state[1, 1] == pytest.approx(151.52, abs=0.01)
+    assert new_state[1, 2] == pytest.approx(0.05999, abs=1e-5)
+
+def test_elo_period_is_zero_sum():
+    system = EloSystem()
+    state = system.replay(
+        np.array([1, 2, 3]), np.array([2, 3, 1]), np.array([True, True, False]), np.array([0, 0, 1])
+    )
+    assert state[1:, 0].sum() == pytest.approx(3 * INITIAL_RATING)
+
+def test_gaussian_winner_gains_and_uncertainty_shrinks():
+    system = GaussianSystem()
+    state = system.rate_period(system.initial_state(3), np.array([1]), np.array([2]), np.array([False]))
+
+    assert state[2, 0] > INITIAL_RATING > state[1, 0]
+    assert state[1, 1] < system.initial_state(1)[0, 1]
+    assert state[1, 0] + state[2, 0] == pytest.approx(2 * INITIAL_RATING)
+
+def test_unknown_rating_system():
+    with pytest.raises(ValueError):
+        get_rating_system("chess960")
+
+@pytest.mark.parametrize("rating_system", ["elo", "glicko2", "gaussian"])
+def test_league_ratings_use_league_system(db, make_players, rating_system):
+    players = make_players(3)
+    league = League(name=f"League {rating_system}", rating_system=rating_system)
+    db.add(league)
+    db.flush()
+    start = datetime(2024, 1, 1)
+    db.add_all([
+        Match(player1_id=players[0], player2_id=players[i % 2 + 1], winner_id=players[0],
+              league_id=league.id, created_at=start + timedelta(days=3 * i))
+        for i in range(6)
+    ])
+    db.add(Match(player1_id=players[1], player2_id=players[2], winner_id=players[1]))
+    db.commit()
+
+    ratings = LeagueService(db).get_ratings(league)
+
+    assert [rating.player_id for rating in ratings][0] == players[0]
+    assert len(ratings) == 3
+    if rating_system == "glicko2":
+        assert ratings[0].volatility is not None
+
+def test_league_ratings_are_cached_until_a_league_match_changes(db, make_players, count_queries):
+    a, b, c = make_players(3)
+    league = League(name="Cached", rating_system="elo")
+    db.add(league)
+    db.commit()
+    service = MatchService(db)
+    sweep = [{"set_number": n, "score_p1": 11, "score_p2": 5} for n in (1, 2, 3)]
+    service.create_match(MatchCreate(player1_id=a, player2_id=b, league_id=league.id, sets=sweep))
+
+    league_service = LeagueService(db)
+    first = league_service.get_ratings(league)
+    with count_queries() as statements:
+        assert league_service.get_ratings(league) == first
+    assert not statements
+
+    service.create_match(MatchCreate(player1_id=c, player2_id=a, league_id=league.id, sets=sweep))
+    assert len(league_service.get_ratings(league)) == 3
@@ -0,0 +1,141 @@
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from app.schemas.match import MatchCreate
+from app.services.match_service import MatchService
+from app.utils.matching import max_weight_matching
+from app.utils.scheduling import pack_tables, round_robin_rounds, swiss_pairings
+
+WIN = [{"set_number": n, "score_p1": 11, "score_p2": 5} for n in range(1, 4)]
+
+def test_round_robin_meets_every_pair_once():
+    players = list(range(201))
+    rounds = round_robin_rounds(players)
+
+    assert len(rounds) == 201
+    pairs = Counter(frozenset(pair) for pairs in rounds for pair in pairs if None not in pair)
+    assert len(pairs) == 201 * 200 // 2 and set(pairs.values()) == {1}
+    for pairs in rounds:
+        seen = [p for pair in pairs for p in pair if p is not None]
+        assert len(seen) == len(set(seen)) == 201
+
+def test_pack_tables_never_double_books():
+    rounds = round_robin_rounds(list(range(30)))
+    placed = pack_tables(rounds, tables=6)
+
+    assert len(placed) == 30 * 29 // 2
+    by_slot = {}
+    for round_number, slot, table, a, b in placed:
+        assert 1 <= table <= 6
+        by_slot.setdefault(slot, []).extend([a, b])
+    assert all(len(players) == len(set(players)) for players in by_slot.values())
+    # Sem folga: cada horário usa as 6 mesas, exceto o último
+    assert max(by_slot) == -(-len(placed) // 6)
+
+    # A partida seguinte de um jogador vem sempre num horário posterior
+    last = {}
+    for _, slot, _, a, b in placed:
+        assert slot > last.get(a, 0) and slot > last.get(b, 0)
+        last[a] = last[b] = slot
+
+def test_swiss_avoids_rematches_over_an_open():
+    rng = random.Random(7)
+    players = list(range(201))
+    ratings = {p: rng.gauss(1500, 200) for p in players}
+    scores, played, byes = Counter(), set(), set()
+
+    for _ in range(9):
+        pairs, bye, rematches = swiss_pairings(players, ratings, scores, played, byes)
+        assert rematches == 0 and bye not in byes
+        byes.add(bye)
+        for a, b in pairs:
+            assert frozenset((a, b)) not in played
+            played.add(frozenset((a, b)))
+            scores[a if rng.random() < 0.5 else b] += 1
+
+def test_swiss_pairs_close_ratings_and_falls_back_to_rematches():
+    ratings = {1: 2000, 2: 1990, 3: 1200, 4: 1210}
+    assert swiss_pairings([1, 2, 3, 4], ratings)[0] == [(1, 2), (4, 3)]
+
+    everyone = {frozenset(pair) for pair in [(1, 2), (1, 3), (1, 4), (2, 3), (2, 4), (3, 4)]}
+    pairs, bye, rematches = swiss_pairings([1, 2, 3, 4], ratings, played=everyone)
+    assert (len(pairs), bye, rematches) == (2, None, 2)
+
+def best_matching(n, weights, maxcardinality):
+    """(cardinalidade, peso) do melhor emparelhamento, por força bruta"""
+    def search(free):
+        if not free:
+            return 0, 0
+        v, rest = free[0], free[1:]
+        best = search(rest)
+        for u in rest:
+            if (v, u) in weights:
+                cardinality, weight = search([p for p in rest if p != u])
+                best = max(best, (cardinality + 1, weight + weights[v, u]),
+                           key=lambda r: r if maxcardinality else r[1])
+        return best
+    return search(list(range(n)))
+
+def test_blossom_matching_agrees_with_brute_force():
+    rng = random.Random(11)
+    for _ in range(500):
+        n = rng.randint(2, 8)
+        weights = {(i, j): rng.randint(-5, 30) for i, j in combinations(range(n), 2) if rng.random() < 0.6}
+        for maxcardinality in (False, True):
+            mate = max_weight_matching([(i, j, w) for (i, j), w in weights.items()], maxcardinality)
+            chosen = [(i, j) for i, j in enumerate(mate) if i < j]
+            assert all(mate[j] == i and (i, j) in weights for i, j in chosen)
+            expected = best_matching(n, weights, maxcardinality)
+            assert sum(weights[pair] for pair in chosen) == expected[1]
+            if maxcardinality:
+                assert len(chosen) == expected[0]
+
+def test_swiss_fallback_still_avoids_rematches():
+    rng = random.Random(3)
+    players = list(range(40))
+    ratings = {p: rng.gauss(1500, 200) for p in players}
+    scores, played = Counter(), set()
+
+    # Rodadas finais de um evento longo, onde a busca gulosa esgota o orçamento
+    for _ in range(30):
+        pairs, bye, rematches = swiss_pairings(players, ratings, scores, played, max_steps=200)
+        assert rematches == 0 and len(pairs) == 20
+        for a, b in pairs:
+            played.add(frozenset((a, b)))
+            expected = 1 / (1 + 10 ** ((ratings[b] - ratings[a]) / 400))
+            scores[a if rng.random() < expected else b] += 1
+
+@pytest.fixture
+def players(make_players):
+    return make_players(5, rating=[1000 + 100 * i for i in range(5)])
+
+def test_schedule_endpoints(client, db, players):
+    response = client.post("/api/v1/tournaments/schedule/round-robin", json={
+        "player_ids": players, "tables": 2
+    })
+    assert response.status_code == 200
+    schedule = response.json()
+    assert (schedule["rounds"], len(schedule["matches"]), len(schedule["byes"])) == (5, 10, 5)
+    assert schedule["slots"] == 5
+
+    # Rodada 1 já jogada no evento 42: 4 x 3 e 2 x 1, bye para 0
+    for winner, loser in [(4, 3), (2, 1)]:
+        MatchService(db).create_match(MatchCreate(
+            player1_id=players[winner], player2_id=players[loser], sets=WIN, tournament_id=42
+        ))
+    response = client.post("/api/v1/tournaments/schedule/swiss", json={
+        "player_ids": players, "tables": 4, "tournament_id": 42
+    })
+    assert response.status_code == 200
+    swiss = response.json()
+    assert (swiss["round_number"], swiss["rematches"], swiss["slots"]) == (2, 0, 1)
+    assert swiss["byes"][0]["player_id"] != players[0]
+    pairs = {frozenset((m["player1_id"], m["player2_id"])) for m in swiss["matches"]}
+    assert frozenset((players[4], players[2])) in pairs
+
+    assert client.post("/api/v1/tournaments/schedule/swiss", json={
+        "player_ids": players + [999999], "tables": 1
+    }).status_code == 404
@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.achievement import AchievementProgress
+from app.schemas.match import MatchCreate, MatchUpdate
+from app.services.match_service import MatchService
+from app.services.tournament_service import bracket_cache
+from app.utils.helpers import generate_tournament_brackets, seed_order
+
+START = datetime(2024, 11, 1)
+WIN = [{"set_number": n, "score_p1": 11, "score_p2": 5} for n in range(1, 4)]
+
+def test_seed_order_pairs_best_with_worst():
+    assert seed_order(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+    order = seed_order(64)
+    assert all(a + b == 65 for a, b in zip(order[0::2], order[1::2]))
+    # 1 e 2 só se encontram na final
+    assert order.index(2) >= 32
+
+def test_byes_go_to_top_seeds():
+    players = list(range(1, 6))
+    brackets = generate_tournament_brackets(players, seeded_players=[5, 4])
+
+    pairs = [(m["player1"], m["player2"]) for m in brackets]
+    assert pairs == [(5, None), (2, 3), (4, None), (1, None)]
+    assert [m["match_id"] for m in brackets] == [1, 2, 3, 4]
+
+    full = generate_tournament_brackets(list(range(64)))
+    assert sorted(p for m in full for p in (m["player1"], m["player2"])) == list(range(64))
+
+@pytest.fixture
+def players(make_players):
+    bracket_cache.clear()
+    return make_players(5)
+
+def play(db, tournament_id, winner_id, loser_id, days):
+    return MatchService(db).create_match(MatchCreate(
+        player1_id=winner_id, player2_id=loser_id, sets=WIN,
+        tournament_id=tournament_id, created_at=START + timedelta(days=days)
+    ))
+
+def test_results_advance_the_bracket(client, db, players, count_queries):
+    p = players
+    response = client.post("/api/v1/tournaments/", json={
+        "name": "Winter Open", "player_ids": p, "seeded_player_ids": [p[4]]
+    })
+    assert response.status_code == 201
+    bracket = response.json()
+    tournament_id = bracket["id"]
+    assert (bracket["bracket_size"], bracket["status"]) == (8, "In Progress")
+    assert [r["name"] for r in bracket["rounds"]] == ["Quarterfinals", "Semifinals", "Final"]
+    # Seeds 1-3 (p4, p0, p1) com bye já estão nas semifinais
+    assert [(s["player1_id"], s["player2_id"]) for s in bracket["rounds"][1]["slots"]] == [
+        (p[4], None), (p[0], p[1])
+    ]
+
+    with count_queries() as statements:
+        assert client.get(f"/api/v1/tournaments/{tournament_id}/bracket").json() == bracket
+    assert statements == []
+
+    quarter = play(db, tournament_id, p[3], p[2], days=1)
+    bracket = client.get(f"/api/v1/tournaments/{tournament_id}/bracket").json()
+    assert bracket["rounds"][0]["slots"][1] == {
+        "position": 1, "player1_id": p[2], "player2_id": p[3], "winner_id": p[3], "match_id": quarter.id
+    }
+    assert bracket["rounds"][0]["completed_at"] is not None
+    assert bracket["rounds"][1]["slots"][0]["player2_id"] == p[3]
+
+    # Partida fora da chave é rejeitada
+    with pytest.raises(Exception) as error:
+        play(db, tournament_id, p[4], p[0], days=2)
+    assert "no open match" in str(error.value.detail)
+
+    play(db, tournament_id, p[3], p[4], days=2)
+    play(db, tournament_id, p[1], p[0], days=3)
+    final = play(db, tournament_id, p[3], p[1], days=4)
+
+    bracket = client.get(f"/api/v1/tournaments/{tournament_id}/bracket").json()
+    assert (bracket["status"], bracket["winner_id"]) == ("Completed", p[3])
+    assert bracket["rounds"][2]["slots"][0]["match_id"] == final.id
+    db.expire_all()
+    assert db.get(AchievementProgress, p[3]).tournaments_won == 1
+
+def test_final_can_be_changed_and_deleted(client, db, players):
+    p = players[:4]
+    tournament_id = client.post("/api/v1/tournaments/", json={
+        "name": "Summer Cup", "player_ids": p
+    }).json()["id"]
+    play(db, tournament_id, p[0], p[3], days=1)
+    play(db, tournament_id, p[1], p[2], days=1)
+    final = play(db, tournament_id, p[0], p[1], days=2)
+
+    # Novo vencedor da final: o título troca de dono
+    response = client.patch(f"/api/v1/matches/{final.id}", json={
+        "player1_id": p[1], "player2_id": p[0], "sets": WIN
+    })
+    assert response.status_code == 200
+    bracket = client.get(f"/api/v1/tournaments/{tournament_id}/bracket").json()
+    assert (bracket["status"], bracket["winner_id"]) == ("Completed", p[1])
+    achievements = client.get(f"/api/v1/players/{p[0]}/achievements").json()
+    assert achievements["tournaments_won"] == 0 and achievements["achievements"] == []
+    achievements = client.get(f"/api/v1/players/{p[1]}/achievements").json()
+    assert achievements["tournaments_won"] == 1
+    assert ("tournaments_won", "bronze") in {(a["achievement"], a["level"]) for a in achievements["achievements"]}
+
+    assert client.delete(f"/api/v1/matches/{final.id}").status_code == 200
+    bracket = client.get(f"/api/v1/tournaments/{tournament_id}/bracket").json()
+    assert (bracket["status"], bracket["winner_id"]) == ("In Progress", None)
+    assert bracket["rounds"][1]["slots"][0]["winner_id"] is None
+    assert bracket["rounds"][1]["completed_at"] is None
+    achievements = client.get(f"/api/v1/players/{p[1]}/achievements").json()
+    assert achievements["tournaments_won"] == 0
+    assert all(a["achievement"] != "tournaments_won" for a in achievements["achievements"])
+
+def test_changing_a_result_moves_the_winner(client, db, players):
+    p = players[:4]
+    tournament_id = client.post("/api/v1/tournaments/", json={
+        "name": "Spring Cup", "player_ids": p
+    }).json()["id"]
+
+    first = play(db, tournament_id, p[0], p[3], days=1)
+    service = MatchService(db)
+    service.update_match(first.id, MatchUpdate(player1_id=p[3], player2_id=p[0], sets=WIN))
+    final_slot = client.get(f"/api/v1/tournaments/{tournament_id}/bracket").json()["rounds"][1]["slots"][0]
+    assert final_slot["player1_id"] == p[3]
+
+    service.delete_match(first.id)
+    bracket = client.get(f"/api/v1/tournaments/{tournament_id}/bracket").json()
+    assert bracket["rounds"][0]["slots"][0]["winner_id"] is None
+    assert bracket["rounds"][1]["slots"][0]["player1_id"] is None
+
+def test_bulk_reports_matches_without_open_slot(client, db, players):
+    p = players[:4]
+    tournament_id = client.post("/api/v1/tournaments/", json={
+        "name": "Autumn Cup", "player_ids": p
+    }).json()["id"]
+
+    def item(winner_id, loser_id, days):
+        return MatchCreate(
+            player1_id=winner_id, player2_id=loser_id, sets=WIN,
+            tournament_id=tournament_id, created_at=START + timedelta(days=days)
+        )
+
+    result = MatchService(db).create_matches_bulk([
+        item(p[0], p[3], 1),
+        item(p[1], p[2], 1),
+        item(p[0], p[2], 2),
+        # A final só abre com as semifinais do próprio lote
+        item(p[0], p[1], 3),
+        item(p[3], p[0], 4),
+    ])
+    assert result.created == 3
+    assert [(e.index, "no open match" in e.detail) for e in result.errors] == [(2, True), (4, True)]
+    bracket = client.get(f"/api/v1/tournaments/{tournament_id}/bracket").json()
+    assert (bracket["status"], bracket["winner_id"]) == ("Completed", p[0])
+
+def test_create_tournament_validates_players(client, players):
+    response = client.post("/api/v1/tournaments/", json={
+        "name": "Ghost Cup", "player_ids": players[:3] + [999999]
+    })
+    assert response.status_code == 404
+    assert client.get("/api/v1/tournaments/999999/bracket").status_code == 404
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from app.models.player import Player
+from app.schemas.tournament import TournamentSimulationRequest
+from app.services import tournament_service
+from app.services.tournament_service import TournamentService, simulation_cache
+from app.utils.helpers import elo_expected_score
+from app.utils.simulation import BYE, simulate_bracket, simulate_tournament
+
+def test_two_player_bracket_follows_elo_expectation():
+    reached = simulate_bracket(np.array([0, 1]), np.array([1200.0, 1000.0]), 200_000, seed=1)
+
+    assert reached[:, 0].tolist() == [1.0, 1.0]
+    assert reached[0, 1] == pytest.approx(elo_expected_score(1200, 1000), abs=0.01)
+    assert reached[:, -1].sum() == pytest.approx(1.0)
+
+def test_byes_advance_without_playing():
+    reached = simulate_bracket(np.array([0, BYE, 1, 2]), np.array([1000.0, 100.0, 3000.0]), 1000, seed=1)
+
+    assert reached[0, 1] == 1.0
+    assert reached[2, 1] == pytest.approx(1.0, abs=0.01)
+
+def test_equal_ratings_give_equal_chances():
+    reached = simulate_tournament(list(range(8)), [1000.0] * 8, 100_000, seed=3)
+
+    assert reached.shape == (8, 4)
+    assert reached[:, 1].tolist() == pytest.approx([0.5] * 8, abs=0.01)
+    assert reached[:, -1].tolist() == pytest.approx([0.125] * 8, abs=0.01)
+
+def test_simulation_is_cached_per_rating_snapshot(db, make_players, monkeypatch):
+    players = make_players(4, rating=[1000 + 50 * i for i in range(4)])
+    simulation_cache.clear()
+    runs = []
+    monkeypatch.setattr(
+        tournament_service, "simulate_tournament",
+        lambda *args, **kwargs: runs.append(args) or simulate_tournament(*args, **kwargs)
+    )
+    request = TournamentSimulationRequest(player_ids=players, simulations=1000, seed=5)
+    service = TournamentService(db)
+
+    first = service.simulate(request)
+    assert service.simulate(request) == first
+    assert len(runs) == 1
+
+    db.get(Player, players[0]).rating = 1500
+    db.commit()
+    assert service.simulate(request) != first
+    assert len(runs) == 2
@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.services.player_service import PlayerService
+
+@pytest.fixture
+def players(make_players):
+    return make_players(2)
+
+def test_create_match_writes_without_reading_back(client, players, count_queries):
+    a, b = players
+    payload = {"player1_id": a, "player2_id": b, "sets": [
+        {"set_number": 1, "score_p1": 11, "score_p2": 4},
+        {"set_number": 2, "score_p1": 9, "score_p2": 11},
+    ]}
+    with count_queries() as statements:
+        response = client.post("/api/v1/matches/", json=payload)
+
+    assert response.status_code == 200
+    assert response.json()["sets"] == payload["sets"]
+    inserts = [s for s in statements if s.startswith("INSERT INTO matches")]
+    assert len(inserts) == 1 and "RETURNING" in inserts[0]
+    assert sum(s.startswith("INSERT INTO sets") for s in statements) == 1
+    # Nada de refresh: a linha e os sets inseridos nunca são relidos
+    assert not any("matches.player1_id" in s or "FROM sets" in s for s in statements if s.startswith("SELECT"))
+
+    match_id = response.json()["id"]
+    assert client.get(f"/api/v1/matches/{match_id}").json()["sets"] == payload["sets"]
+
+def test_create_match_with_unknown_player_is_rejected(client, players):
+    response = client.post("/api/v1/matches/", json={
+        "player1_id": players[0], "player2_id": 999999,
+        "sets": [{"set_number": 1, "score_p1": 11, "score_p2": 4}]
+    })
+    assert response.status_code == 400
+
+def test_player_uniqueness_comes_from_constraints(client, players, count_queries):
+    data = {"username": "player0", "email": "fresh@example.com", "full_name": "Fresh", "password": "password123"}
+    with count_queries() as statements:
+        response = client.post("/api/v1/players/", json=data)
+    assert (response.status_code, response.json()["detail"]) == (400, "Username already taken")
+    assert not any(s.startswith("SELECT") for s in statements)
+
+    data["username"] = "fresh"
+    data["email"] = "player1@example.com"
+    assert client.post("/api/v1/players/", json=data).json()["detail"] == "Email already registered"
+
+    data["email"] = "fresh@example.com"
+    with count_queries() as statements:
+        response = client.post("/api/v1/players/", json=data)
+    assert response.status_code == 201
+    assert response.json()["bio"] is None and response.json()["is_active"] is True
+    assert not any(s.startswith("SELECT") and "FROM players" in s for s in statements)
+
+    response = client.patch(f"/api/v1/players/{response.json()['id']}", json={"email": "player0@example.com"})
+    assert (response.status_code, response.json()["detail"]) == (400, "Email already registered")
+
+def test_unique_violation_is_named_by_the_index(client, make_players):
+    make_players(1, username="emailfan")
+    data = {"username": "emailfan", "email": "other@example.com", "full_name": "Fan", "password": "password123"}
+    assert client.post("/api/v1/players/", json=data).json()["detail"] == "Username already taken"
+
+    data.update(username="usernamefan", email="emailfan@example.com")
+    assert client.post("/api/v1/players/", json=data).json()["detail"] == "Email already registered"
+
+def test_unique_violation_uses_the_postgres_constraint_name(db):
+    class UniqueViolation(Exception):
+        diag = SimpleNamespace(constraint_name="ix_players_username")
+
+    error = IntegrityError("INSERT INTO players", {}, UniqueViolation(
+        'duplicate key value violates unique constraint "ix_players_username"\n'
+        'DETAIL:  Key (username)=(emailfan) already exists.'
+    ))
+    assert PlayerService(db)._unique_violation(error).detail == "Username already taken"
+
+@pytest.mark.parametrize("change, detail", [
+    ({"player2_id": "self"}, "A player cannot play against themselves"),
+    ({"player2_id": 999999}, "Player 999999 not found"),
+    ({"league_id": 999999}, "League 999999 not found"),
+    ({"sets": [{"set_number": 1, "score_p1": 11, "score_p2": 11}]}, None),
+])
+def test_update_match_is_validated_like_create(client, players, change, detail):
+    a, b = players
+    payload = {"player1_id": a, "player2_id": b, "sets": [
+        {"set_number": n, "score_p1": 11, "score_p2": 4} for n in (1, 2, 3)
+    ]}
+    match_id = client.post("/api/v1/matches/", json=payload).json()["id"]
+
+    update = {**payload, **change}
+    if update["player2_id"] == "self":
+        update["player2_id"] = a
+    response = client.patch(f"/api/v1/matches/{match_id}", json=update)
+
+    assert response.status_code == 400
+    if detail is not None:
+        assert response.json()["detail"] == detail
+    assert client.get(f"/api/v1/matches/{match_id}").json()["player2_id"] == b